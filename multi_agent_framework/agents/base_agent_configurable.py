@@ -7,6 +7,8 @@ Updated base agent that accepts project configuration instead of hardcoding path
 import os
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
 from typing import Optional
 from dotenv import load_dotenv
 import openai
@@ -26,6 +28,9 @@ load_dotenv()  # Load environment variables from .env file
 
 
 class BaseAgent(ABC):
+    # Pending (recipient, message) pairs while inside batched_messages(), else None
+    _outbox = None
+    
     def __init__(self, name: str, project_config: Optional[ProjectConfig] = None, 
                  model_provider: Optional[str] = None, model_name: Optional[str] = None):
         """
@@ -92,10 +97,46 @@ class BaseAgent(ABC):
             "content": content,
             "timestamp": time.time()
         }
-        self.message_bus.send_message(recipient_agent, message)
+        if self._outbox is not None:
+            self._outbox.append((recipient_agent, message))
+        else:
+            self.message_bus.send_message(recipient_agent, message)
+    
+    @contextmanager
+    def batched_messages(self):
+        """
+        Queue messages sent inside the block and deliver them on exit with one
+        inbox write per recipient. Per-recipient message order is preserved.
+        """
+        if self._outbox is not None:
+            # Already batching; the outermost block flushes
+            yield
+            return
+        
+        self._outbox = deque()
+        try:
+            yield
+        finally:
+            outbox, self._outbox = self._outbox, None
+            self._flush_outbox(outbox)
     
-    def receive_messages(self):
-        """Receive messages from message bus."""
+    def _flush_outbox(self, outbox):
+        """Deliver queued messages grouped by recipient."""
+        by_recipient = {}
+        for recipient_agent, message in outbox:
+            by_recipient.setdefault(recipient_agent, []).append(message)
+        for recipient_agent, messages in by_recipient.items():
+            self.message_bus.send_messages(recipient_agent, messages)
+    
+    def receive_messages(self, block: bool = False, timeout: Optional[float] = None):
+        """
+        Receive messages from message bus.
+        
+        With block=True, waits for a message (up to timeout seconds) instead
+        of returning an empty list straight away.
+        """
+        if block:
+            return self.message_bus.receive_messages(self.name, block=True, timeout=timeout)
         return self.message_bus.receive_messages(self.name)
     
     @abstractmethod
@@ -135,20 +176,37 @@ class BaseAgent(ABC):
         else:
             raise ValueError(f"Unsupported model provider: {self.model_provider}")
     
-    def _generate_response(self, prompt, max_tokens=1000):
-        """Generate response from LLM."""
+    def _generate_response(self, prompt, max_tokens=1000, system_prompt: Optional[str] = None):
+        """
+        Generate response from LLM.
+        
+        Args:
+            prompt: Per-request (dynamic) prompt
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional static instructions sent ahead of the prompt.
+                Keeping these identical across calls lets providers serve them
+                from their prompt cache (explicitly marked for Claude).
+        """
         # Test mode - return mock response
         if os.getenv('MAF_TEST_MODE') == 'true':
             return "Mock LLM response for testing"
             
         if self.model_provider == "claude":
             try:
+                request = {}
+                if system_prompt:
+                    request["system"] = [{
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"}
+                    }]
                 response = self.llm.messages.create(
                     model=self.model_name,
                     max_tokens=max_tokens,
                     messages=[
                         {"role": "user", "content": prompt}
-                    ]
+                    ],
+                    **request
                 )
                 return response.content[0].text
             except Exception as e:
@@ -157,9 +215,15 @@ class BaseAgent(ABC):
                 
         elif self.model_provider == "gemini":
             try:
+                request = {}
+                if system_prompt:
+                    request["config"] = genai.types.GenerateContentConfig(
+                        system_instruction=system_prompt
+                    )
                 response = self.llm.models.generate_content(
                     model=self.model_name,
-                    contents=prompt
+                    contents=prompt,
+                    **request
                 )
                 return response.text
             except Exception as e:
@@ -168,11 +232,12 @@ class BaseAgent(ABC):
                 
         elif self.model_provider == "openai":
             try:
+                messages = [{"role": "user", "content": prompt}]
+                if system_prompt:
+                    messages.insert(0, {"role": "system", "content": system_prompt})
                 response = self.llm.chat.completions.create(
                     model=self.model_name,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ],
+                    messages=messages,
                     max_tokens=max_tokens
                 )
                 return response.choices[0].message.content
@@ -182,6 +247,78 @@ class BaseAgent(ABC):
                 
         return None
     
+    def _generate_response_stream(self, prompt, max_tokens=1000, system_prompt: Optional[str] = None):
+        """
+        Generate a response from the LLM, yielding text chunks as they arrive.
+        
+        Takes the same arguments as _generate_response. Errors are reported
+        through _handle_llm_error and then re-raised, so callers never mistake
+        a partially streamed response for a complete one.
+        """
+        # Test mode - return mock response
+        if os.getenv('MAF_TEST_MODE') == 'true':
+            yield "Mock LLM response for testing"
+            return
+            
+        if self.model_provider == "claude":
+            try:
+                request = {}
+                if system_prompt:
+                    request["system"] = [{
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"}
+                    }]
+                with self.llm.messages.stream(
+                    model=self.model_name,
+                    max_tokens=max_tokens,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    **request
+                ) as stream:
+                    for text in stream.text_stream:
+                        if text:
+                            yield text
+            except Exception as e:
+                self._handle_llm_error(e, "Claude")
+                raise
+                
+        elif self.model_provider == "gemini":
+            try:
+                request = {}
+                if system_prompt:
+                    request["config"] = genai.types.GenerateContentConfig(
+                        system_instruction=system_prompt
+                    )
+                for chunk in self.llm.models.generate_content_stream(
+                    model=self.model_name,
+                    contents=prompt,
+                    **request
+                ):
+                    if chunk.text:
+                        yield chunk.text
+            except Exception as e:
+                self._handle_llm_error(e, "Gemini")
+                raise
+                
+        elif self.model_provider == "openai":
+            try:
+                messages = [{"role": "user", "content": prompt}]
+                if system_prompt:
+                    messages.insert(0, {"role": "system", "content": system_prompt})
+                for chunk in self.llm.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    stream=True
+                ):
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except Exception as e:
+                self._handle_llm_error(e, "OpenAI")
+                raise
+    
     def _handle_llm_error(self, error: Exception, provider: str):
         """Handle errors from LLM API calls with user-friendly messages."""
         error_str = str(error).lower()
@@ -349,4 +349,6 @@ class EventDrivenBaseAgent(BaseAgent):
         except KeyboardInterrupt:
             print(f"{self.name}: Interrupted by user")
         finally:
-            self.stop()
+            # stop() may already have been called by whoever ended the loop
+            if self._running:
+                self.stop()
@@ -3,6 +3,7 @@ import sys
 import json
 import time
 import uuid
+from enum import Enum
 
 # Use relative imports
 from ..base_agent_configurable import BaseAgent
@@ -10,6 +11,86 @@ from ...core.project_config import ProjectConfig
 from ...core.project_analyzer import ProjectAnalyzer
 from ...core.file_integrator import FileIntegrator
 
+# Code fence language for each file extension included in the security context
+_LANG_MAP = {'.ts': 'typescript', '.js': 'javascript', '.md': 'markdown', '.txt': 'markdown'}
+
+_MODIFICATION_KEYWORDS = ("modify", "update", "add to existing", "revise", "re-evaluate")
+
+
+def _mentions_modification(task_lower):
+    """Whether a lowercased task description asks to change existing work."""
+    return any(keyword in task_lower for keyword in _MODIFICATION_KEYWORDS)
+
+
+class TaskKind(Enum):
+    """Kind of security task, which selects the prompt and output handling"""
+    RLS = "rls"                    # Supabase Row Level Security policies (SQL migration)
+    MODIFICATION = "modification"  # Revise an existing security report
+    NEW = "new"                    # Fresh security analysis report
+
+
+# Prompt templates, filled with str.format_map(task_description=..., context=...)
+_PROMPT_RLS = """You are a Security Agent specializing in Supabase Row Level Security (RLS) policies.
+Your task is to create RLS policies for the following requirement:
+"{task_description}"
+
+Generate SQL statements to create appropriate RLS policies. Include:
+1. Enable RLS on the table if not already enabled
+2. Policies for different user roles (authenticated users, public access, etc.)
+3. Proper security constraints based on the table structure
+
+For a photos table, typical policies might include:
+- Public read access for photos marked as public
+- Member-only read access for photos marked as member_only
+- Admin/moderator write access
+
+Provide ONLY the SQL statements, no markdown formatting or explanations.
+"""
+
+_PROMPT_MOD = """You are a Security Agent for web applications, specializing in Next.js, Supabase, and Stripe API integrations.
+Your task is to **modify an existing security report file** to identify potential security considerations or vulnerabilities
+related to the following development task or area, and suggest general remediation strategies.
+"{task_description}"
+
+Consider the most recent existing security report file (or relevant code file) provided in the context below. Your output should be the full,
+revised content of that file, integrating the new analysis or changes.
+
+{context}
+
+Focus on security best practices for Next.js API routes, Supabase Row Level Security (RLS),
+secure handling of Supabase client keys and Stripe webhooks, and general web application security (e.g., OWASP Top 10).
+Provide a concise report in Markdown format, listing potential issues and general solutions.
+Do NOT include any text or formatting outside of the Markdown content.
+"""
+
+_PROMPT_NEW = """You are a Security Agent for web applications, specializing in Next.js, Supabase, and Stripe API integrations.
+Your task is to identify potential security considerations or vulnerabilities
+related to the following development task or area, and suggest general remediation strategies.
+"{task_description}"
+
+Focus on security best practices for Next.js API routes, Supabase Row Level Security (RLS),
+secure handling of Supabase client keys and Stripe webhooks, and general web application security (e.g., OWASP Top 10).
+
+{context}
+
+Provide a concise report in Markdown format, listing potential issues and general solutions.
+Do NOT include any text or formatting outside of the Markdown content.
+"""
+
+_PROMPT_BY_KIND = {
+    TaskKind.RLS: _PROMPT_RLS,
+    TaskKind.MODIFICATION: _PROMPT_MOD,
+    TaskKind.NEW: _PROMPT_NEW,
+}
+
+# Lead-in placed before the existing security context for each prompt kind
+_CONTEXT_INTRO_BY_KIND = {
+    TaskKind.RLS: "",
+    TaskKind.MODIFICATION: "Existing Security Context (most recent file first):\n",
+    TaskKind.NEW: "Consider the following existing security context from your project. Adapt your new analysis to build upon or align with these findings:\n",
+}
+
+
 class SecurityAgent(BaseAgent):
     """
     The SecurityAgent is responsible for identifying potential security vulnerabilities
@@ -41,10 +122,24 @@ class SecurityAgent(BaseAgent):
         print(f"{self.name} started. Waiting for tasks...")
         while True:
             messages = self.receive_messages()
-            for msg in messages:
-                self._process_message(msg)
+            with self.batched_messages():
+                for msg in messages:
+                    self._process_message(msg)
             time.sleep(3) # Poll every 3 seconds
 
+    @staticmethod
+    def _classify_task(task_description):
+        """
+        Classify a task description with a single lowercase pass.
+        RLS tasks take precedence over modification keywords.
+        """
+        task_lower = task_description.lower()
+        if 'rls' in task_lower or 'row level security' in task_lower:
+            return TaskKind.RLS
+        if _mentions_modification(task_lower):
+            return TaskKind.MODIFICATION
+        return TaskKind.NEW
+
     def _process_message(self, msg):
         """
         Processes incoming messages from the message bus.
@@ -56,13 +151,13 @@ class SecurityAgent(BaseAgent):
             print(f"SecurityAgent received task {task_id}: {task_description}")
             self.state_manager.update_task_status(task_id, "in_progress")
 
-            is_modification = any(keyword in task_description.lower() for keyword in ["modify", "update", "add to existing", "revise", "re-evaluate"])
+            task_kind = self._classify_task(task_description)
             # Generate security report
-            security_report, target_file = self._analyze_security(task_description)
+            security_report, target_file = self._analyze_security(task_description, task_kind)
 
             if security_report and security_report.strip():
                 # Check if this is an RLS policy task (should create SQL migration)
-                if 'rls' in task_description.lower() or 'row level security' in task_description.lower():
+                if task_kind is TaskKind.RLS:
                     # Create SQL migration file for RLS policies
                     result = self._create_rls_migration(security_report, task_description)
                 else:
@@ -105,8 +200,11 @@ class SecurityAgent(BaseAgent):
             else:
                 original_task_description = task_data['description']
                 
-            is_modification = any(keyword in original_task_description.lower() for keyword in ["modify", "update", "add to existing", "revise", "re-evaluate"])
-            security_report, target_file_suggestion = self._analyze_security(original_task_description, is_modification)
+            task_kind = self._classify_task(original_task_description)
+            # Any modification request, RLS included, saves its retry next to
+            # the file it revises
+            is_modification = _mentions_modification(original_task_description.lower())
+            security_report, target_file_suggestion = self._analyze_security(original_task_description, task_kind)
 
             if security_report and security_report.strip():
                 if is_modification and target_file_suggestion and os.path.exists(target_file_suggestion):
@@ -167,81 +265,37 @@ class SecurityAgent(BaseAgent):
                 with open(file_path, 'r') as f:
                     content = f.read()
                     relative_path = os.path.relpath(file_path, self.project_root)
-                    lang_highlight = "markdown"
-                    if file_path.endswith(('.ts', '.js')):
-                        lang_highlight = "typescript" if file_path.endswith('.ts') else "javascript"
+                    lang_highlight = _LANG_MAP.get(os.path.splitext(file_path)[1], "markdown")
                     file_context = f"--- Existing {os.path.basename(file_path)}: {relative_path} ---\n```{lang_highlight}\n{content}\n```\n"
                     context.append(file_context)
             except Exception as e:
                 print(f"ERROR: SecurityAgent - Could not read existing security reports/code from {file_path} for context: {e}")
         return "\n".join(context), most_recent_file_path
 
-    def _analyze_security(self, task_description):
+    def _analyze_security(self, task_description, task_kind=None):
         """
         Uses the LLM to simulate security analysis and generate a report
         for Next.js, Supabase, and Stripe related security considerations.
+        task_kind is classified from the description when not supplied.
         Returns (security_report, suggested_target_file_path)
         """
-        existing_reports_context, most_recent_report_file = self._get_existing_security_reports_context()
-
-        # Extract f-string expressions to avoid backslash errors
-        security_context_text = f"Existing Security Context (most recent file first):\n{existing_reports_context}\n"
-        security_context_guidance = f"Consider the following existing security context from your project. Adapt your new analysis to build upon or align with these findings:\n{existing_reports_context}\n"
-
-        # Check if this is a modification task
-        is_modification = any(keyword in task_description.lower() for keyword in ["modify", "update", "add to existing", "revise", "re-evaluate"])
-        
-        # Check if this is an RLS policy task
-        is_rls_task = 'rls' in task_description.lower() or 'row level security' in task_description.lower()
-        
-        if is_rls_task:
-            # Generate SQL for RLS policies
-            prompt = f"""You are a Security Agent specializing in Supabase Row Level Security (RLS) policies.
-            Your task is to create RLS policies for the following requirement:
-            "{task_description}"
-
-            Generate SQL statements to create appropriate RLS policies. Include:
-            1. Enable RLS on the table if not already enabled
-            2. Policies for different user roles (authenticated users, public access, etc.)
-            3. Proper security constraints based on the table structure
-
-            For a photos table, typical policies might include:
-            - Public read access for photos marked as public
-            - Member-only read access for photos marked as member_only
-            - Admin/moderator write access
-
-            Provide ONLY the SQL statements, no markdown formatting or explanations.
-            """
-        elif is_modification and most_recent_report_file:
-            prompt = f"""You are a Security Agent for web applications, specializing in Next.js, Supabase, and Stripe API integrations.
-            Your task is to **modify an existing security report file** to identify potential security considerations or vulnerabilities
-            related to the following development task or area, and suggest general remediation strategies.
-            "{task_description}"
-
-            Consider the most recent existing security report file (or relevant code file) provided in the context below. Your output should be the full,
-            revised content of that file, integrating the new analysis or changes.
-            
-            {security_context_text if existing_reports_context else ""}
+        if task_kind is None:
+            task_kind = self._classify_task(task_description)
 
-            Focus on security best practices for Next.js API routes, Supabase Row Level Security (RLS),
-            secure handling of Supabase client keys and Stripe webhooks, and general web application security (e.g., OWASP Top 10).
-            Provide a concise report in Markdown format, listing potential issues and general solutions.
-            Do NOT include any text or formatting outside of the Markdown content.
-            """
-        else:
-            prompt = f"""You are a Security Agent for web applications, specializing in Next.js, Supabase, and Stripe API integrations.
-            Your task is to identify potential security considerations or vulnerabilities
-            related to the following development task or area, and suggest general remediation strategies.
-            "{task_description}"
+        existing_reports_context, most_recent_report_file = self._get_existing_security_reports_context()
 
-            Focus on security best practices for Next.js API routes, Supabase Row Level Security (RLS),
-            secure handling of Supabase client keys and Stripe webhooks, and general web application security (e.g., OWASP Top 10).
-            
-            {security_context_guidance if existing_reports_context else ""}
+        # Modification prompts need a report to revise; otherwise write a new one
+        if task_kind is TaskKind.MODIFICATION and not most_recent_report_file:
+            task_kind = TaskKind.NEW
+        is_rls_task = task_kind is TaskKind.RLS
 
-            Provide a concise report in Markdown format, listing potential issues and general solutions.
-            Do NOT include any text or formatting outside of the Markdown content.
-            """
+        context = ""
+        if existing_reports_context and not is_rls_task:
+            context = f"{_CONTEXT_INTRO_BY_KIND[task_kind]}{existing_reports_context}\n"
+        prompt = _PROMPT_BY_KIND[task_kind].format_map({
+            'task_description': task_description,
+            'context': context,
+        })
         print(f"SecurityAgent: Requesting LLM to analyze security for: {task_description[:50]}...")
         response = self._generate_response(prompt, max_tokens=1500)
 
@@ -1,18 +1,138 @@
 import os
+import re
 import sys
 import json
-import time
 import uuid
+from dataclasses import dataclass
 
 # Use relative imports
 from ..base_agent_configurable import BaseAgent
 from ...core.project_config import ProjectConfig
+from ...core.ui_context_provider import get_ui_context_provider
+from ...core.llm_cache import SemanticCache, get_llm_cache, is_llm_cache_enabled, is_semantic_cache_enabled
+
+# Keywords marking a task as a change to existing UI
+_MODIFICATION_KEYWORDS = ("modify", "update", "refactor", "add to existing", "change", "alter", "improve", "redesign")
+
+# Tasks asking for a flow, wireframe or description produce Markdown, not a
+# component (matched against the lowercased description)
+_MARKDOWN_TASK_RE = re.compile(r"flow|wireframe|description")
+
+
+@dataclass(frozen=True)
+class TaskClass:
+    """How a task is handled, worked out once from its description."""
+    is_modification: bool  # Changes existing UI rather than creating new UI
+    is_markdown: bool  # Asks for a flow, wireframe or description rather than a component
+
+
+# Start of each file block in the existing UI context
+_CONTEXT_BLOCK_RE = re.compile(r"(?m)^(?=--- Existing File: )")
+
+# Static instructions sent as the system prompt. They never vary between tasks,
+# so providers can serve them from their prompt cache; the task and the
+# existing UI context go in the per-request prompt instead.
+_SYSTEM_PROMPT_MODIFY = """You are a UX/UI Design Agent specializing in Next.js (App Router), React, and Tailwind CSS.
+Your task is to **modify an existing UI component, page, or design artifact** to address the requirement given by the user.
+
+Consider the most recent existing file provided in the context. Your output should be the full,
+revised content of that file, integrating the new design, component changes, or flow improvements.
+
+Generate the full, complete code for the component file (e.g., a .tsx file) or a detailed Markdown description of the UI/UX changes.
+If generating code, use functional React components and Tailwind CSS classes.
+Do NOT omit any parts or use placeholders like '...'.
+Do NOT include any explanatory text, comments outside the content, or formatting outside of the main content.
+"""
+
+_SYSTEM_PROMPT_NEW = """You are a UX/UI Design Agent specializing in Next.js (App Router), React, and Tailwind CSS.
+Your task is to generate a new UI component (React/TypeScript with Tailwind CSS), a user flow description,
+or a wireframe concept based on the requirement given by the user.
+
+If generating a component: ensure it's a functional React component, use Tailwind CSS for styling, and import necessary modules.
+If describing a flow/concept: provide a detailed Markdown explanation, including user steps, states, and rationale.
+If existing UI/UX context is provided, adapt your new design/code to fit with its style, component library
+(e.g., Shadcn UI from components/ui), and overall visual language.
+
+Generate the full, complete content. Do NOT omit any parts or use placeholders like '...'.
+Do NOT include any explanatory text, comments outside the content, or formatting outside of the main content.
+"""
+
+# Appended to the new-artifact system prompt when several tasks share one call
+_BATCH_INSTRUCTIONS = """
+You will be given several requirements, each with a task_id. Produce one artifact per requirement.
+Respond with ONLY a JSON array, one object per requirement, of the form:
+[{"task_id": "<task_id>", "content": "<full file content>"}]
+"""
+
+def _strip_code_fences(chunks):
+    """
+    Strips surrounding whitespace and a wrapping Markdown code fence from a
+    response that arrives in chunks, yielding the cleaned text incrementally.
+    Only the head (until the opening fence line is known) and a trailing run of
+    whitespace/backticks are held back, so the body streams straight through.
+    """
+    head = ""
+    fence_line = None  # Opening fence line, until the first non-whitespace after it
+    tail = ""
+    for chunk in chunks:
+        if head is not None:
+            head += chunk
+            stripped = head.lstrip()
+            if not stripped or ("```".startswith(stripped) and len(stripped) < 3):
+                continue
+            if stripped.startswith("```"):
+                first_newline = stripped.find('\n')
+                if first_newline == -1:
+                    continue
+                fence_line, chunk = stripped[:first_newline], stripped[first_newline+1:]
+            else:
+                chunk = stripped
+            head = None
+        if fence_line is not None:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            fence_line = None
+
+        text = tail + chunk
+        body = text.rstrip(" \t\n\r\f\v`")
+        tail = text[len(body):]
+        if body:
+            yield body
+
+    # A fence with nothing but whitespace after its line is not an opening
+    # fence line; the text after the backticks is the content
+    if fence_line is not None:
+        tail = fence_line[len("```"):].strip()
+    elif head is not None:
+        tail = head.strip()
+        if tail.startswith("```"):
+            tail = tail[len("```"):].strip()
+    tail = tail.rstrip()
+    if tail.endswith("```"):
+        tail = tail[:-len("```")].rstrip()
+    if tail:
+        yield tail
+
 
 class UxUiAgent(BaseAgent):
     """
     The UxUiAgent is responsible for generating UI/UX designs, flows, and components
     for Next.js/React applications with Tailwind CSS, considering existing styles and structure.
     """
+    # Seconds a single blocking receive waits before returning empty-handed
+    RECEIVE_TIMEOUT = 30
+    # Maximum number of pending new tasks answered by a single LLM call
+    BATCH_SIZE = 4
+    # Output token budgets by kind of artifact. A modification rewrites the
+    # whole target file, so its budget grows with that file, up to the maximum.
+    MAX_TOKENS_COMPONENT = 1500
+    MAX_TOKENS_MARKDOWN = 800
+    MAX_TOKENS_SMALL_EDIT = 500
+    MAX_TOKENS_LIMIT = 2500
+    # Existing UI context sent with a request is cut down to about this size
+    MAX_CONTEXT_CHARS = 12000
+
     def __init__(self, project_config=None, model_provider="gemini", model_name="gemini-2.0-flash"):  # Fast design suggestions
         super().__init__("ux_ui_agent", project_config, model_provider, model_name)
         
@@ -20,12 +140,20 @@ class UxUiAgent(BaseAgent):
         # Place them in a new sub-directory within the main 'components' folder
         self.output_ui_root = os.path.abspath(os.path.join(self.project_root, "components", "generated_ux_ui"))
         os.makedirs(self.output_ui_root, exist_ok=True)
+        # Output directories already created, so each is made only once
+        self._mkdir_cache = {self.output_ui_root}
         print(f"UxUiAgent initialized. Output path for new UI/UX artifacts: {self.output_ui_root}")
 
-        # Roots for scanning existing UI/UX related code and assets
-        self.app_scan_root = os.path.abspath(os.path.join(self.project_root, "app"))
-        self.root_components_scan_root = os.path.abspath(os.path.join(self.project_root, "components"))
-        self.public_assets_scan_root = os.path.abspath(os.path.join(self.project_root, "public")) # For existing assets like logos, avatars
+        # Existing UI context, shared with every other UX/UI agent working on
+        # this project in the process
+        self._ui_context = get_ui_context_provider(self.project_root)
+
+        # Near-duplicate task cache, scoped to this agent
+        self.semantic_cache = None
+        if is_semantic_cache_enabled():
+            self.semantic_cache = SemanticCache(
+                os.path.join(self.project_root, ".maf", "semcache", f"{self.name}.json")
+            )
 
 
     def run(self):
@@ -34,54 +162,74 @@ class UxUiAgent(BaseAgent):
         """
         print(f"{self.name} started. Waiting for tasks...")
         while True:
-            messages = self.receive_messages()
-            for msg in messages:
-                self._process_message(msg)
-            time.sleep(3) # Poll every 3 seconds
+            # Block until a message arrives; the message bus also checks the
+            # inbox file every second for messages from other processes
+            messages = self.receive_messages(block=True, timeout=self.RECEIVE_TIMEOUT)
+            self._process_messages(messages)
+
+    @staticmethod
+    def _classify_task(task_description):
+        """
+        Classifies a task once, so later steps don't rescan (and re-lowercase)
+        its description.
+        """
+        task_lower = task_description.lower()
+        return TaskClass(
+            is_modification=any(keyword in task_lower for keyword in _MODIFICATION_KEYWORDS),
+            is_markdown=_MARKDOWN_TASK_RE.search(task_lower) is not None
+        )
+
+    def _process_messages(self, messages):
+        """
+        Processes a batch of received messages. New (non-modification) tasks are
+        grouped up to BATCH_SIZE per LLM call; everything else, and any task the
+        batched response did not cover, goes through _process_message.
+        """
+        new_tasks = [(msg, self._classify_task(msg["content"])) for msg in messages if msg.get("type") == "new_task"]
+        task_classes = {msg["task_id"]: task_class for msg, task_class in new_tasks}
+        batchable = [(msg, task_class) for msg, task_class in new_tasks if not task_class.is_modification]
+        batched_ids = set()
+        for start in range(0, len(batchable), self.BATCH_SIZE):
+            batch = batchable[start:start + self.BATCH_SIZE]
+            if len(batch) > 1:
+                batched_ids.update(self._process_new_task_batch(batch))
+
+        for msg in messages:
+            if msg.get("task_id") not in batched_ids:
+                self._process_message(msg, task_classes.get(msg.get("task_id")))
 
-    def _process_message(self, msg):
+    def _process_new_task_batch(self, batch):
+        """
+        Generates content for several new tasks with one LLM call.
+        batch is a list of (message, TaskClass).
+        Returns the ids of tasks that were completed from the batched response.
+        """
+        tasks = [(msg["task_id"], msg["content"], task_class) for msg, task_class in batch]
+        for task_id, task_description, _ in tasks:
+            print(f"UxUiAgent received task {task_id}: {task_description} (batched)")
+            self.state_manager.update_task_status(task_id, "in_progress")
+
+        generated, most_recent_ui_file = self._generate_ui_elements_batch(tasks)
+        completed = set()
+        for task_id, _, task_class in tasks:
+            content = generated.get(task_id)
+            if content and content.strip():
+                self._save_task_output(task_id, content, most_recent_ui_file, task_class)
+                completed.add(task_id)
+        return completed
+
+    def _process_message(self, msg, task_class=None):
         """
         Processes incoming messages from the message bus.
         Handles 'new_task' and 'review_and_retry' message types.
+        task_class optionally carries the new task's classification if already known.
         """
         if msg["type"] == "new_task":
             task_id = msg["task_id"]
             task_description = msg["content"]
             print(f"UxUiAgent received task {task_id}: {task_description}")
             self.state_manager.update_task_status(task_id, "in_progress")
-
-            is_modification = any(keyword in task_description.lower() for keyword in ["modify", "update", "refactor", "add to existing", "change", "alter", "improve", "redesign"])
-            generated_content, target_file_suggestion = self._generate_ui_elements(task_description, is_modification)
-
-            if generated_content and generated_content.strip():
-                output_path = None
-                if is_modification and target_file_suggestion and os.path.exists(target_file_suggestion):
-                    # For modifications, save a _modified version (or apply diff)
-                    file_ext = os.path.splitext(target_file_suggestion)[1]
-                    output_filename = os.path.basename(target_file_suggestion).replace(file_ext, f"_modified_{task_id[:4]}{file_ext}")
-                    output_path = os.path.join(os.path.dirname(target_file_suggestion), output_filename)
-                else:
-                    # For new UI elements/designs, decide on filename and path
-                    # Could be a new component (.tsx), or a markdown description (.md)
-                    # Let's assume .tsx components for now, but prompt can influence
-                    output_filename = f"UXUI_{task_id[:8].replace('-', '')}.tsx"
-                    if "flow" in task_description.lower() or "wireframe" in task_description.lower() or "description" in task_description.lower():
-                        output_filename = f"UXUI_{task_id[:8].replace('-', '')}.md"
-                    
-                    output_path = os.path.join(self.output_ui_root, output_filename)
-
-                try:
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                    with open(output_path, "w") as f:
-                        f.write(generated_content)
-                    print(f"UxUiAgent: Generated content saved to {output_path}")
-                    self.send_message("orchestrator", task_id, f"Successfully developed UI/UX element: {output_path}", "task_completed")
-                except Exception as e:
-                    print(f"UxUiAgent: Error writing file {output_path}: {e}")
-                    self.send_message("orchestrator", task_id, f"Failed to write UI/UX content to file: {e}", "task_failed")
-            else:
-                print("UxUiAgent: Failed to generate UI/UX content (LLM response was None or empty).")
-                self.send_message("orchestrator", task_id, "Failed to generate UI/UX content (LLM response was empty or invalid).", "task_failed")
+            self._handle_task(task_id, task_description, task_class=task_class)
 
         elif msg["type"] == "review_and_retry":
             task_id = msg["task_id"]
@@ -96,154 +244,275 @@ class UxUiAgent(BaseAgent):
                 self.send_message("orchestrator", task_id, "Task could not be found for retry.", "task_failed")
                 return
             
-            original_task_description = task['description']
-            is_modification = any(keyword in original_task_description.lower() for keyword in ["modify", "update", "refactor", "add to existing", "change", "alter", "improve", "redesign"])
-            generated_content, target_file_suggestion = self._generate_ui_elements(original_task_description, is_modification)
-
-            if generated_content and generated_content.strip():
-                output_path = None
-                if is_modification and target_file_suggestion and os.path.exists(target_file_suggestion):
-                    file_ext = os.path.splitext(target_file_suggestion)[1]
-                    output_filename = os.path.basename(target_file_suggestion).replace(file_ext, f"_retry_{task_id[:4]}{file_ext}")
-                    output_path = os.path.join(os.path.dirname(target_file_suggestion), output_filename)
-                else:
-                    output_filename = f"UXUI_{task_id[:8].replace('-', '')}_retry.tsx"
-                    if "flow" in original_task_description.lower() or "wireframe" in original_task_description.lower() or "description" in original_task_description.lower():
-                        output_filename = f"UXUI_{task_id[:8].replace('-', '')}_retry.md"
-                    output_path = os.path.join(self.output_ui_root, output_filename)
-                try:
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                    with open(output_path, "w") as f:
-                        f.write(generated_content)
-                    print(f"UxUiAgent: Retried content saved to {output_path}")
-                    self.send_message("orchestrator", task_id, f"Task retried and completed with new content: {output_path}", "task_completed")
-                except Exception as e:
-                    print(f"UxUiAgent: Error writing retried file {output_path}: {e}")
-                    self.send_message("orchestrator", task_id, f"Failed retry attempt: {e}", "task_failed")
-            else:
-                print("UxUiAgent: Failed to generate UI/UX content on retry (LLM response was None or empty).")
-                self.send_message("orchestrator", task_id, "Failed to generate UI/UX content on retry (LLM response was empty or invalid).", "task_failed")
+            self._handle_task(task_id, task['description'], retry=True)
         else:
             print(f"UxUiAgent: Unknown message type {msg['type']}")
 
-    def _get_existing_ui_context(self, max_files=5):
+    def _handle_task(self, task_id, task_description, retry=False, task_class=None):
         """
-        Reads and returns the content of the most recently modified UI-related files
-        from the 'app' directory, root 'components', and relevant 'public' assets.
-        Returns (context_string, most_recent_file_path).
+        Generates content for a single task and saves it, or reports the failure.
+        Shared by new tasks and retries.
         """
-        context = []
-        found_files = []
-        most_recent_file_path = None
+        task_class = task_class or self._classify_task(task_description)
+        # Retries keep the buffered path so the full response can be checked
+        # before anything is written; the caches also need the full response
+        if not retry and self.semantic_cache is None and not is_llm_cache_enabled():
+            self._stream_task_output(task_id, task_description, task_class)
+            return
 
-        scan_roots = [
-            self.app_scan_root,
-            self.root_components_scan_root,
-            self.public_assets_scan_root # Include public directory for asset context
-        ]
+        generated_content, target_file_suggestion = self._generate_ui_elements(task_description, task_class)
 
-        for scan_root in scan_roots:
-            if not os.path.exists(scan_root):
-                continue
+        if generated_content and generated_content.strip():
+            self._save_task_output(task_id, generated_content, target_file_suggestion, task_class, retry)
+        elif retry:
+            print("UxUiAgent: Failed to generate UI/UX content on retry (LLM response was None or empty).")
+            self.send_message("orchestrator", task_id, "Failed to generate UI/UX content on retry (LLM response was empty or invalid).", "task_failed")
+        else:
+            self._report_generation_failure(task_id)
 
-            for root, _, files in os.walk(scan_root):
-                for file_name in files:
-                    # Target common UI/UX files, components, styles, and relevant assets
-                    if file_name.endswith(('.tsx', '.jsx', '.ts', '.js', '.css', '.md', '.json', '.png', '.jpg', '.svg', '.webp')) and \
-                       (file_name.startswith('page.') or file_name.startswith('layout.') or \
-                        file_name.startswith('loading.') or file_name == 'actions.ts' or \
-                        'component' in file_name.lower() or 'form' in file_name.lower() or \
-                        'globals.css' in file_name or 'tailwind.config.ts' in file_name or \
-                        'hero' in file_name.lower() or 'logo' in file_name.lower() or \
-                        'avatar' in file_name.lower() or 'ui' in root.lower()): # Broaden for typical UI elements, styling, and common assets
-                        full_path = os.path.join(root, file_name)
-                        if os.path.isfile(full_path):
-                            found_files.append(full_path)
-        
-        found_files.sort(key=os.path.getmtime, reverse=True)
+    def _report_generation_failure(self, task_id):
+        print("UxUiAgent: Failed to generate UI/UX content (LLM response was None or empty).")
+        self.send_message("orchestrator", task_id, "Failed to generate UI/UX content (LLM response was empty or invalid).", "task_failed")
+
+    def _task_output_path(self, task_id, task_class, target_file_suggestion, retry=False):
+        """Chooses where the generated content for a task is written."""
+        if task_class.is_modification and target_file_suggestion and os.path.exists(target_file_suggestion):
+            # For modifications, save a _modified (or _retry) version next to the original
+            file_ext = os.path.splitext(target_file_suggestion)[1]
+            marker = "retry" if retry else "modified"
+            output_filename = os.path.basename(target_file_suggestion).replace(file_ext, f"_{marker}_{task_id[:4]}{file_ext}")
+            return os.path.join(os.path.dirname(target_file_suggestion), output_filename)
+
+        # For new UI elements/designs, decide on filename and path
+        # Could be a new component (.tsx), or a markdown description (.md)
+        suffix = "_retry" if retry else ""
+        file_ext = ".md" if task_class.is_markdown else ".tsx"
+        output_filename = f"UXUI_{task_id[:8].replace('-', '')}{suffix}{file_ext}"
+        return os.path.join(self.output_ui_root, output_filename)
+
+    def _save_task_output(self, task_id, generated_content, target_file_suggestion, task_class, retry=False):
+        """Writes generated content for a task and reports the result to the orchestrator."""
+        output_path = self._task_output_path(task_id, task_class, target_file_suggestion, retry)
+        try:
+            self._ensure_output_dir(output_path)
+            tmp_path = output_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(generated_content)
+            # Readers never see a partially written file
+            os.replace(tmp_path, output_path)
+            if retry:
+                print(f"UxUiAgent: Retried content saved to {output_path}")
+                self.send_message("orchestrator", task_id, f"Task retried and completed with new content: {output_path}", "task_completed")
+            else:
+                print(f"UxUiAgent: Generated content saved to {output_path}")
+                self.send_message("orchestrator", task_id, f"Successfully developed UI/UX element: {output_path}", "task_completed")
+        except Exception as e:
+            self._discard_partial_output(output_path)
+            if retry:
+                print(f"UxUiAgent: Error writing retried file {output_path}: {e}")
+                self.send_message("orchestrator", task_id, f"Failed retry attempt: {e}", "task_failed")
+            else:
+                print(f"UxUiAgent: Error writing file {output_path}: {e}")
+                self.send_message("orchestrator", task_id, f"Failed to write UI/UX content to file: {e}", "task_failed")
+
+    def _stream_task_output(self, task_id, task_description, task_class):
+        """
+        Streams the LLM response for a new task straight into its output file,
+        so generation and writing overlap and the response is never held whole.
+        The file only appears under its final name once the stream completes.
+        """
+        existing_ui_context, most_recent_ui_file = self._get_existing_ui_context()
+        system_prompt, prompt = self._build_ui_prompts(
+            task_description, existing_ui_context,
+            task_class.is_modification and bool(most_recent_ui_file)
+        )
+        output_path = self._task_output_path(task_id, task_class, most_recent_ui_file)
+        max_tokens = self._estimate_max_tokens(task_class, most_recent_ui_file)
+
+        print(f"UxUiAgent: Streaming LLM-generated UI/UX content for: {task_description[:50]}...")
+        written = False
+        try:
+            self._ensure_output_dir(output_path)
+            with open(output_path + ".tmp", "w", encoding="utf-8") as f:
+                chunks = self._generate_response_stream(prompt, max_tokens=max_tokens, system_prompt=system_prompt)
+                for chunk in _strip_code_fences(chunks):
+                    f.write(chunk)
+                    written = True
+            if written:
+                os.replace(output_path + ".tmp", output_path)
+        except Exception as e:
+            print(f"UxUiAgent: Error streaming content to {output_path}: {e}")
+            self._discard_partial_output(output_path)
+            self.send_message("orchestrator", task_id, f"Failed to write UI/UX content to file: {e}", "task_failed")
+            return
+
+        if not written:
+            self._discard_partial_output(output_path)
+            self._report_generation_failure(task_id)
+            return
+        print(f"UxUiAgent: Generated content saved to {output_path}")
+        self.send_message("orchestrator", task_id, f"Successfully developed UI/UX element: {output_path}", "task_completed")
+
+    def _ensure_output_dir(self, output_path):
+        """Creates the directory of output_path unless this agent already has."""
+        output_dir = os.path.dirname(output_path)
+        if output_dir not in self._mkdir_cache:
+            os.makedirs(output_dir, exist_ok=True)
+            self._mkdir_cache.add(output_dir)
+
+    def _discard_partial_output(self, output_path):
+        """Removes the temporary file of a failed write."""
+        # The directory may have been removed since it was cached
+        self._mkdir_cache.discard(os.path.dirname(output_path))
+        try:
+            os.remove(output_path + ".tmp")
+        except OSError:
+            pass
 
-        if found_files:
-            most_recent_file_path = found_files[0]
+    def _get_existing_ui_context(self, max_files=5):
+        """
+        Returns (context_string, most_recent_file_path) for the most recently
+        modified UI-related files of the project.
+        """
+        existing_ui_context, most_recent_file_path = self._ui_context.get_context(max_files)
+        return self._truncate_context(existing_ui_context, self.MAX_CONTEXT_CHARS), most_recent_file_path
+
+    @staticmethod
+    def _truncate_context(text, max_chars=MAX_CONTEXT_CHARS):
+        """
+        Fits the UI context into max_chars by dropping the oldest file blocks.
+        The first (most recent) block is always kept whole, since it is the file
+        a modification task revises.
+        """
+        if len(text) <= max_chars:
+            return text
+        blocks = [block for block in _CONTEXT_BLOCK_RE.split(text) if block]
+        kept, size = blocks[:1], len(blocks[0])
+        for block in blocks[1:]:
+            if size + len(block) > max_chars:
+                break
+            kept.append(block)
+            size += len(block)
+        omitted = len(blocks) - len(kept)
+        if omitted:
+            kept.append(f"[{omitted} older file(s) omitted to keep the context short]\n")
+        return "".join(kept)
 
-        for i, file_path in enumerate(found_files[:max_files]):
+    def _estimate_max_tokens(self, task_class, target_file=None):
+        """
+        Sizes the output token budget for a task instead of always reserving the
+        maximum: Markdown flows and descriptions are short, new components larger,
+        and a modification needs room for the whole revised target file.
+        Without a target file a modification is generated as a new artifact.
+        """
+        if task_class.is_modification and target_file:
             try:
-                with open(file_path, 'rb' if file_path.endswith(('.png', '.jpg', '.svg', '.webp')) else 'r') as f:
-                    content = ""
-                    if file_path.endswith(('.png', '.jpg', '.svg', '.webp')):
-                        # For images, just include path and a description, not binary content
-                        content = f"[Binary content for {os.path.basename(file_path)}. Refer to file path for details.]"
-                    else:
-                        content = f.read()
-                    
-                    relative_path = os.path.relpath(file_path, self.project_root)
-                    lang_highlight = "text"
-                    if file_path.endswith(('.tsx', '.ts')): lang_highlight = "typescript"
-                    elif file_path.endswith(('.jsx', '.js')): lang_highlight = "javascript"
-                    elif file_path.endswith('.css'): lang_highlight = "css"
-                    elif file_path.endswith('.json'): lang_highlight = "json"
-                    elif file_path.endswith('.md'): lang_highlight = "markdown"
-
-                    file_context = f"--- Existing File: {relative_path} ---\n```{lang_highlight}\n{content}\n```\n"
-                    context.append(file_context)
-            except Exception as e:
-                print(f"ERROR: UxUiAgent - Could not read existing UI/UX code from {file_path} for context: {e}")
-        return "\n".join(context), most_recent_file_path
-
-    def _generate_ui_elements(self, task_description, is_modification=False):
+                # Roughly 4 characters per token, with headroom for the changes
+                file_tokens = os.path.getsize(target_file) // 4
+            except OSError:
+                file_tokens = 0
+            return min(self.MAX_TOKENS_LIMIT, max(self.MAX_TOKENS_SMALL_EDIT, file_tokens * 3 // 2))
+        if task_class.is_markdown:
+            return self.MAX_TOKENS_MARKDOWN
+        return self.MAX_TOKENS_COMPONENT
+
+    def _build_ui_prompts(self, task_description, existing_ui_context, is_modification):
+        """
+        Split the request into a static system prompt and a dynamic user prompt.
+        The user prompt puts the (larger, slower-changing) UI context before the task.
+        Returns (system_prompt, user_prompt)
+        """
+        system_prompt = _SYSTEM_PROMPT_MODIFY if is_modification else _SYSTEM_PROMPT_NEW
+        parts = []
+        if existing_ui_context:
+            parts.append(f"Existing UI/UX Context (most recent file first):\n{existing_ui_context}\n")
+        parts.append(f'Requirement:\n"{task_description}"\n')
+        return system_prompt, "\n".join(parts)
+
+    def _generate_ui_elements(self, task_description, task_class=None):
         """
         Uses the LLM to generate UI/UX design concepts, user flows, or React components
-        with Tailwind CSS.
+        with Tailwind CSS. task_class is computed from the description if not given.
         Returns (generated_content, suggested_target_file_path)
         """
+        task_class = task_class or self._classify_task(task_description)
         existing_ui_context, most_recent_ui_file = self._get_existing_ui_context()
         
-        # Extract f-string expressions to avoid backslash errors
-        ui_context_text = f"Existing UI/UX Context (most recent file first):\n{existing_ui_context}\n"
-        ui_context_guidance = f"Consider the following existing UI/UX context from your project. Adapt your new design/code to fit with this existing style, component library (e.g., Shadcn UI from components/ui), and overall visual language:\n{existing_ui_context}\n"
-        
-        if is_modification and most_recent_ui_file:
-            prompt = f"""You are a UX/UI Design Agent specializing in Next.js (App Router), React, and Tailwind CSS.
-            Your task is to **modify an existing UI component, page, or design artifact** to address the following requirement:
-            "{task_description}"
-
-            Consider the most recent existing file provided in the context below. Your output should be the full,
-            revised content of that file, integrating the new design, component changes, or flow improvements.
-            
-            {ui_context_text if existing_ui_context else ""}
+        system_prompt, prompt = self._build_ui_prompts(
+            task_description, existing_ui_context,
+            task_class.is_modification and bool(most_recent_ui_file)
+        )
+        # Only new artifacts are reused for similar tasks; modifications depend
+        # on the current content of the file being revised
+        semantic_cache = self.semantic_cache if not task_class.is_modification else None
+        response = semantic_cache.get(task_description) if semantic_cache else None
+        if response is not None:
+            print(f"UxUiAgent: Reusing response of a similar earlier task for: {task_description[:50]}...")
+            return response, most_recent_ui_file
 
-            Generate the full, complete code for the component file (e.g., a .tsx file) or a detailed Markdown description of the UI/UX changes.
-            If generating code, use functional React components and Tailwind CSS classes.
-            Do NOT omit any parts or use placeholders like '...'.
-            Do NOT include any explanatory text, comments outside the content, or formatting outside of the main content.
-            """
-        else:
-            prompt = f"""You are a UX/UI Design Agent specializing in Next.js (App Router), React, and Tailwind CSS.
-            Your task is to generate a new UI component (React/TypeScript with Tailwind CSS), a user flow description,
-            or a wireframe concept based on the following requirement:
-            "{task_description}"
-
-            If generating a component: ensure it's a functional React component, use Tailwind CSS for styling, and import necessary modules.
-            If describing a flow/concept: provide a detailed Markdown explanation, including user steps, states, and rationale.
-
-            {ui_context_guidance if existing_ui_context else ""}
+        llm_cache = get_llm_cache() if is_llm_cache_enabled() else None
+        if llm_cache:
+            cache_key = llm_cache.make_key(self.model_provider, self.model_name, system_prompt, prompt)
+            response = llm_cache.get(cache_key)
+            if response is not None:
+                print(f"UxUiAgent: Using cached LLM response for: {task_description[:50]}...")
 
-            Generate the full, complete content. Do NOT omit any parts or use placeholders like '...'.
-            Do NOT include any explanatory text, comments outside the content, or formatting outside of the main content.
-            """
-        print(f"UxUiAgent: Requesting LLM to generate UI/UX content for: {task_description[:50]}...")
-        response = self._generate_response(prompt, max_tokens=2500) # Increased max_tokens for potentially larger UI descriptions/components
+        if response is None:
+            print(f"UxUiAgent: Requesting LLM to generate UI/UX content for: {task_description[:50]}...")
+            max_tokens = self._estimate_max_tokens(task_class, most_recent_ui_file)
+            response = self._generate_response(prompt, max_tokens=max_tokens, system_prompt=system_prompt)
+            if llm_cache and response and isinstance(response, str):
+                llm_cache.set(cache_key, response)
         
         if response and isinstance(response, str):
-            cleaned_response = response.strip()
             # Generic stripping for various code blocks and markdown
-            if cleaned_response.startswith("```"):
-                first_newline = cleaned_response.find('\n')
-                cleaned_response = cleaned_response[first_newline+1:].strip() if first_newline != -1 else cleaned_response[len("```"):].strip()
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-len("```")].strip()
+            cleaned_response = "".join(_strip_code_fences([response]))
+            if semantic_cache and cleaned_response:
+                semantic_cache.set(task_description, cleaned_response)
             return cleaned_response, most_recent_ui_file
         return response, None
 
+    def _generate_ui_elements_batch(self, tasks):
+        """
+        Uses a single LLM call to generate new UI/UX content for several tasks.
+        tasks is a list of (task_id, task_description, TaskClass).
+        Returns ({task_id: generated_content}, most_recent_ui_file); tasks missing
+        from the response, or all of them if it cannot be parsed, are left out.
+        """
+        existing_ui_context, most_recent_ui_file = self._get_existing_ui_context()
+        system_prompt = _SYSTEM_PROMPT_NEW + _BATCH_INSTRUCTIONS
+        parts = []
+        if existing_ui_context:
+            parts.append(f"Existing UI/UX Context (most recent file first):\n{existing_ui_context}\n")
+        parts.append("Requirements:")
+        parts.append(json.dumps([{"task_id": task_id, "requirement": description} for task_id, description, _ in tasks], indent=2))
+        prompt = "\n".join(parts)
+
+        print(f"UxUiAgent: Requesting LLM to generate UI/UX content for {len(tasks)} batched tasks...")
+        max_tokens = sum(self._estimate_max_tokens(task_class) for _, _, task_class in tasks)
+        response = self._generate_response(prompt, max_tokens=max_tokens, system_prompt=system_prompt)
+        if not response or not isinstance(response, str):
+            return {}, most_recent_ui_file
+
+        cleaned_response = response.strip()
+        if cleaned_response.startswith("```"):
+            first_newline = cleaned_response.find('\n')
+            cleaned_response = cleaned_response[first_newline+1:] if first_newline != -1 else ""
+        if cleaned_response.endswith("```"):
+            cleaned_response = cleaned_response[:-len("```")]
+        try:
+            items = json.loads(cleaned_response)
+        except json.JSONDecodeError as e:
+            print(f"UxUiAgent: Could not parse batched response, falling back to single tasks: {e}")
+            return {}, most_recent_ui_file
+
+        requested_ids = {task_id for task_id, _, _ in tasks}
+        generated = {}
+        for item in items if isinstance(items, list) else []:
+            if isinstance(item, dict) and item.get("task_id") in requested_ids and isinstance(item.get("content"), str):
+                generated[item["task_id"]] = item["content"].strip()
+        return generated, most_recent_ui_file
+
 if __name__ == "__main__":
     ux_ui_agent = UxUiAgent()  # Use default model from __init__
     ux_ui_agent.run()
@@ -4,7 +4,19 @@ Simple script to check migration status
 """
 
 import os
-import glob
+
+
+def _python_file_names(directory):
+    """List the names of regular .py files in a directory with a single scandir pass"""
+    names = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            name = entry.name
+            if name.endswith('.py') and not name.startswith('.'):
+                names.append(name)
+    return names
 
 def check_migration_status():
     """Check which agents have event-driven versions"""
@@ -18,8 +30,7 @@ def check_migration_status():
     event_driven_agents = []
     
     # Check main agents directory
-    for file in glob.glob(os.path.join(agents_dir, '*.py')):
-        filename = os.path.basename(file)
+    for filename in _python_file_names(agents_dir):
         if filename.startswith('event_driven_'):
             agent_name = filename.replace('event_driven_', '').replace('.py', '')
             event_driven_agents.append(agent_name)
@@ -28,19 +39,24 @@ def check_migration_status():
             polling_agents.append(agent_name)
     
     # Check specialized directory
-    for file in glob.glob(os.path.join(specialized_dir, '*_agent.py')):
-        filename = os.path.basename(file)
+    polling_set = set(polling_agents)
+    for filename in _python_file_names(specialized_dir):
+        if not filename.endswith('_agent.py'):
+            continue
         agent_name = filename.replace('.py', '')
-        if agent_name not in polling_agents:
+        if agent_name not in polling_set:
+            polling_set.add(agent_name)
             polling_agents.append(agent_name)
     
+    event_driven_set = set(event_driven_agents)
+    
     print("\n=== Migration Status ===")
     print("\nAgent Implementation Status:")
     print("-" * 50)
     
     # Check each polling agent
     for agent in polling_agents:
-        has_event_driven = agent in event_driven_agents
+        has_event_driven = agent in event_driven_set
         status = "✓ Migrated" if has_event_driven else "⚠ Pending"
         print(f"{agent:25} Event-Driven: {'✓' if has_event_driven else '✗'}  Status: {status}")
     
@@ -55,12 +71,12 @@ def check_migration_status():
     print("-" * 50)
     
     # Summary
-    migrated = sum(1 for agent in polling_agents if agent in event_driven_agents)
+    migrated = sum(1 for agent in polling_agents if agent in event_driven_set)
     total = len(polling_agents)
     print(f"\nProgress: {migrated}/{total} agents migrated ({migrated/total*100:.0f}%)")
     
     # List pending agents
-    pending = [agent for agent in polling_agents if agent not in event_driven_agents]
+    pending = [agent for agent in polling_agents if agent not in event_driven_set]
     if pending:
         print("\nPending migrations:")
         for agent in pending:
@@ -0,0 +1,6 @@
+"""
+Subcommands of the 'maf' CLI, one module per command.
+
+multi_agent_framework.cli imports each module only when its command is run,
+so this package must stay free of imports.
+"""
@@ -0,0 +1,75 @@
+"""
+The 'maf' click group.
+
+Kept apart from cli.py so 'maf --version' can be answered without importing
+click; cli.py re-exports these names on first access.
+"""
+
+import click
+import importlib
+
+from multi_agent_framework.cli_cmds import _help
+
+
+# Subcommands: name -> ("module:attribute", short help shown by 'maf --help')
+_LAZY_COMMANDS = {
+    'init': ('multi_agent_framework.cli_cmds.init:init', _help.INIT),
+    'launch': ('multi_agent_framework.cli_cmds.launch:launch', _help.LAUNCH),
+    'trigger': ('multi_agent_framework.cli_cmds.trigger:trigger', _help.TRIGGER),
+    'status': ('multi_agent_framework.cli_cmds.status:status', _help.STATUS),
+    'reset': ('multi_agent_framework.cli_cmds.reset:reset', _help.RESET),
+    'modes': ('multi_agent_framework.cli_cmds.modes:modes', _help.MODES),
+    'config': ('multi_agent_framework.cli_cmds.config:config_cmd', _help.CONFIG),
+}
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported on first use.
+    The group's own help is rendered from the short help strings in the map.
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self._lazy))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self._lazy:
+            return super().get_command(ctx, cmd_name)
+        module_name, attr = self._lazy[cmd_name][0].rsplit(':', 1)
+        return getattr(importlib.import_module(module_name), attr)
+
+    def _short_helps(self, ctx):
+        """(name, short help) for each visible subcommand, without importing lazy ones."""
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self._lazy:
+                yield cmd_name, self._lazy[cmd_name][1]
+                continue
+            cmd = super().get_command(ctx, cmd_name)
+            if cmd is not None and not cmd.hidden:
+                yield cmd_name, cmd.get_short_help_str()
+
+    def format_commands(self, ctx, formatter):
+        rows = list(self._short_helps(ctx))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx, incomplete):
+        # click.Group's version resolves every subcommand for its help text,
+        # which would import them all on each tab press
+        from click.shell_completion import CompletionItem
+        results = [CompletionItem(name, help=short_help)
+                   for name, short_help in self._short_helps(ctx)
+                   if name.startswith(incomplete)]
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+
+@click.group(cls=LazyGroup, lazy_commands=_LAZY_COMMANDS, help=_help.MAF)
+@click.version_option(version=_help.VERSION, prog_name=_help.PROG_NAME)
+def cli():
+    pass
@@ -0,0 +1,39 @@
+"""
+Help text for the 'maf' CLI.
+
+Kept as plain string constants rather than command docstrings, so help still
+renders when Python runs with -OO (which strips docstrings) and the text shared
+by several commands is defined once.
+"""
+
+MAF = """Multi-Agent Framework - Autonomous software development with AI agents.
+
+Quick start:
+  maf init          Initialize framework in current directory
+  maf launch        Start agents (uses polling mode by default)
+  maf trigger       Request a new feature to be built
+  maf status        Check agent health and progress
+
+Learn more:
+  maf modes         Understand polling vs event-driven modes
+  maf --help        Show all available commands
+"""
+
+# maf --version
+PROG_NAME = "Multi-Agent Framework"
+VERSION = "0.1.0"
+
+# Commands
+INIT = "Initialize the framework for a project."
+LAUNCH = "Launch the multi-agent framework."
+TRIGGER = "Trigger development of a new feature."
+STATUS = "Check the status of the multi-agent framework."
+RESET = "Reset the framework state for a project."
+MODES = "Explain the different agent communication modes."
+CONFIG = "Manage framework configuration."
+
+# Options
+PROJECT_OPTION = "Project path (default: current directory)"
+PROJECT_TYPE_OPTION = "Project type (nextjs, react, django, etc.)"
+MODE_OPTION = "Agent mode (default from config, polling=stable, event=experimental)"
+DETACH_OPTION = "Run the agents in the background and return immediately"
@@ -0,0 +1,65 @@
+"""
+Helpers shared by the CLI subcommands.
+"""
+
+import functools
+import os
+from pathlib import Path
+from typing import Optional
+
+
+# Written next to the state file by 'maf launch --detach'
+LAUNCH_PID_FILENAME = 'maf.pid'
+
+# Agents recommended for every project, then per project type
+_BASE_AGENTS = ('orchestrator',)
+_TYPE_SPECIFIC_AGENTS = {
+    'nextjs': ('frontend_agent', 'backend_agent', 'ux_ui_agent'),
+    'react': ('frontend_agent', 'ux_ui_agent'),
+    'django': ('backend_agent', 'db_agent', 'frontend_agent'),
+    'flask': ('backend_agent', 'db_agent'),
+    'python': ('backend_agent',),
+    'auto': ('frontend_agent', 'backend_agent'),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_project_config(path: str, config_mtime_ns):
+    from multi_agent_framework.core.project_config import ProjectConfig
+    return ProjectConfig(path)
+
+
+def get_project_config(project_path: str):
+    """
+    Get the ProjectConfig for a project, reusing the one already loaded in this
+    process unless its config file has changed since.
+    """
+    path = os.path.abspath(project_path)
+    # ProjectConfig.CONFIG_FILENAME, named here so the check stays import-free
+    try:
+        config_mtime_ns = os.stat(os.path.join(path, '.maf-config.json')).st_mtime_ns
+    except OSError:
+        config_mtime_ns = None
+    return _load_project_config(path, config_mtime_ns)
+
+
+def get_launch_pid_file(project_config) -> str:
+    """Path of the PID file for a project's detached 'maf launch'."""
+    return os.path.join(os.path.dirname(project_config.get_state_file_path()), LAUNCH_PID_FILENAME)
+
+
+def get_detached_launch_pid(project_config) -> Optional[int]:
+    """PID of the project's detached 'maf launch', if it is still running."""
+    try:
+        pid = int(Path(get_launch_pid_file(project_config)).read_text(encoding='ascii').strip())
+        # Signal 0 only checks the process exists (on Windows it would kill it)
+        if os.name != 'nt':
+            os.kill(pid, 0)
+    except (OSError, ValueError):
+        return None
+    return pid
+
+
+def get_recommended_agents(project_type: str) -> list:
+    """Get recommended agents based on project type."""
+    return list(_BASE_AGENTS + _TYPE_SPECIFIC_AGENTS.get(project_type, _TYPE_SPECIFIC_AGENTS['auto']))
@@ -0,0 +1,62 @@
+"""
+'maf config' - Show, save or load the project configuration.
+"""
+
+import click
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+from multi_agent_framework.cli_cmds import _help
+from multi_agent_framework.cli_cmds.common import get_project_config
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a configuration as indented UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse a JSON configuration, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@click.command('config', help=_help.CONFIG)
+@click.option('--save', '-s', help='Save configuration to file')
+@click.option('--load', '-l', help='Load configuration from file')
+def config_cmd(save: Optional[str], load: Optional[str]):
+    if save:
+        # Export current configuration
+        project_config = get_project_config(os.getcwd())
+        Path(save).write_bytes(_dumps(project_config.config))
+        click.echo(f"✅ Configuration saved to {save}")
+        
+    elif load:
+        # Import configuration
+        if not os.path.exists(load):
+            click.echo(f"❌ Configuration file not found: {load}")
+            sys.exit(1)
+        
+        new_config = _loads(Path(load).read_bytes())
+        
+        project_config = get_project_config(os.getcwd())
+        project_config.update_config(new_config)
+        click.echo(f"✅ Configuration loaded from {load}")
+        
+    else:
+        # Show current configuration
+        project_config = get_project_config(os.getcwd())
+        click.echo("Current Configuration:")
+        click.echo(_dumps(project_config.config).decode('utf-8'))
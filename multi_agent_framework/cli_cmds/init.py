@@ -0,0 +1,80 @@
+"""
+'maf init' - Initialize the framework for a project.
+"""
+
+import click
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+from multi_agent_framework.cli_cmds import _help
+
+
+# Template written to .env.example, kept as ready-to-write bytes
+_ENV_EXAMPLE = b"""# Multi-Agent Framework Environment Variables
+
+# LLM API Keys (at least one required)
+GEMINI_API_KEY=your_gemini_api_key_here
+ANTHROPIC_API_KEY=your_anthropic_api_key_here
+OPENAI_API_KEY=your_openai_api_key_here
+
+# Optional: Override event bus type
+# EVENT_BUS_TYPE=kafka
+# KAFKA_BOOTSTRAP_SERVERS=localhost:9092
+"""
+
+
+@click.command(help=_help.INIT)
+@click.argument('project_path', required=False)
+@click.option('--name', '-n', help='Project name')
+@click.option('--type', '-t', help=_help.PROJECT_TYPE_OPTION)
+def init(project_path: Optional[str], name: Optional[str], type: Optional[str]):
+    from multi_agent_framework.core.project_config import ProjectConfig
+
+    # Use current directory if no path provided
+    project_path = project_path or os.getcwd()
+    project_path = os.path.abspath(project_path)
+    
+    if not os.path.exists(project_path):
+        click.echo(f"Error: Project path does not exist: {project_path}")
+        sys.exit(1)
+    
+    # Initialize project configuration
+    config = ProjectConfig.initialize_project(project_path)
+    
+    # Update with provided options
+    updates = {}
+    if name:
+        updates['project_name'] = name
+    if type:
+        updates['project_type'] = type
+    
+    if updates:
+        config.update_config(updates)
+    
+    # Create .env.example if it doesn't exist
+    env_example_path = os.path.join(project_path, '.env.example')
+    if not os.path.exists(env_example_path):
+        Path(env_example_path).write_bytes(_ENV_EXAMPLE)
+        click.echo(f"Created .env.example - copy to .env and add your API keys")
+    
+    # One write for the whole summary instead of a flush per line
+    click.echo("\n".join([
+        "\n✅ Framework initialized successfully!",
+        "",
+        "📋 Configuration:",
+        f"   Project: {config.config['project_name']}",
+        f"   Type: {config.config['project_type']}",
+        f"   Default mode: {config.get_default_mode()} (recommended)",
+        "",
+        "🚀 Next steps:",
+        "  1. Copy .env.example to .env and add your API keys",
+        "  2. Run 'maf launch' to start the agents",
+        "  3. Run 'maf trigger <feature>' to start development",
+        "",
+        "💡 Tips:",
+        "  - Use 'maf launch --mode event' for experimental event-driven mode",
+        "  - Use 'maf config' to view/modify configuration",
+        "  - Run 'maf status' to check agent health",
+    ]))
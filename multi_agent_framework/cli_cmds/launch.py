@@ -0,0 +1,232 @@
+"""
+'maf launch' - Launch the agents.
+"""
+
+import click
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from multi_agent_framework.cli_cmds import _help
+from multi_agent_framework.cli_cmds.common import (
+    get_launch_pid_file, get_project_config, get_recommended_agents
+)
+
+
+# Agent run modes accepted by --mode
+_MODE_CHOICE = click.Choice(('polling', 'event'))
+
+# Set for the background 'maf launch' started by --detach, so it runs the
+# agents itself instead of detaching again
+_LAUNCH_CHILD_ENV = 'MAF_LAUNCH_CHILD'
+
+
+def _wait_for_shutdown():
+    """
+    Block until Ctrl+C (or SIGTERM, for a detached launch). The handlers only
+    set an event, so unlike a sleep loop the main thread never wakes up in
+    the meantime.
+    """
+    stop = threading.Event()
+    previous_handlers = {
+        signum: signal.signal(signum, lambda signum, frame: stop.set())
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    # On Windows a wait without a timeout can't be interrupted by Ctrl+C, so
+    # wake up once a second there to let the handler run
+    timeout = 1 if os.name == 'nt' else None
+    try:
+        while not stop.wait(timeout):
+            pass
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+
+def _launch_detached(project_config, agent_list: list, mode: str):
+    """
+    Start 'maf launch' for the given agents in a new session with its output
+    in the project's log dir, and record its PID next to the state file.
+    """
+    import subprocess
+    import multi_agent_framework
+
+    log_dir = project_config.get_log_dir()
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, 'launch.log')
+
+    command = [sys.executable, '-m', 'multi_agent_framework.cli', 'launch',
+               '--project', project_config.get_project_root(), '--mode', mode]
+    for agent_name in agent_list:
+        command += ['--agents', agent_name]
+
+    env = dict(os.environ)
+    env[_LAUNCH_CHILD_ENV] = '1'
+    # Keep the package importable when running from a source checkout
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(multi_agent_framework.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_parent, env.get('PYTHONPATH')]))
+
+    with open(log_path, 'ab') as log:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            env=env,
+            start_new_session=True
+        )
+
+    pid_file = get_launch_pid_file(project_config)
+    os.makedirs(os.path.dirname(pid_file), exist_ok=True)
+    Path(pid_file).write_text(str(process.pid), encoding='ascii')
+
+    click.echo("\n".join([
+        f"\n✅ Agents started in the background (PID {process.pid})",
+        f"   Logs: {log_path}",
+        f"   Stop with: kill {process.pid}",
+    ]))
+
+
+@click.command(help=_help.LAUNCH)
+@click.option('--project', '-p', help=_help.PROJECT_OPTION)
+@click.option('--agents', '-a', multiple=True, help='Specific agents to launch')
+@click.option('--mode', '-m', type=_MODE_CHOICE, help=_help.MODE_OPTION)
+@click.option('--detach', is_flag=True, help=_help.DETACH_OPTION)
+def launch(project: Optional[str], agents: tuple, mode: Optional[str], detach: bool):
+    from multi_agent_framework.core.error_handler import error_handler, ErrorCategory, ErrorLevel
+
+    project_path = project or os.getcwd()
+    
+    # Check for .env file first, so a project that isn't set up fails fast
+    # without loading its configuration or the agents
+    env_path = os.path.join(project_path, '.env')
+    if not os.path.exists(env_path):
+        error_handler.handle_error(
+            FileNotFoundError(".env file not found"),
+            ErrorCategory.FILE_SYSTEM,
+            {'file_path': env_path},
+            ErrorLevel.ERROR
+        )
+        click.echo("   Copy .env.example to .env and add your API keys")
+        sys.exit(1)
+    
+    from multi_agent_framework.core.message_bus_configurable import MessageBus
+    from multi_agent_framework.core.agent_factory import create_agent
+    from multi_agent_framework import config
+
+    project_config = get_project_config(project_path)
+    
+    # Use mode from config if not specified
+    if mode is None:
+        mode = project_config.get_default_mode()
+    
+    click.echo("\n".join([
+        "🚀 Launching Multi-Agent Framework",
+        f"   Project: {project_config.config['project_name']}",
+        f"   Path: {project_path}",
+        f"   Mode: {mode} {'(recommended for stability)' if mode == 'polling' else '(experimental - may have issues)'}",
+    ]))
+    
+    # Determine which agents to launch
+    if agents:
+        agent_list = list(agents)
+    else:
+        agent_list = project_config.get_enabled_agents()
+    
+    # A detached launch gets the agent list its parent already settled with
+    # the user; it has no terminal to ask again
+    launch_child = bool(os.environ.get(_LAUNCH_CHILD_ENV))
+    if not launch_child:
+        # Check for critical agents
+        critical_agents = ['orchestrator']
+        selected = set(agent_list)
+        missing_critical = [agent for agent in critical_agents if agent not in selected]
+    
+        if missing_critical:
+            click.echo(f"\n⚠️  Warning: Critical agents missing: {', '.join(missing_critical)}\n"
+                       "   The orchestrator agent is required to coordinate other agents.")
+            if click.confirm("Add orchestrator to the agent list?"):
+                agent_list.insert(0, 'orchestrator')
+                selected.add('orchestrator')
+    
+        # Recommend agents based on project type
+        project_type = project_config.config.get('project_type', 'auto')
+        recommended_agents = get_recommended_agents(project_type)
+        missing_recommended = [agent for agent in recommended_agents if agent not in selected]
+    
+        if missing_recommended:
+            click.echo(f"\n💡 Tip: For {project_type} projects, consider adding: {', '.join(missing_recommended)}")
+    
+    if detach and not launch_child:
+        _launch_detached(project_config, agent_list, mode)
+        return
+    
+    click.echo(f"\nStarting agents: {', '.join(agent_list)}")
+    
+    # Set mode in config
+    config.EVENT_DRIVEN_MODE = (mode == 'event')
+    
+    # Initialize message bus
+    message_bus = MessageBus(project_config.get_message_queue_dir())
+    message_bus.initialize_agent_inboxes(agent_list)
+    
+    # Launch agents. Every agent runs in a thread of this process: polling
+    # agents share the project state manager's in-memory state and
+    # event-driven agents the in-memory event bus, neither of which is
+    # visible across processes. Their constructors mostly wait on LLM client
+    # and state setup, so they are built side by side first.
+    threaded_agents = []
+    builds = {}
+    if agent_list:
+        with ThreadPoolExecutor(max_workers=len(agent_list)) as executor:
+            builds = {
+                agent_name: executor.submit(
+                    create_agent,
+                    agent_name.replace('_agent', ''),
+                    mode='event_driven' if mode == 'event' else 'polling',
+                    project_config=project_config
+                )
+                for agent_name in agent_list
+            }
+    for agent_name in agent_list:
+        try:
+            agent = builds[agent_name].result()
+            
+            # Start agent in thread
+            thread = threading.Thread(target=agent.run, daemon=True)
+            thread.start()
+            threaded_agents.append((agent, thread))
+            
+            click.echo(f"✓ Started {agent_name}")
+            
+        except Exception as e:
+            error_handler.handle_error(
+                e,
+                ErrorCategory.AGENT_COMMUNICATION,
+                {'agent_name': agent_name, 'details': 'during startup'},
+                ErrorLevel.ERROR
+            )
+    
+    if threaded_agents:
+        click.echo("\n✅ Agents are running. Press Ctrl+C to stop...")
+        _wait_for_shutdown()
+        
+        click.echo("\n👋 Shutting down agents...")
+        # Event-driven agents stop cooperatively; polling agent threads are
+        # daemons and end with the process
+        if mode == 'event':
+            for agent, thread in threaded_agents:
+                agent.stop()
+                thread.join(timeout=5)
+        
+        if launch_child:
+            try:
+                os.remove(get_launch_pid_file(project_config))
+            except OSError:
+                pass
+    else:
+        click.echo("\n❌ No agents were started")
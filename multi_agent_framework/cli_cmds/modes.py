@@ -0,0 +1,41 @@
+"""
+'maf modes' - Explain the agent communication modes.
+"""
+
+import click
+from typing import Optional
+
+from multi_agent_framework.cli_cmds import _help
+
+
+# Printed in one echo, since each click.echo flushes
+_MODES_TEXT = """\
+📡 Multi-Agent Framework Communication Modes
+
+🔄 Polling Mode (Default - Recommended):
+   - Agents check for messages at regular intervals
+   - More stable and predictable behavior
+   - Lower resource usage
+   - Slight delay between message send and processing
+   - Best for: Most projects, especially when starting out
+
+⚡ Event-Driven Mode (Experimental):
+   - Agents react immediately to new messages
+   - Real-time communication between agents
+   - Higher resource usage
+   - May have stability issues with message processing
+   - Best for: Projects requiring real-time coordination
+
+🚀 Usage:
+   maf launch                    # Uses default (polling)
+   maf launch --mode polling     # Explicitly use polling
+   maf launch --mode event       # Use event-driven mode
+
+💡 To change the default mode:
+   Edit .maf-config.json and set framework_config.default_mode"""
+
+
+@click.command(help=_help.MODES)
+@click.argument('action', required=False)
+def modes(action: Optional[str]):
+    click.echo(_MODES_TEXT)
@@ -0,0 +1,86 @@
+"""
+'maf reset' - Clear queues, state and logs.
+"""
+
+import click
+import os
+import shutil
+import tempfile
+import threading
+from typing import List, Optional
+
+from multi_agent_framework.cli_cmds import _help
+from multi_agent_framework.cli_cmds.common import get_project_config
+
+
+def _remove_trees(paths: List[str]):
+    """Delete each directory tree, ignoring ones already gone."""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _clear_directory(path: str) -> Optional[threading.Thread]:
+    """
+    Empty a directory at once: the old directory is renamed to a hidden
+    sibling and replaced with an empty one straight away, and its contents
+    are removed by the returned thread, which the caller joins before exiting.
+    Trash left by an interrupted reset is removed along with it.
+    Falls back to deleting in place when the rename fails.
+    """
+    parent, name = os.path.split(os.path.normpath(os.path.abspath(path)))
+    trash_prefix = f".{name}.trash."
+    trash_dir = tempfile.mkdtemp(prefix=trash_prefix, dir=parent)
+    try:
+        os.rename(path, os.path.join(trash_dir, name))
+    except OSError:
+        os.rmdir(trash_dir)
+        shutil.rmtree(path)
+        os.makedirs(path)
+        return None
+    os.makedirs(path)
+    
+    trash_dirs = [entry.path for entry in os.scandir(parent)
+                  if entry.name.startswith(trash_prefix) and entry.is_dir()]
+    cleanup = threading.Thread(
+        target=_remove_trees,
+        args=(trash_dirs,),
+        name="maf-reset-cleanup"
+    )
+    cleanup.start()
+    return cleanup
+
+
+@click.command(help=_help.RESET)
+@click.option('--project', '-p', help=_help.PROJECT_OPTION)
+@click.confirmation_option(prompt='Are you sure you want to reset the framework state?')
+def reset(project: Optional[str]):
+    from multi_agent_framework.core.message_bus_configurable import MessageBus
+
+    project_path = project or os.getcwd()
+    project_config = get_project_config(project_path)
+    
+    click.echo("🔄 Resetting framework state...")
+    
+    # Clear message queues
+    message_bus = MessageBus(project_config.get_message_queue_dir())
+    message_bus.clear_all_messages()
+    click.echo("✓ Cleared message queues")
+    
+    # Reset state file
+    state_file = project_config.get_state_file_path()
+    if os.path.exists(state_file):
+        os.remove(state_file)
+        click.echo("✓ Removed state file")
+    
+    # Clear logs
+    log_dir = project_config.get_log_dir()
+    cleanup = None
+    if os.path.exists(log_dir):
+        cleanup = _clear_directory(log_dir)
+        click.echo("✓ Cleared logs")
+    
+    # Finish deleting the old logs, so no trash outlives the command
+    if cleanup is not None:
+        cleanup.join()
+    
+    click.echo("\n✅ Framework state reset successfully")
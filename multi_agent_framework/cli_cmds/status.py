@@ -0,0 +1,86 @@
+"""
+'maf status' - Show queue, progress and configuration status.
+"""
+
+import click
+import os
+from typing import Optional
+
+from multi_agent_framework.cli_cmds import _help
+from multi_agent_framework.cli_cmds.common import (
+    get_detached_launch_pid, get_project_config, get_recommended_agents
+)
+
+
+@click.command(help=_help.STATUS)
+@click.option('--project', '-p', help=_help.PROJECT_OPTION)
+@click.option('--detailed', '-d', is_flag=True, help='Show detailed status')
+def status(project: Optional[str], detailed: bool):
+    from multi_agent_framework.core.message_bus_configurable import MessageBus
+    from multi_agent_framework.core.progress_tracker import get_progress_tracker
+
+    project_path = project or os.getcwd()
+    project_config = get_project_config(project_path)
+    
+    # Output is collected per section and written in as few echo calls as
+    # possible, since each one flushes
+    lines = [
+        "📊 Multi-Agent Framework Status",
+        f"   Project: {project_config.config['project_name']}",
+    ]
+    
+    launch_pid = get_detached_launch_pid(project_config)
+    if launch_pid:
+        lines.append(f"   Agents: running in the background (PID {launch_pid})")
+    
+    # Check message queues
+    message_bus = MessageBus(project_config.get_message_queue_dir())
+    queue_status = message_bus.get_queue_status()
+    
+    lines.append("\n📬 Message Queues:")
+    for agent, count in queue_status.items():
+        status = "✓" if count == 0 else f"📨 {count} messages"
+        lines.append(f"   {agent}: {status}")
+    
+    # Show progress using progress tracker
+    state_file = project_config.get_state_file_path()
+    progress_tracker = get_progress_tracker(state_file)
+    
+    # Get feature counts
+    active, total = progress_tracker.get_active_features_count()
+    
+    if total > 0:
+        lines.append("\n📋 Development Progress:")
+        lines.append(f"   Active features: {active}")
+        lines.append(f"   Total features: {total}")
+        click.echo("\n".join(lines))
+        lines = []
+        
+        # Show progress bars
+        progress_tracker.display_progress(detailed=detailed)
+    else:
+        lines.append("\n📋 No features in progress (use 'maf trigger' to start)")
+    
+    # Check agent health
+    lines.append("\n🤖 Agent Health Check:")
+    enabled_agents = project_config.get_enabled_agents()
+    lines.append(f"   Enabled agents: {len(enabled_agents)}")
+    enabled = set(enabled_agents)
+    
+    # Check if critical agents are enabled
+    if 'orchestrator' not in enabled:
+        lines.append("   ⚠️  Warning: Orchestrator agent not enabled (required for coordination)")
+    
+    # Check project-specific recommendations
+    project_type = project_config.config.get('project_type', 'auto')
+    recommended = get_recommended_agents(project_type)
+    missing = [agent for agent in recommended if agent not in enabled]
+    
+    if missing:
+        lines.append(f"   💡 Tip: For {project_type} projects, consider enabling: {', '.join(missing)}")
+    
+    lines.append("\n⚙️  Configuration:")
+    lines.append(f"   Default mode: {project_config.get_default_mode()}")
+    lines.append(f"   Default model: {project_config.get_model_config()['provider']}")
+    lines.append(f"   Event bus: {project_config.get_event_bus_type()}")
+    click.echo("\n".join(lines))
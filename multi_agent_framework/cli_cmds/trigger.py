@@ -0,0 +1,169 @@
+"""
+'maf trigger' - Send a feature request to the orchestrator.
+"""
+
+import click
+import os
+import threading
+import time
+from typing import Optional
+
+from multi_agent_framework.cli_cmds import _help
+from multi_agent_framework.cli_cmds.common import get_project_config
+
+
+# Seconds without progress before 'trigger --wait' stops watching
+NO_PROGRESS_TIMEOUT = 60
+
+# Fixed fields of the feature request sent to the orchestrator
+_FEATURE_REQUEST_TEMPLATE = {
+    "sender": "cli",
+    "recipient": "orchestrator",
+    "type": "new_feature",
+}
+
+
+class _StateFileWatcher:
+    """
+    Signals when the framework state file is written, so progress is only
+    re-read after a change. Uses watchdog filesystem events when the package
+    is installed and otherwise checks the file's mtime once a second.
+    """
+
+    def __init__(self, state_file: str):
+        self.state_file = os.path.abspath(state_file)
+        self._updated = threading.Event()
+        self._observer = None
+        self._last_mtime = self._mtime()
+
+    def _mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.state_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def start(self):
+        """Start watching, if watchdog is available."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return
+
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = (event.src_path, getattr(event, 'dest_path', None))
+                if any(p and os.path.abspath(p) == watcher.state_file for p in paths):
+                    watcher._updated.set()
+
+        state_dir = os.path.dirname(self.state_file)
+        try:
+            os.makedirs(state_dir, exist_ok=True)
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_Handler(), state_dir, recursive=False)
+            observer.start()
+            self._observer = observer
+        except Exception as e:
+            click.echo(f"⚠️  Could not watch {state_dir}, polling instead: {e}")
+
+    def stop(self):
+        """Stop watching."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=1)
+            self._observer = None
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for a write. Returns False on timeout."""
+        if self._observer is not None:
+            updated = self._updated.wait(timeout)
+            self._updated.clear()
+            return updated
+
+        deadline = time.monotonic() + timeout
+        while True:
+            mtime = self._mtime()
+            if mtime != self._last_mtime:
+                self._last_mtime = mtime
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(1.0, remaining))
+
+
+@click.command(help=_help.TRIGGER)
+@click.argument('feature_description')
+@click.option('--project', '-p', help=_help.PROJECT_OPTION)
+@click.option('--wait', '-w', is_flag=True, help='Wait and show progress')
+def trigger(feature_description: str, project: Optional[str], wait: bool):
+    from multi_agent_framework.core.message_bus_configurable import MessageBus
+    from multi_agent_framework.core.progress_tracker import get_progress_tracker
+
+    project_path = project or os.getcwd()
+    project_config = get_project_config(project_path)
+    
+    click.echo(f"📝 Creating new feature request: {feature_description}")
+    
+    # Create message bus
+    message_bus = MessageBus(project_config.get_message_queue_dir())
+    
+    # Send feature request to orchestrator
+    message = {**_FEATURE_REQUEST_TEMPLATE, "content": feature_description, "timestamp": time.time()}
+    
+    message_bus.send_message("orchestrator", message)
+    
+    click.echo("✅ Feature request sent to orchestrator")
+    
+    if wait:
+        click.echo("\n⏳ Waiting for agents to start processing...\n")
+        
+        # Show live progress
+        state_file = project_config.get_state_file_path()
+        progress_tracker = get_progress_tracker(state_file)
+        watcher = _StateFileWatcher(state_file)
+        watcher.start()
+        
+        try:
+            with click.progressbar(length=100, label='Overall Progress', show_eta=True) as bar:
+                last_progress = 0
+                last_progress_time = time.monotonic()
+                
+                while last_progress < 100:
+                    # Progress of the most recent feature
+                    current_progress = progress_tracker.get_latest_progress()
+                    if current_progress is None:
+                        # The orchestrator hasn't created the feature yet;
+                        # waiting for it doesn't count as a stall
+                        watcher.wait(NO_PROGRESS_TIMEOUT)
+                        last_progress_time = time.monotonic()
+                        continue
+                    if current_progress > last_progress:
+                        bar.update(current_progress - last_progress)
+                        last_progress = current_progress
+                        last_progress_time = time.monotonic()
+                    
+                    if last_progress >= 100:
+                        break
+                    
+                    # Sleep until the state file is written again, giving up
+                    # once there has been no progress for too long
+                    remaining = NO_PROGRESS_TIMEOUT - (time.monotonic() - last_progress_time)
+                    if remaining <= 0 or not watcher.wait(remaining):
+                        click.echo(f"\n⚠️  No progress detected for {NO_PROGRESS_TIMEOUT} seconds")
+                        break
+                    
+            # Show final status
+            click.echo("\n")
+            progress_tracker.display_progress(detailed=True)
+            
+        except KeyboardInterrupt:
+            click.echo("\n\n⚠️  Progress monitoring interrupted")
+            click.echo("   Run 'maf status' to check progress")
+        finally:
+            watcher.stop()
+    else:
+        click.echo("   Run 'maf status' to monitor progress")
@@ -5,62 +5,139 @@ This module provides a factory for creating either polling-based or
 event-driven agents based on the system configuration.
 """
 
+import functools
 import importlib
-import sys
-import os
-from typing import Dict, Optional
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 
-# Add parent directory to path  # noqa: E402
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from .. import config
+from ..agents.base_agent_configurable import BaseAgent
+from multi_agent_framework.core.project_config import ProjectConfig
 
-from .. import config  # noqa: E402
-from ..agents.base_agent_configurable import BaseAgent  # noqa: E402
-from multi_agent_framework.core.project_config import ProjectConfig  # noqa: E402
+
+@functools.lru_cache(maxsize=32)
+def _normalize_agent_type(agent_type: str) -> str:
+    return agent_type.lower().replace('_agent', '')
+
+
+# Module and class names of an agent type's polling and event-driven implementations
+AgentImpl = namedtuple('AgentImpl', 'polling_mod polling_cls event_mod event_cls')
 
 
 class AgentFactory:
     """Factory for creating agent instances"""
 
-    # Mapping of agent types to their implementations
-    AGENT_MAPPINGS = {
-        'orchestrator': {
-            'polling': ('multi_agent_framework.agents.orchestrator_agent', 'OrchestratorAgent'),
-            'event_driven': ('multi_agent_framework.agents.event_driven_orchestrator_agent', 'EventDrivenOrchestratorAgent')
-        },
-        'frontend': {
-            'polling': ('multi_agent_framework.agents.specialized.frontend_agent', 'FrontendAgent'),
-            'event_driven': ('multi_agent_framework.agents.event_driven_frontend_agent', 'EventDrivenFrontendAgent')
-        },
-        'backend': {
-            'polling': ('multi_agent_framework.agents.specialized.backend_agent', 'BackendAgent'),
-            'event_driven': ('multi_agent_framework.agents.event_driven_backend_agent', 'EventDrivenBackendAgent')
-        },
-        'db': {
-            'polling': ('multi_agent_framework.agents.specialized.db_agent', 'DbAgent'),
-            'event_driven': ('multi_agent_framework.agents.event_driven_db_agent', 'EventDrivenDatabaseAgent')
-        },
-        'qa': {
-            'polling': ('multi_agent_framework.agents.specialized.qa_agent', 'QATestingAgent'),
-            'event_driven': ('multi_agent_framework.agents.event_driven_qa_agent', 'EventDrivenQAAgent')
-        },
-        'security': {
-            'polling': ('multi_agent_framework.agents.specialized.security_agent', 'SecurityAgent'),
-            'event_driven': ('multi_agent_framework.agents.event_driven_security_agent', 'EventDrivenSecurityAgent')
-        },
-        'devops': {
-            'polling': ('multi_agent_framework.agents.specialized.devops_agent', 'DevopsAgent'),
-            'event_driven': ('multi_agent_framework.agents.event_driven_devops_agent', 'EventDrivenDevOpsAgent')
-        },
-        'docs': {
-            'polling': ('multi_agent_framework.agents.specialized.docs_agent', 'DocumentationAgent'),
-            'event_driven': ('multi_agent_framework.agents.event_driven_docs_agent', 'EventDrivenDocsAgent')
-        },
-        'ux_ui': {
-            'polling': ('multi_agent_framework.agents.specialized.ux_ui_agent', 'UXUIDesignAgent'),
-            'event_driven': ('multi_agent_framework.agents.event_driven_ux_ui_agent', 'EventDrivenUXUIAgent')
-        }
+    # Mapping of agent types to their polling and event-driven implementations
+    AGENT_MAPPINGS: Dict[str, AgentImpl] = {
+        'orchestrator': AgentImpl(
+            'multi_agent_framework.agents.orchestrator_agent', 'OrchestratorAgent',
+            'multi_agent_framework.agents.event_driven_orchestrator_agent', 'EventDrivenOrchestratorAgent'
+        ),
+        'frontend': AgentImpl(
+            'multi_agent_framework.agents.specialized.frontend_agent', 'FrontendAgent',
+            'multi_agent_framework.agents.event_driven_frontend_agent', 'EventDrivenFrontendAgent'
+        ),
+        'backend': AgentImpl(
+            'multi_agent_framework.agents.specialized.backend_agent', 'BackendAgent',
+            'multi_agent_framework.agents.event_driven_backend_agent', 'EventDrivenBackendAgent'
+        ),
+        'db': AgentImpl(
+            'multi_agent_framework.agents.specialized.db_agent', 'DbAgent',
+            'multi_agent_framework.agents.event_driven_db_agent', 'EventDrivenDatabaseAgent'
+        ),
+        'qa': AgentImpl(
+            'multi_agent_framework.agents.specialized.qa_agent', 'QATestingAgent',
+            'multi_agent_framework.agents.event_driven_qa_agent', 'EventDrivenQAAgent'
+        ),
+        'security': AgentImpl(
+            'multi_agent_framework.agents.specialized.security_agent', 'SecurityAgent',
+            'multi_agent_framework.agents.event_driven_security_agent', 'EventDrivenSecurityAgent'
+        ),
+        'devops': AgentImpl(
+            'multi_agent_framework.agents.specialized.devops_agent', 'DevopsAgent',
+            'multi_agent_framework.agents.event_driven_devops_agent', 'EventDrivenDevOpsAgent'
+        ),
+        'docs': AgentImpl(
+            'multi_agent_framework.agents.specialized.docs_agent', 'DocumentationAgent',
+            'multi_agent_framework.agents.event_driven_docs_agent', 'EventDrivenDocsAgent'
+        ),
+        'ux_ui': AgentImpl(
+            'multi_agent_framework.agents.specialized.ux_ui_agent', 'UXUIDesignAgent',
+            'multi_agent_framework.agents.event_driven_ux_ui_agent', 'EventDrivenUXUIAgent'
+        )
     }
 
+    # (agent_type, mode) -> agent class, filled in as classes are first resolved
+    _resolved_cache: Dict[Tuple[str, str], type] = {}
+
+    @classmethod
+    def get_agent_class(cls, agent_type: str, mode: Optional[str] = None) -> type:
+        """
+        Get the agent class for an agent type, importing its module on first use
+
+        Args:
+            agent_type: Type of agent ('orchestrator', 'frontend', etc.)
+            mode: 'polling' or 'event_driven' (defaults to config.EVENT_DRIVEN_MODE)
+
+        Returns:
+            Agent class
+
+        Raises:
+            ValueError: If agent type is not supported
+            ImportError: If agent class cannot be imported
+        """
+        agent_type = _normalize_agent_type(agent_type)
+
+        if agent_type not in cls.AGENT_MAPPINGS:
+            raise ValueError(
+                f"Unsupported agent type: {agent_type}. "
+                f"Supported types: {list(cls.AGENT_MAPPINGS.keys())}"
+            )
+
+        if mode is None:
+            mode = 'event_driven' if config.EVENT_DRIVEN_MODE else 'polling'
+
+        agent_class = cls._resolved_cache.get((agent_type, mode))
+        if agent_class is not None:
+            return agent_class
+
+        impl = cls.AGENT_MAPPINGS[agent_type]
+        if mode == 'polling':
+            module_name, class_name = impl.polling_mod, impl.polling_cls
+        elif mode == 'event_driven':
+            module_name, class_name = impl.event_mod, impl.event_cls
+        else:
+            raise ValueError(f"Unknown mode: {mode}. Supported modes: ['polling', 'event_driven']")
+
+        try:
+            module = importlib.import_module(module_name)
+            agent_class = getattr(module, class_name)
+        except ImportError as e:
+            raise ImportError(f"Failed to import {mode} {agent_type} agent: {e}")
+        except AttributeError as e:
+            raise ImportError(f"Agent class {class_name} not found in {module_name}: {e}")
+
+        cls._resolved_cache[(agent_type, mode)] = agent_class
+        return agent_class
+
+    @classmethod
+    def warmup(cls, mode: Optional[str] = None, agent_types: Optional[list] = None) -> None:
+        """
+        Resolve agent classes ahead of time, so later create_agent calls (or
+        processes forked from this one) find them already imported
+
+        Args:
+            mode: 'polling' or 'event_driven' (defaults to config.EVENT_DRIVEN_MODE)
+            agent_types: Agent types to resolve (defaults to all of them)
+        """
+        for agent_type in agent_types or cls.AGENT_MAPPINGS:
+            try:
+                cls.get_agent_class(agent_type, mode)
+            except Exception:
+                # Left for create_agent to report against the agent
+                pass
+
     @classmethod
     def create_agent(cls, agent_type: str,
                      model_provider: Optional[str] = None,
@@ -83,27 +160,15 @@ class AgentFactory:
             ValueError: If agent type is not supported
             ImportError: If agent class cannot be imported
         """
-        # Normalize agent type
-        agent_type = agent_type.lower().replace('_agent', '')
-
-        if agent_type not in cls.AGENT_MAPPINGS:
-            raise ValueError(
-                f"Unsupported agent type: {agent_type}. "
-                f"Supported types: {list(cls.AGENT_MAPPINGS.keys())}"
-            )
+        agent_type = _normalize_agent_type(agent_type)
 
         # Determine mode
         if mode is None:
             mode = 'event_driven' if config.EVENT_DRIVEN_MODE else 'polling'
 
-        # Get agent module and class info
-        module_name, class_name = cls.AGENT_MAPPINGS[agent_type][mode]
+        agent_class = cls.get_agent_class(agent_type, mode)
 
         try:
-            # Dynamically import the module
-            module = importlib.import_module(module_name)
-            agent_class = getattr(module, class_name)
-
             # Create agent instance with project config
             kwargs = {}
             if project_config:
@@ -120,8 +185,6 @@ class AgentFactory:
 
         except ImportError as e:
             raise ImportError(f"Failed to import {mode} {agent_type} agent: {e}")
-        except AttributeError as e:
-            raise ImportError(f"Agent class {class_name} not found in {module_name}: {e}")
 
     @classmethod
     def create_all_agents(cls, mode: Optional[str] = None,
@@ -137,10 +200,18 @@ class AgentFactory:
         """
         agents = {}
 
-        for agent_type in cls.AGENT_MAPPINGS:
+        # Agent constructors mostly wait on I/O (LLM clients, state files),
+        # so build them all at once
+        with ThreadPoolExecutor(max_workers=len(cls.AGENT_MAPPINGS)) as executor:
+            futures = {
+                agent_type: executor.submit(cls.create_agent, agent_type,
+                                            mode=mode, project_config=project_config)
+                for agent_type in cls.AGENT_MAPPINGS
+            }
+
+        for agent_type, future in futures.items():
             try:
-                agent = cls.create_agent(agent_type, mode=mode, project_config=project_config)
-                agents[agent_type] = agent
+                agents[agent_type] = future.result()
             except Exception as e:
                 print(f"Warning: Failed to create {agent_type} agent: {e}")
 
@@ -157,15 +228,8 @@ class AgentFactory:
         Returns:
             List of available agent types
         """
-        if mode is None:
-            mode = 'event_driven' if config.EVENT_DRIVEN_MODE else 'polling'
-
-        available = []
-        for agent_type, implementations in cls.AGENT_MAPPINGS.items():
-            if mode in implementations:
-                available.append(agent_type)
-
-        return available
+        # Every agent type has both a polling and an event-driven implementation
+        return list(cls.AGENT_MAPPINGS)
 
 
 def create_agent(agent_type: str, **kwargs) -> BaseAgent:
@@ -2,12 +2,73 @@ import os
 import re
 import json
 import ast
-from typing import Dict, List, Optional, Tuple, Any
+import functools
+import hashlib
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass
 
+try:
+    import tree_sitter_javascript
+    from tree_sitter import Language, Parser
+    _JS_PARSER = Parser(Language(tree_sitter_javascript.language()))
+    TREE_SITTER_AVAILABLE = True
+except (ImportError, TypeError):
+    # Not installed, or a tree-sitter release with the pre-0.22 API
+    TREE_SITTER_AVAILABLE = False
+
+SecurityRule = namedtuple('SecurityRule', 'name pattern severity message suggestion')
+
+# Patterns are compiled once at import time rather than per validation call.
+_FETCH_RE = re.compile(r'fetch\s*\(\s*[\'"`]([^\'"`]+)[\'"`].*?method\s*:\s*[\'"`](\w+)[\'"`]', re.DOTALL)
+_AXIOS_METHOD_RE = re.compile(r'axios\.(\w+)\s*\(\s*[\'"`]([^\'"`]+)[\'"`]', re.DOTALL)
+_AXIOS_OBJ_RE = re.compile(r'axios\s*\(\s*\{\s*url\s*:\s*[\'"`]([^\'"`]+)[\'"`].*?method\s*:\s*[\'"`](\w+)[\'"`]', re.DOTALL)
+_ROUTE_COMMENT_RE = re.compile(r'//\s*route:\s*([^\n]+)')
+_EXPRESS_RE = re.compile(r'router\.(\w+)\s*\(\s*[\'"`]([^\'"`]+)[\'"`]')
+_CREATE_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?["`]?(\w+)["`]?\s*\((.*?)\);', re.DOTALL | re.IGNORECASE)
+# supabase.from('table') plus, when chained directly onto it, .select('fields')
+_SUPABASE_QUERY_RE = re.compile(
+    r'supabase\s*\.\s*from\s*\(\s*[\'"`](\w+)[\'"`]\s*\)'
+    r'(?:\s*\.select\s*\(\s*[\'"`]([^\'"`]+)[\'"`])?'
+)
+_IMPORT_RE = re.compile(r'import\s+(?:\{([^}]+)\}|(\w+))\s+from\s+[\'"`]([^\'"`]+)[\'"`]')
+_FUNC_RE = re.compile(r'(?:export\s+)?(?:async\s+)?function\s+(\w+)')
+_ARROW_RE = re.compile(r'(?:export\s+)?const\s+(\w+)\s*=')
+_DESCRIBE_RE = re.compile(r'describe\s*\(')
+_IT_RE = re.compile(r'(?:it|test)\s*\(')
+_AUTH_CHECK_RE = re.compile(r'(getUser|requireAuth|authenticate|getSession)')
+
+# Security checks in reporting order; severity is 'error' or 'warning'
+_SECURITY_RULES: Tuple[SecurityRule, ...] = (
+    SecurityRule('sql_injection', r'query\s*\(\s*[\'"`].*\$\{.*\}.*[\'"`]', 'error',
+                 "Potential SQL injection vulnerability",
+                 "Use parameterized queries or prepared statements"),
+    SecurityRule('xss', r'dangerouslySetInnerHTML|innerHTML\s*=', 'warning',
+                 "Potential XSS vulnerability with innerHTML",
+                 "Sanitize user input or use safe alternatives"),
+    SecurityRule('hardcoded_secrets', r'(api_key|secret|password|token)\s*=\s*[\'"`][^\'"`]+[\'"`]', 'error',
+                 "Hardcoded secrets detected - use environment variables",
+                 "Move secrets to .env file and use process.env"),
+    SecurityRule('console_log', r'console\.(log|error|warn)', 'warning',
+                 "Remove console.log statements before production", None),
+    SecurityRule('eval_usage', r'\beval\s*\(', 'error',
+                 "Avoid using eval() - it's a security risk", None),
+)
+# One pass over the code for all security checks. Each alternative sits in a
+# lookahead so a long match (e.g. sql_injection's .*) can't hide another
+# issue that starts inside it; match.lastgroup names the rule that matched.
+_SECURITY_RE = re.compile(
+    '(?=' + '|'.join(f'(?P<{rule.name}>{rule.pattern})' for rule in _SECURITY_RULES) + ')',
+    re.IGNORECASE
+)
+
 @dataclass
 class ValidationResult:
     """Result of cross-agent validation."""
+    # Explicit __slots__ rather than dataclass(slots=True), which needs 3.10
+    __slots__ = ('is_valid', 'errors', 'warnings', 'suggestions')
     is_valid: bool
     errors: List[str]
     warnings: List[str]
@@ -16,12 +77,252 @@ class ValidationResult:
 @dataclass
 class APIContract:
     """Represents an API contract between frontend and backend."""
+    __slots__ = ('endpoint', 'method', 'request_schema', 'response_schema', 'auth_required')
     endpoint: str
     method: str
     request_schema: Dict[str, Any]
     response_schema: Dict[str, Any]
     auth_required: bool
 
+# Leading words of table-level constraints inside CREATE TABLE (...)
+_TABLE_CONSTRAINT_KEYWORDS = frozenset({
+    'CONSTRAINT', 'PRIMARY', 'FOREIGN', 'UNIQUE', 'CHECK', 'EXCLUDE'
+})
+
+def _split_top_level_commas(columns_str: str) -> List[str]:
+    """Split a CREATE TABLE body on commas outside parentheses and quotes.
+    
+    '--' line comments are dropped; empty definitions are skipped.
+    """
+    definitions = []
+    pieces = []  # text of the current definition, minus comments
+    start = 0
+    depth = 0
+    quote = None
+    i = 0
+    length = len(columns_str)
+    while i < length:
+        char = columns_str[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '\'"`':
+            quote = char
+        elif char == '-' and columns_str.startswith('--', i):
+            pieces.append(columns_str[start:i])
+            newline = columns_str.find('\n', i)
+            i = start = length if newline == -1 else newline
+            continue
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            pieces.append(columns_str[start:i])
+            definitions.append(''.join(pieces).strip())
+            pieces = []
+            start = i + 1
+        i += 1
+    pieces.append(columns_str[start:])
+    definitions.append(''.join(pieces).strip())
+    return [definition for definition in definitions if definition]
+
+# tree-sitter node types that introduce a named function
+_TS_FUNCTION_DECLARATIONS = frozenset({'function_declaration', 'generator_function_declaration'})
+_TS_FUNCTION_VALUES = frozenset({
+    'arrow_function', 'function_expression', 'function', 'generator_function'
+})
+
+def _ts_walk(root):
+    """Yield root and its named descendants in document order."""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.named_children))
+
+def _ts_function_names(root) -> List[str]:
+    """Names of declared functions, methods and function-valued bindings."""
+    functions = []
+    for node in _ts_walk(root):
+        if node.type in _TS_FUNCTION_DECLARATIONS:
+            name = node.child_by_field_name('name')
+        elif node.type == 'method_definition':
+            name = node.child_by_field_name('name')
+            if name is not None and name.text == b'constructor':
+                continue
+        elif node.type == 'variable_declarator':
+            value = node.child_by_field_name('value')
+            if value is None or value.type not in _TS_FUNCTION_VALUES:
+                continue
+            name = node.child_by_field_name('name')
+        elif node.type == 'pair':
+            value = node.child_by_field_name('value')
+            if value is None or value.type not in _TS_FUNCTION_VALUES:
+                continue
+            name = node.child_by_field_name('key')
+        else:
+            continue
+        if name is not None and name.type in ('identifier', 'property_identifier'):
+            functions.append(name.text.decode('utf-8'))
+    return functions
+
+# Results of pure validator methods are memoized per instance, keyed by a
+# digest of their arguments; larger inputs aren't worth hashing.
+_MEMO_SIZE = 128
+_MEMO_MAX_CHARS = 1024 * 1024
+
+def _memoized(method):
+    """Memoize a method whose result depends only on its string arguments.
+    
+    Cached lists are shared between calls, so callers must not mutate them;
+    ValidationResults are copied on the way out instead.
+    """
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Keyword arguments are keyed by name, so f(x) and f(code=x) are cached separately
+        parts = args + tuple(part for item in sorted(kwargs.items()) for part in item)
+        if sum(len(part) for part in parts) > _MEMO_MAX_CHARS:
+            return method(self, *args, **kwargs)
+        digest = hashlib.blake2b(digest_size=16)
+        for arg in parts:
+            data = arg.encode('utf-8', 'surrogatepass')
+            digest.update(len(data).to_bytes(8, 'little'))
+            digest.update(data)
+        key = (name, digest.digest())
+        
+        memo = self._memo
+        if key in memo:
+            memo.move_to_end(key)
+            result = memo[key]
+        else:
+            result = method(self, *args, **kwargs)
+            memo[key] = result
+            if len(memo) > _MEMO_SIZE:
+                memo.popitem(last=False)
+        
+        if isinstance(result, ValidationResult):
+            return ValidationResult(
+                is_valid=result.is_valid,
+                errors=list(result.errors),
+                warnings=list(result.warnings),
+                suggestions=list(result.suggestions)
+            )
+        return result
+    
+    return wrapper
+
+# Dependency, VCS and build output directories never hold source components
+_SKIP_DIRS = frozenset({
+    'node_modules', '.next', '.git', 'dist', 'build', '.turbo', 'coverage'
+})
+
+def _mtime(path: str) -> Optional[int]:
+    """Return the mtime of path in nanoseconds, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=256)
+def _compile_endpoint_path(path: str) -> re.Pattern:
+    """Compile an endpoint path such as /api/users/[id] into a pattern.
+    
+    [param] segments match any single segment; use fullmatch against the call
+    path with trailing slashes stripped. Compiled patterns are cached per path.
+    """
+    return re.compile('/'.join(
+        '[^/]*' if part.startswith('[') and part.endswith(']') else re.escape(part)
+        for part in path.split('/')
+    ))
+
+def _lowercase_index(columns) -> Dict[str, str]:
+    """Map lowercased column names to the originals, keeping column order.
+    
+    When two columns differ only by case, the first one wins.
+    """
+    index = {}
+    for col in columns:
+        index.setdefault(col.lower(), col)
+    return index
+
+def _bounded_levenshtein(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Return the edit distance between a and b, or None if it exceeds max_distance.
+    
+    Only the diagonal band of width 2 * max_distance + 1 is filled in, and the
+    computation stops as soon as a whole row is over the bound.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    
+    over = max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        start = max(1, i - max_distance)
+        end = min(len(b), i + max_distance)
+        current = [over] * (len(b) + 1)
+        if start == 1:
+            current[0] = i
+        for j in range(start, end + 1):
+            cost = previous[j - 1] + (char_a != b[j - 1])
+            current[j] = min(cost, previous[j] + 1, current[j - 1] + 1)
+        if min(current[start - 1:end + 1]) > max_distance:
+            return None
+        previous = current
+    
+    distance = previous[len(b)]
+    return distance if distance <= max_distance else None
+
+def _strongly_connected_components(graph: Dict[str, set]) -> List[List[str]]:
+    """Return the strongly connected components of graph (iterative Tarjan).
+    
+    graph maps each node to the set of nodes it points to; successors that
+    are not keys themselves are treated as leaves.
+    """
+    index = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
+    components = []
+    
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph.get(succ, ()))))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
 class CrossAgentValidator:
     """
     Validates outputs across different agents to ensure compatibility
@@ -33,7 +334,20 @@ class CrossAgentValidator:
         self.api_contracts = {}
         self.component_dependencies = {}
         self.database_schemas = {}
-        
+        # (dirs, recursive) -> (stamps, stems, names); see _dir_index
+        self._fs_index = {}
+        # (name, mtime) of the migrations last parsed by _load_database_schemas
+        self._migrations_stamp = None
+        # Bumped whenever component_dependencies changes; keys the SCC cache
+        self._dependency_version = 0
+        self._scc_cache = (None, {})
+        # (method name, argument digest) -> result; see _memoized
+        self._memo = OrderedDict()
+        # Worker pool for validate_batch, with the schema stamp it was seeded with
+        self._pool = None
+        self._pool_stamp = None
+        
+    @_memoized
     def validate_frontend_backend_contract(self, frontend_code: str, 
                                          backend_code: str) -> ValidationResult:
         """Validate that frontend API calls match backend endpoints."""
@@ -47,29 +361,38 @@ class CrossAgentValidator:
         # Extract API endpoints from backend
         backend_endpoints = self._extract_backend_endpoints(backend_code)
         
+        # Index backend endpoints: static paths by (method, path), parameterized
+        # paths as compiled patterns grouped by method
+        static_endpoints = {}
+        dynamic_endpoints = {}
+        for index, endpoint in enumerate(backend_endpoints):
+            path = endpoint['endpoint'].rstrip('/')
+            if '[' in path:
+                dynamic_endpoints.setdefault(endpoint['method'], []).append(
+                    (index, _compile_endpoint_path(path)))
+            else:
+                static_endpoints.setdefault((endpoint['method'], path), []).append(index)
+        
         # Validate each frontend call has matching backend endpoint
+        used = set()
         for api_call in frontend_apis:
-            endpoint_match = False
-            for endpoint in backend_endpoints:
-                if self._endpoints_match(api_call, endpoint):
-                    endpoint_match = True
-                    # Validate request/response schemas
-                    schema_errors = self._validate_schemas(api_call, endpoint)
-                    errors.extend(schema_errors)
-                    break
-                    
-            if not endpoint_match:
+            call_path = api_call['endpoint'].rstrip('/')
+            matches = list(static_endpoints.get((api_call['method'], call_path), ()))
+            matches.extend(index for index, path_re in dynamic_endpoints.get(api_call['method'], ())
+                           if path_re.fullmatch(call_path))
+            
+            if matches:
+                used.update(matches)
+                # Validate request/response schemas against the first matching endpoint
+                schema_errors = self._validate_schemas(api_call, backend_endpoints[min(matches)])
+                errors.extend(schema_errors)
+            else:
                 errors.append(f"Frontend calls API '{api_call['endpoint']}' but no matching backend endpoint found")
                 suggestions.append(f"Create backend endpoint: {api_call['method']} {api_call['endpoint']}")
         
         # Check for unused backend endpoints
-        for endpoint in backend_endpoints:
-            used = False
-            for api_call in frontend_apis:
-                if self._endpoints_match(api_call, endpoint):
-                    used = True
-                    break
-            if not used:
+        for index, endpoint in enumerate(backend_endpoints):
+            if index not in used:
                 warnings.append(f"Backend endpoint '{endpoint['method']} {endpoint['endpoint']}' is not used by frontend")
         
         return ValidationResult(
@@ -91,26 +414,33 @@ class CrossAgentValidator:
         # Extract database queries from code
         queries = self._extract_database_queries(code)
         
+        # Lowercased column names per table, built on first use
+        columns_lower_by_table = {}
+        
         for query in queries:
             table_name = query.get('table')
             if table_name in self.database_schemas:
                 schema = self.database_schemas[table_name]
+                fields = query.get('fields', [])
                 
                 # Validate field usage
-                for field in query.get('fields', []):
+                for field in fields:
                     if field not in schema['columns']:
                         errors.append(f"Field '{field}' does not exist in table '{table_name}'")
                         # Suggest similar fields
-                        similar = self._find_similar_fields(field, schema['columns'])
+                        columns_lower = columns_lower_by_table.get(table_name)
+                        if columns_lower is None:
+                            columns_lower = _lowercase_index(schema['columns'])
+                            columns_lower_by_table[table_name] = columns_lower
+                        similar = self._find_similar_fields(field, schema['columns'], columns_lower)
                         if similar:
                             suggestions.append(f"Did you mean '{similar}'?")
                 
                 # Check for required fields in inserts
                 if query.get('type') == 'insert':
-                    missing_required = []
-                    for col, info in schema['columns'].items():
-                        if info.get('required') and col not in query.get('fields', []):
-                            missing_required.append(col)
+                    field_set = set(fields)
+                    missing_required = [col for col, info in schema['columns'].items()
+                                        if info.get('required') and col not in field_set]
                     if missing_required:
                         errors.append(f"Missing required fields for {table_name}: {', '.join(missing_required)}")
             else:
@@ -150,6 +480,12 @@ class CrossAgentValidator:
                 if not self._util_exists(dep['name']):
                     warnings.append(f"Utility '{dep['name']}' imported but not found")
         
+        # Record this component's edges in the project-wide dependency graph
+        imported = {dep['name'] for dep in dependencies if dep['type'] == 'component'}
+        if self.component_dependencies.get(component_name) != imported:
+            self.component_dependencies[component_name] = imported
+            self._dependency_version += 1
+        
         # Check for circular dependencies
         circular = self._check_circular_dependencies(component_name, dependencies)
         if circular:
@@ -162,6 +498,7 @@ class CrossAgentValidator:
             suggestions=suggestions
         )
     
+    @_memoized
     def validate_test_coverage(self, component_code: str, test_code: str) -> ValidationResult:
         """Validate that tests cover component functionality."""
         errors = []
@@ -172,24 +509,22 @@ class CrossAgentValidator:
         component_functions = self._extract_functions(component_code)
         
         # Extract tested functions
-        tested_functions = self._extract_tested_functions(test_code)
+        tested_functions = self._extract_tested_functions(test_code, component_functions)
         
-        # Check coverage
-        untested = []
-        for func in component_functions:
-            if func not in tested_functions:
-                untested.append(func)
+        # Check coverage; tested_functions is a set, and each name is reported
+        # once even if the component defines it more than once
+        untested = [func for func in dict.fromkeys(component_functions)
+                    if func not in tested_functions]
                 
         if untested:
             warnings.append(f"Functions not covered by tests: {', '.join(untested)}")
-            for func in untested:
-                suggestions.append(f"Add test case for '{func}' function")
+            suggestions.extend(f"Add test case for '{func}' function" for func in untested)
         
         # Validate test structure
-        if not re.search(r'describe\s*\(', test_code):
+        if not _DESCRIBE_RE.search(test_code):
             errors.append("Test file missing 'describe' block")
             
-        if not re.search(r'(?:it|test)\s*\(', test_code):
+        if not _IT_RE.search(test_code):
             errors.append("Test file missing test cases")
         
         return ValidationResult(
@@ -199,6 +534,7 @@ class CrossAgentValidator:
             suggestions=suggestions
         )
     
+    @_memoized
     def validate_security_compliance(self, code: str, code_type: str) -> ValidationResult:
         """Validate security best practices."""
         errors = []
@@ -206,33 +542,21 @@ class CrossAgentValidator:
         suggestions = []
         
         # Check for common security issues
-        security_patterns = {
-            'sql_injection': r'query\s*\(\s*[\'"`].*\$\{.*\}.*[\'"`]',
-            'xss': r'dangerouslySetInnerHTML|innerHTML\s*=',
-            'hardcoded_secrets': r'(api_key|secret|password|token)\s*=\s*[\'"`][^\'"`]+[\'"`]',
-            'console_log': r'console\.(log|error|warn)',
-            'eval_usage': r'\beval\s*\(',
-        }
-        
-        for issue, pattern in security_patterns.items():
-            if re.search(pattern, code, re.IGNORECASE):
-                if issue == 'console_log':
-                    warnings.append("Remove console.log statements before production")
-                elif issue == 'hardcoded_secrets':
-                    errors.append("Hardcoded secrets detected - use environment variables")
-                    suggestions.append("Move secrets to .env file and use process.env")
-                elif issue == 'sql_injection':
-                    errors.append("Potential SQL injection vulnerability")
-                    suggestions.append("Use parameterized queries or prepared statements")
-                elif issue == 'xss':
-                    warnings.append("Potential XSS vulnerability with innerHTML")
-                    suggestions.append("Sanitize user input or use safe alternatives")
-                elif issue == 'eval_usage':
-                    errors.append("Avoid using eval() - it's a security risk")
+        found = set()
+        for match in _SECURITY_RE.finditer(code):
+            found.add(match.lastgroup)
+            if len(found) == len(_SECURITY_RULES):
+                break
+        
+        for rule in _SECURITY_RULES:
+            if rule.name in found:
+                (errors if rule.severity == 'error' else warnings).append(rule.message)
+                if rule.suggestion:
+                    suggestions.append(rule.suggestion)
         
         # Check authentication on API routes
         if code_type == 'api' and 'export' in code:
-            if not re.search(r'(getUser|requireAuth|authenticate|getSession)', code):
+            if not _AUTH_CHECK_RE.search(code):
                 warnings.append("API route may be missing authentication check")
                 suggestions.append("Add authentication middleware to protect this endpoint")
         
@@ -243,85 +567,115 @@ class CrossAgentValidator:
             suggestions=suggestions
         )
     
+    def validate_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[ValidationResult]:
+        """Run many validations, spreading the CPU-bound ones over processes.
+        
+        Each item is (validator_name, kwargs), e.g.
+        ('validate_security_compliance', {'code': code, 'code_type': 'api'}).
+        Results are returned in item order. validate_component_dependencies
+        runs in this process because it updates the shared dependency graph;
+        everything else goes to a worker pool that is kept for later batches
+        (call close() to shut it down).
+        """
+        for name, _ in items:
+            if not name.startswith('validate_') or name == 'validate_batch' or not hasattr(self, name):
+                raise ValueError(f"Unknown validator: {name}")
+        
+        results = [None] * len(items)
+        remote = []
+        for index, (name, kwargs) in enumerate(items):
+            if name in _LOCAL_VALIDATORS or len(items) == 1:
+                results[index] = getattr(self, name)(**kwargs)
+            else:
+                remote.append(index)
+        
+        if len(remote) == 1:
+            name, kwargs = items[remote[0]]
+            results[remote[0]] = getattr(self, name)(**kwargs)
+        elif remote:
+            pool = self._get_pool()
+            for index, result in zip(remote, pool.map(_run_batch_item, [items[i] for i in remote])):
+                results[index] = result
+        
+        return results
+    
+    def close(self):
+        """Shut down the validate_batch worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self._pool_stamp = None
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the batch worker pool, restarting it if the schemas changed."""
+        # Workers get the parsed schemas once, at startup, instead of each
+        # re-reading the migrations
+        self._load_database_schemas()
+        if self._pool is not None and self._pool_stamp != self._migrations_stamp:
+            self.close()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                initializer=_init_batch_worker,
+                initargs=(self.project_root, self.database_schemas, self._migrations_stamp)
+            )
+            self._pool_stamp = self._migrations_stamp
+        return self._pool
+    
+    @_memoized
     def _extract_frontend_api_calls(self, code: str) -> List[Dict]:
         """Extract API calls from frontend code."""
         api_calls = []
+        # Only run a pattern when its literal keyword appears in the code
+        has_fetch = 'fetch' in code
+        has_axios = 'axios' in code
+        if not (has_fetch or has_axios):
+            return api_calls
         
         # Look for fetch calls
-        fetch_pattern = r'fetch\s*\(\s*[\'"`]([^\'"`]+)[\'"`].*?method\s*:\s*[\'"`](\w+)[\'"`]'
-        for match in re.finditer(fetch_pattern, code, re.DOTALL):
-            api_calls.append({
-                'endpoint': match.group(1),
-                'method': match.group(2).upper()
-            })
+        if has_fetch:
+            api_calls.extend({'endpoint': match.group(1), 'method': match.group(2).upper()}
+                             for match in _FETCH_RE.finditer(code))
         
         # Look for axios calls
-        axios_patterns = [
-            r'axios\.(\w+)\s*\(\s*[\'"`]([^\'"`]+)[\'"`]',
-            r'axios\s*\(\s*\{\s*url\s*:\s*[\'"`]([^\'"`]+)[\'"`].*?method\s*:\s*[\'"`](\w+)[\'"`]'
-        ]
-        
-        for pattern in axios_patterns:
-            for match in re.finditer(pattern, code, re.DOTALL):
-                if len(match.groups()) == 2:
-                    api_calls.append({
-                        'endpoint': match.group(2) if pattern == axios_patterns[0] else match.group(1),
-                        'method': match.group(1).upper() if pattern == axios_patterns[0] else match.group(2).upper()
-                    })
+        if has_axios:
+            api_calls.extend({'endpoint': match.group(2), 'method': match.group(1).upper()}
+                             for match in _AXIOS_METHOD_RE.finditer(code))
+            api_calls.extend({'endpoint': match.group(1), 'method': match.group(2).upper()}
+                             for match in _AXIOS_OBJ_RE.finditer(code))
         
         return api_calls
     
+    @_memoized
     def _extract_backend_endpoints(self, code: str) -> List[Dict]:
         """Extract API endpoints from backend code."""
         endpoints = []
         
         # Next.js API routes
-        methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH']
-        for method in methods:
-            if f'export async function {method}' in code or f'export function {method}' in code:
-                # Extract route from file path or comments
-                route_match = re.search(r'//\s*route:\s*([^\n]+)', code)
-                if route_match:
-                    endpoints.append({
-                        'endpoint': route_match.group(1).strip(),
-                        'method': method
-                    })
+        if 'export' in code:
+            methods = [method for method in ('GET', 'POST', 'PUT', 'DELETE', 'PATCH')
+                       if f'export async function {method}' in code or f'export function {method}' in code]
+            # Extract route from file path or comments
+            route_match = _ROUTE_COMMENT_RE.search(code) if methods else None
+            if route_match:
+                route = route_match.group(1).strip()
+                endpoints.extend({'endpoint': route, 'method': method} for method in methods)
         
         # Express-style routes
-        express_pattern = r'router\.(\w+)\s*\(\s*[\'"`]([^\'"`]+)[\'"`]'
-        for match in re.finditer(express_pattern, code):
-            endpoints.append({
-                'endpoint': match.group(2),
-                'method': match.group(1).upper()
-            })
+        if 'router.' in code:
+            endpoints.extend({'endpoint': match.group(2), 'method': match.group(1).upper()}
+                             for match in _EXPRESS_RE.finditer(code))
         
         return endpoints
     
     def _endpoints_match(self, api_call: Dict, endpoint: Dict) -> bool:
         """Check if frontend API call matches backend endpoint."""
-        # Normalize paths
-        call_path = api_call['endpoint'].rstrip('/')
-        endpoint_path = endpoint['endpoint'].rstrip('/')
-        
-        # Check method match
         if api_call['method'] != endpoint['method']:
             return False
         
-        # Check path match (handle parameters)
-        call_parts = call_path.split('/')
-        endpoint_parts = endpoint_path.split('/')
-        
-        if len(call_parts) != len(endpoint_parts):
-            return False
-        
-        for i, (call_part, endpoint_part) in enumerate(zip(call_parts, endpoint_parts)):
-            # Handle path parameters
-            if endpoint_part.startswith('[') and endpoint_part.endswith(']'):
-                continue  # Parameter matches any value
-            elif call_part != endpoint_part:
-                return False
-        
-        return True
+        # Trailing slashes are ignored; [param] segments match any value
+        path_re = _compile_endpoint_path(endpoint['endpoint'].rstrip('/'))
+        return path_re.fullmatch(api_call['endpoint'].rstrip('/')) is not None
     
     def _validate_schemas(self, api_call: Dict, endpoint: Dict) -> List[str]:
         """Validate request/response schemas between frontend and backend."""
@@ -333,169 +687,284 @@ class CrossAgentValidator:
     def _load_database_schemas(self):
         """Load database schemas from migrations."""
         migrations_dir = os.path.join(self.project_root, 'supabase', 'migrations')
-        if not os.path.exists(migrations_dir):
+        try:
+            with os.scandir(migrations_dir) as entries:
+                migrations = sorted(
+                    (entry.name, entry.stat().st_mtime_ns, entry.path)
+                    for entry in entries
+                    if entry.name.endswith('.sql') and entry.is_file()
+                )
+        except OSError:
             return
         
-        for file in os.listdir(migrations_dir):
-            if file.endswith('.sql'):
-                filepath = os.path.join(migrations_dir, file)
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                    self._parse_sql_schema(content)
+        # Skip re-parsing when no migration was added, removed or modified
+        stamp = [(name, mtime) for name, mtime, _ in migrations]
+        if stamp == self._migrations_stamp:
+            return
+        self._migrations_stamp = stamp
+        
+        # Parse each migration on its own, in filename order, so an unterminated
+        # CREATE TABLE can't swallow statements from the next file
+        for _, _, path in migrations:
+            self._parse_sql_schema(Path(path).read_text(encoding='utf-8'))
     
     def _parse_sql_schema(self, sql: str):
         """Parse SQL to extract table schemas."""
-        # Simple regex-based parsing
-        create_table_pattern = r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?["`]?(\w+)["`]?\s*\((.*?)\);'
-        
-        for match in re.finditer(create_table_pattern, sql, re.DOTALL | re.IGNORECASE):
+        self.database_schemas.update(self._parse_sql_tables(sql))
+    
+    @_memoized
+    def _parse_sql_tables(self, sql: str) -> Dict[str, Dict]:
+        """Parse CREATE TABLE statements into {table: {'columns': ...}}."""
+        tables = {}
+        # Regex finds each table body; the column list is split by hand so that
+        # commas inside NUMERIC(10,2) or DEFAULT 'a,b' don't end a column
+        for match in _CREATE_TABLE_RE.finditer(sql):
             table_name = match.group(1)
             columns_str = match.group(2)
             
             columns = {}
-            column_pattern = r'["`]?(\w+)["`]?\s+(\w+)(?:\([^)]+\))?([^,]*)'
-            
-            for col_match in re.finditer(column_pattern, columns_str):
-                col_name = col_match.group(1)
-                col_type = col_match.group(2)
-                constraints = col_match.group(3) or ''
+            for definition in _split_top_level_commas(columns_str):
+                parts = definition.split(None, 2)
+                if len(parts) < 2 or parts[0].upper() in _TABLE_CONSTRAINT_KEYWORDS:
+                    continue
+                col_name = parts[0].strip('"`')
+                type_end = 0
+                while type_end < len(parts[1]) and (parts[1][type_end].isalnum() or parts[1][type_end] == '_'):
+                    type_end += 1
+                constraints = parts[2] if len(parts) > 2 else ''
                 
                 columns[col_name] = {
-                    'type': col_type,
+                    'type': parts[1][:type_end],
                     'required': 'NOT NULL' in constraints.upper()
                 }
             
-            self.database_schemas[table_name] = {'columns': columns}
+            tables[table_name] = {'columns': columns}
+        
+        return tables
     
+    @_memoized
     def _extract_database_queries(self, code: str) -> List[Dict]:
         """Extract database queries from code."""
-        queries = []
+        if 'supabase' not in code:
+            return []
         
         # Supabase queries
-        supabase_pattern = r'supabase\s*\.\s*from\s*\(\s*[\'"`](\w+)[\'"`]\s*\)'
-        for match in re.finditer(supabase_pattern, code):
-            table_name = match.group(1)
-            
-            # Look for select fields
-            select_match = re.search(r'\.select\s*\(\s*[\'"`]([^\'"`]+)[\'"`]', code[match.end():match.end()+200])
-            fields = []
-            if select_match:
-                fields = [f.strip() for f in select_match.group(1).split(',')]
-            
-            queries.append({
+        return [
+            {
                 'table': table_name,
-                'fields': fields,
+                'fields': [f.strip() for f in fields_str.split(',')] if fields_str else [],
                 'type': 'select'
-            })
-        
-        return queries
+            }
+            for table_name, fields_str in (match.groups() for match in _SUPABASE_QUERY_RE.finditer(code))
+        ]
     
-    def _find_similar_fields(self, field: str, columns: Dict) -> Optional[str]:
-        """Find similar field names using edit distance."""
+    def _find_similar_fields(self, field: str, columns: Dict,
+                             columns_lower: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Find similar field names using edit distance.
+        
+        columns_lower maps lowercased column names to the originals (first
+        column wins on collisions); pass it when checking several fields
+        against the same table.
+        """
+        if columns_lower is None:
+            columns_lower = _lowercase_index(columns)
         field_lower = field.lower()
-        for col in columns:
-            if field_lower == col.lower():
-                return col
+        
+        # Case-insensitive exact match
+        col = columns_lower.get(field_lower)
+        if col is not None:
+            return col
+        for col_lower, col in columns_lower.items():
             # Simple similarity check
-            if field_lower in col.lower() or col.lower() in field_lower:
+            if field_lower in col_lower or col_lower in field_lower:
                 return col
-        return None
+        
+        # Typos: closest column within a quarter of the field's length
+        best, best_distance = None, max(1, len(field_lower) // 4)
+        for col_lower, col in columns_lower.items():
+            distance = _bounded_levenshtein(field_lower, col_lower, best_distance)
+            if distance is not None and (best is None or distance < best_distance):
+                best, best_distance = col, distance
+        return best
     
+    @_memoized
     def _extract_dependencies(self, code: str) -> List[Dict]:
         """Extract component dependencies from imports."""
         dependencies = []
+        if 'import' not in code:
+            return dependencies
         
         # ES6 imports
-        import_pattern = r'import\s+(?:\{([^}]+)\}|(\w+))\s+from\s+[\'"`]([^\'"`]+)[\'"`]'
-        for match in re.finditer(import_pattern, code):
+        for match in _IMPORT_RE.finditer(code):
             imports = match.group(1) or match.group(2)
             path = match.group(3)
             
             # Determine dependency type
             dep_type = 'module'
             if path.startswith('./') or path.startswith('../'):
-                if 'component' in path.lower():
+                path_lower = path.lower()
+                if 'component' in path_lower:
                     dep_type = 'component'
-                elif 'hook' in path.lower():
+                elif 'hook' in path_lower:
                     dep_type = 'hook'
-                elif 'util' in path.lower() or 'helper' in path.lower():
+                elif 'util' in path_lower or 'helper' in path_lower:
                     dep_type = 'util'
             
-            for imp in imports.split(','):
-                dependencies.append({
-                    'name': imp.strip(),
-                    'type': dep_type,
-                    'path': path
-                })
+            dependencies.extend({'name': imp.strip(), 'type': dep_type, 'path': path}
+                                for imp in imports.split(','))
         
         return dependencies
     
+    def _dir_index(self, rel_dirs: Tuple[str, ...],
+                   recursive: bool) -> Tuple[frozenset, Tuple[str, ...]]:
+        """Return (stems, names) of the files under rel_dirs, cached.
+        
+        The listing is reused until the mtime of one of the scanned
+        directories changes, so repeated lookups cost a stat per directory
+        instead of a fresh listing.
+        """
+        key = (rel_dirs, recursive)
+        cached = self._fs_index.get(key)
+        if cached is not None and all(_mtime(path) == mtime for path, mtime in cached[0]):
+            return cached[1], cached[2]
+        
+        stamps = []
+        names = []
+        for rel_dir in rel_dirs:
+            dir_path = os.path.join(self.project_root, rel_dir)
+            stamps.append((dir_path, _mtime(dir_path)))
+            if not os.path.isdir(dir_path):
+                continue
+            if recursive:
+                for root, dirs, files in os.walk(dir_path):
+                    dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+                    if root != dir_path:
+                        stamps.append((root, _mtime(root)))
+                    names.extend(files)
+            else:
+                names.extend(os.listdir(dir_path))
+        
+        stems = frozenset(name.split('.', 1)[0] for name in names)
+        names = tuple(names)
+        self._fs_index[key] = (tuple(stamps), stems, names)
+        return stems, names
+    
+    def _name_in_dirs(self, name: str, rel_dirs: Tuple[str, ...], recursive: bool) -> bool:
+        """Check whether any file name under rel_dirs contains name."""
+        stems, names = self._dir_index(rel_dirs, recursive)
+        # Exact stem hits are the common case; fall back to substring matching
+        return name in stems or any(name in file for file in names)
+    
     def _component_exists(self, name: str) -> bool:
         """Check if component exists in project."""
-        # Simple file existence check
-        component_dirs = ['components', 'app']
-        for dir in component_dirs:
-            dir_path = os.path.join(self.project_root, dir)
-            if os.path.exists(dir_path):
-                for root, dirs, files in os.walk(dir_path):
-                    for file in files:
-                        if name in file:
-                            return True
-        return False
+        return self._name_in_dirs(name, ('components', 'app'), recursive=True)
     
     def _hook_exists(self, name: str) -> bool:
         """Check if hook exists."""
-        hooks_dir = os.path.join(self.project_root, 'hooks')
-        if os.path.exists(hooks_dir):
-            for file in os.listdir(hooks_dir):
-                if name in file:
-                    return True
-        return False
+        return self._name_in_dirs(name, ('hooks',), recursive=False)
     
     def _util_exists(self, name: str) -> bool:
         """Check if utility exists."""
-        util_dirs = ['lib', 'utils', 'helpers']
-        for dir in util_dirs:
-            dir_path = os.path.join(self.project_root, dir)
-            if os.path.exists(dir_path):
-                for file in os.listdir(dir_path):
-                    if name in file:
-                        return True
-        return False
+        return self._name_in_dirs(name, ('lib', 'utils', 'helpers'), recursive=False)
     
     def _check_circular_dependencies(self, component: str, 
                                    dependencies: List[Dict]) -> Optional[List[str]]:
-        """Check for circular dependencies."""
-        # This would require building a full dependency graph
-        # For now, return None
+        """Check for circular dependencies.
+        
+        Uses the graph recorded in component_dependencies by
+        validate_component_dependencies. Returns a cycle through component
+        (starting and ending with it), or None.
+        """
+        version, components = self._scc_cache
+        if version != self._dependency_version:
+            components = {}
+            for scc in _strongly_connected_components(self.component_dependencies):
+                if len(scc) > 1:
+                    members = frozenset(scc)
+                    for node in scc:
+                        components[node] = members
+            self._scc_cache = (self._dependency_version, components)
+        
+        if component in self.component_dependencies.get(component, ()):
+            return [component, component]
+        members = components.get(component)
+        if members is None:
+            return None
+        
+        # Shortest path back to component without leaving its SCC
+        previous = {}
+        queue = deque([component])
+        while queue:
+            node = queue.popleft()
+            for succ in sorted(self.component_dependencies.get(node, ())):
+                if succ == component:
+                    cycle = [component]
+                    while node != component:
+                        cycle.append(node)
+                        node = previous[node]
+                    cycle.append(component)
+                    cycle[1:-1] = reversed(cycle[1:-1])
+                    return cycle
+                if succ in members and succ not in previous:
+                    previous[succ] = node
+                    queue.append(succ)
         return None
     
+    @_memoized
     def _extract_functions(self, code: str) -> List[str]:
         """Extract function names from code."""
+        if TREE_SITTER_AVAILABLE:
+            return _ts_function_names(_JS_PARSER.parse(code.encode('utf-8')).root_node)
+        
         functions = []
         
         # Function declarations
-        func_pattern = r'(?:export\s+)?(?:async\s+)?function\s+(\w+)'
-        functions.extend(re.findall(func_pattern, code))
+        functions.extend(_FUNC_RE.findall(code))
         
         # Arrow functions
-        arrow_pattern = r'(?:export\s+)?const\s+(\w+)\s*='
-        functions.extend(re.findall(arrow_pattern, code))
+        functions.extend(_ARROW_RE.findall(code))
         
         return functions
     
-    def _extract_tested_functions(self, test_code: str) -> List[str]:
-        """Extract functions being tested."""
-        tested = []
-        
-        # Look in describe/it blocks
-        test_pattern = r'(?:describe|it|test)\s*\(\s*[\'"`]([^\'"`]+)[\'"`]'
-        for match in re.finditer(test_pattern, test_code):
-            desc = match.group(1)
-            # Extract function names from descriptions
-            words = desc.split()
-            for word in words:
-                if word[0].islower() and len(word) > 3:
-                    tested.append(word)
-        
-        return tested
\ No newline at end of file
+    def _extract_tested_functions(self, test_code: str,
+                                  component_functions: List[str]) -> Set[str]:
+        """Extract which of component_functions the test code references.
+        
+        A function counts as tested when its name appears as a whole
+        identifier anywhere in the test code (a call, an import or a test
+        description).
+        """
+        names = set(component_functions)
+        if not names:
+            return set()
+        
+        # One alternation over the known names scans the code once and only
+        # materializes the names it finds
+        pattern = re.compile(
+            r'(?<![\w$])(?:' + '|'.join(map(re.escape, sorted(names, key=len, reverse=True))) + r')(?![\w$])'
+        )
+        tested = set()
+        for match in pattern.finditer(test_code):
+            tested.add(match.group())
+            if len(tested) == len(names):
+                break
+        return tested
+
+
+# Validators that read or update state kept in the calling process
+_LOCAL_VALIDATORS = frozenset({'validate_component_dependencies'})
+
+# The validator owned by a validate_batch worker process
+_batch_validator = None
+
+def _init_batch_worker(project_root: str, database_schemas: Dict, migrations_stamp):
+    """Create the worker's validator, seeded with the parent's parsed schemas."""
+    global _batch_validator
+    _batch_validator = CrossAgentValidator(project_root)
+    _batch_validator.database_schemas = database_schemas
+    _batch_validator._migrations_stamp = migrations_stamp
+
+def _run_batch_item(item: Tuple[str, Dict[str, Any]]) -> ValidationResult:
+    """Run one (validator_name, kwargs) item in a worker process."""
+    name, kwargs = item
+    return getattr(_batch_validator, name)(**kwargs)
@@ -6,7 +6,9 @@ import os
 import sys
 import traceback
 import logging
-from typing import Dict, Any, Optional, Callable
+import re
+import string
+from typing import Dict, Any, Optional, Callable, Pattern, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -84,6 +86,58 @@ class ErrorHandler:
         }
     }
     
+    # Keywords identifying each error type, checked in order of precedence
+    ERROR_TYPE_KEYWORDS = {
+        ErrorCategory.API_KEY: (
+            ("missing", ("not found", "not set")),
+            ("invalid", ("invalid", "unauthorized")),
+            ("expired", ("expired",)),
+        ),
+        ErrorCategory.NETWORK: (
+            ("connection", ("connection", "refused")),
+            ("timeout", ("timeout",)),
+            ("rate_limit", ("rate limit", "429")),
+        ),
+        ErrorCategory.FILE_SYSTEM: (
+            ("not_found", ("not found", "no such file")),
+            ("permission", ("permission", "access denied")),
+            ("disk_space", ("no space",)),
+        ),
+        ErrorCategory.TASK_EXECUTION: (
+            ("timeout", ("timeout",)),
+            ("invalid_input", ("invalid",)),
+        ),
+    }
+    
+    # Error type used when no keyword matches
+    DEFAULT_ERROR_TYPES = {
+        ErrorCategory.TASK_EXECUTION: "failed",
+    }
+    
+    # Logger method used for each level
+    LOG_METHOD_NAMES = {
+        ErrorLevel.INFO: 'info',
+        ErrorLevel.WARNING: 'warning',
+        ErrorLevel.ERROR: 'error',
+        ErrorLevel.CRITICAL: 'critical',
+    }
+    
+    # Terminal colors and icons per level
+    COLORS = {
+        ErrorLevel.INFO: '\033[94m',      # Blue
+        ErrorLevel.WARNING: '\033[93m',   # Yellow
+        ErrorLevel.ERROR: '\033[91m',     # Red
+        ErrorLevel.CRITICAL: '\033[95m',  # Magenta
+    }
+    RESET_COLOR = '\033[0m'
+    
+    ICONS = {
+        ErrorLevel.INFO: 'ℹ️ ',
+        ErrorLevel.WARNING: '⚠️ ',
+        ErrorLevel.ERROR: '❌ ',
+        ErrorLevel.CRITICAL: '🚨 ',
+    }
+    
     # API provider URLs for help
     API_URLS = {
         "openai": "https://platform.openai.com/api-keys",
@@ -97,6 +151,15 @@ class ErrorHandler:
         self.log_file = log_file
         self.logger = self._setup_logger()
         
+        # Only emit ANSI colors when stderr is a terminal
+        use_color = hasattr(sys.stderr, 'isatty') and sys.stderr.isatty()
+        reset = self.RESET_COLOR if use_color else ''
+        self._display_affixes = {
+            level: ("\n" + (self.COLORS[level] if use_color else '') + self.ICONS[level],
+                    reset + "\n")
+            for level in ErrorLevel
+        }
+        
     def _setup_logger(self) -> logging.Logger:
         """Set up logging configuration"""
         logger = logging.getLogger("maf.errors")
@@ -127,17 +190,22 @@ class ErrorHandler:
                     context: Dict[str, Any],
                     level: ErrorLevel = ErrorLevel.ERROR) -> str:
         """Handle an error with user-friendly messaging"""
-        # Get appropriate error message template
-        message_template = self._get_error_message(error, category, context)
+        # Stringify the error once for matching, messages and suggestions
+        error_str = str(error)
+        error_text = error_str.lower()
         
-        # Format the message with context
-        try:
-            user_message = message_template.format(**context)
-        except KeyError:
-            user_message = f"{category.value} error: {str(error)}"
+        # Render the precompiled template for this error type, if any
+        error_type = self._identify_error_type(error, category, context, error_text)
+        tokens = _COMPILED_MESSAGES.get((category, error_type))
+        if tokens is None:
+            user_message = error_str
+        else:
+            user_message = _render_template(tokens, context)
+            if user_message is None:
+                user_message = f"{category.value} error: {error_str}"
             
         # Add helpful suggestions
-        suggestion = self._get_suggestion(error, category, context)
+        suggestion = self._get_suggestion(error, category, context, error_text)
         if suggestion:
             user_message += f"\n💡 {suggestion}"
             
@@ -159,154 +227,137 @@ class ErrorHandler:
         
         return message
         
-    def _identify_error_type(self, error: Exception, category: ErrorCategory, context: Dict[str, Any]) -> str:
+    def _identify_error_type(self, error: Exception, category: ErrorCategory, context: Dict[str, Any],
+                             error_text: Optional[str] = None) -> str:
         """Identify specific error type within category"""
-        error_str = str(error).lower()
+        matcher = _ERROR_TYPE_MATCHERS.get(category)
+        if matcher is None:
+            return "unknown"
         
-        if category == ErrorCategory.API_KEY:
-            if "not found" in error_str or "not set" in error_str:
-                return "missing"
-            elif "invalid" in error_str or "unauthorized" in error_str:
-                return "invalid"
-            elif "expired" in error_str:
-                return "expired"
-                
-        elif category == ErrorCategory.NETWORK:
-            if "connection" in error_str or "refused" in error_str:
-                return "connection"
-            elif "timeout" in error_str:
-                return "timeout"
-            elif "rate limit" in error_str or "429" in error_str:
-                return "rate_limit"
-                
-        elif category == ErrorCategory.FILE_SYSTEM:
-            if "not found" in error_str or "no such file" in error_str:
-                return "not_found"
-            elif "permission" in error_str or "access denied" in error_str:
-                return "permission"
-            elif "no space" in error_str:
-                return "disk_space"
-                
-        elif category == ErrorCategory.TASK_EXECUTION:
-            if "timeout" in error_str:
-                return "timeout"
-            elif "invalid" in error_str:
-                return "invalid_input"
-            else:
-                return "failed"
-                
-        return "unknown"
+        # One scan over the message; the type listed first in
+        # ERROR_TYPE_KEYWORDS wins wherever its keyword appears
+        pattern, priority = matcher
+        best_type, best_rank = None, len(priority)
+        if error_text is None:
+            error_text = str(error).lower()
+        for match in pattern.finditer(error_text):
+            rank = priority[match.lastgroup]
+            if rank < best_rank:
+                best_type, best_rank = match.lastgroup, rank
+                if rank == 0:
+                    break
+                    
+        if best_type is not None:
+            return best_type
+        return self.DEFAULT_ERROR_TYPES.get(category, "unknown")
         
-    def _get_suggestion(self, error: Exception, category: ErrorCategory, context: Dict[str, Any]) -> Optional[str]:
+    def _get_suggestion(self, error: Exception, category: ErrorCategory, context: Dict[str, Any],
+                        error_text: Optional[str] = None) -> Optional[str]:
         """Get helpful suggestion for the error"""
-        suggestions = {
-            ErrorCategory.API_KEY: self._get_api_key_suggestion,
-            ErrorCategory.NETWORK: self._get_network_suggestion,
-            ErrorCategory.FILE_SYSTEM: self._get_file_suggestion,
-            ErrorCategory.CONFIGURATION: self._get_config_suggestion,
-            ErrorCategory.TASK_EXECUTION: self._get_task_suggestion,
-            ErrorCategory.AGENT_COMMUNICATION: self._get_agent_suggestion,
-            ErrorCategory.DEPENDENCY: self._get_dependency_suggestion,
-        }
-        
-        handler = suggestions.get(category)
+        handler = self._SUGGESTION_DISPATCH.get(category)
         if handler:
-            return handler(error, context)
+            return handler(self, error, context, error_text)
             
         return None
         
-    def _get_api_key_suggestion(self, error: Exception, context: Dict[str, Any]) -> str:
+    def _get_api_key_suggestion(self, error: Exception, context: Dict[str, Any],
+                                error_text: Optional[str] = None) -> str:
         """Get suggestion for API key errors"""
+        if error_text is None:
+            error_text = str(error).lower()
         provider = context.get('provider', 'your provider')
         
-        if 'missing' in str(error).lower():
+        if 'missing' in error_text:
             return f"Set your API key: export {context.get('key_name', 'API_KEY')}=your_key_here"
-        elif 'invalid' in str(error).lower():
+        elif 'invalid' in error_text:
             url = self.API_URLS.get(provider.lower(), "your provider's dashboard")
             return f"Get a new API key from: {url}"
             
         return "Check your API key configuration"
         
-    def _get_network_suggestion(self, error: Exception, context: Dict[str, Any]) -> str:
+    def _get_network_suggestion(self, error: Exception, context: Dict[str, Any],
+                                error_text: Optional[str] = None) -> str:
         """Get suggestion for network errors"""
-        if 'timeout' in str(error).lower():
+        if error_text is None:
+            error_text = str(error).lower()
+        if 'timeout' in error_text:
             return "Try again in a few moments or check service status"
-        elif 'connection' in str(error).lower():
+        elif 'connection' in error_text:
             return "Check your internet connection and firewall settings"
-        elif 'rate limit' in str(error).lower():
+        elif 'rate limit' in error_text:
             return "Consider implementing request throttling or upgrading your plan"
             
         return "Check network connectivity and service availability"
         
-    def _get_file_suggestion(self, error: Exception, context: Dict[str, Any]) -> str:
+    def _get_file_suggestion(self, error: Exception, context: Dict[str, Any],
+                             error_text: Optional[str] = None) -> str:
         """Get suggestion for file system errors"""
-        if 'not found' in str(error).lower():
+        if error_text is None:
+            error_text = str(error).lower()
+        if 'not found' in error_text:
             return "Verify the file path and ensure the file exists"
-        elif 'permission' in str(error).lower():
+        elif 'permission' in error_text:
             return "Try running with appropriate permissions or check file ownership"
             
         return "Check file system permissions and available space"
         
-    def _get_config_suggestion(self, error: Exception, context: Dict[str, Any]) -> str:
+    def _get_config_suggestion(self, error: Exception, context: Dict[str, Any],
+                               error_text: Optional[str] = None) -> str:
         """Get suggestion for configuration errors"""
         return "Run 'maf init' to create a default configuration"
         
-    def _get_task_suggestion(self, error: Exception, context: Dict[str, Any]) -> str:
+    def _get_task_suggestion(self, error: Exception, context: Dict[str, Any],
+                             error_text: Optional[str] = None) -> str:
         """Get suggestion for task execution errors"""
         return "Try breaking down the task into smaller steps or check task requirements"
         
-    def _get_agent_suggestion(self, error: Exception, context: Dict[str, Any]) -> str:
+    def _get_agent_suggestion(self, error: Exception, context: Dict[str, Any],
+                              error_text: Optional[str] = None) -> str:
         """Get suggestion for agent communication errors"""
         agent_name = context.get('agent_name', 'the agent')
         return f"Ensure {agent_name} is running and properly configured"
         
-    def _get_dependency_suggestion(self, error: Exception, context: Dict[str, Any]) -> str:
+    def _get_dependency_suggestion(self, error: Exception, context: Dict[str, Any],
+                                   error_text: Optional[str] = None) -> str:
         """Get suggestion for dependency errors"""
         package = context.get('package', 'the required package')
         return f"Install with: pip install {package}"
         
+    # Suggestion helper per category, built once with the class
+    _SUGGESTION_DISPATCH = {
+        ErrorCategory.API_KEY: _get_api_key_suggestion,
+        ErrorCategory.NETWORK: _get_network_suggestion,
+        ErrorCategory.FILE_SYSTEM: _get_file_suggestion,
+        ErrorCategory.CONFIGURATION: _get_config_suggestion,
+        ErrorCategory.TASK_EXECUTION: _get_task_suggestion,
+        ErrorCategory.AGENT_COMMUNICATION: _get_agent_suggestion,
+        ErrorCategory.DEPENDENCY: _get_dependency_suggestion,
+    }
+        
     def _log_error(self, error: Exception, category: ErrorCategory, 
                    context: Dict[str, Any], user_message: str, level: ErrorLevel):
         """Log error with full details"""
         # Log user-friendly message
-        log_method = getattr(self.logger, level.value, self.logger.error)
-        log_method(user_message)
+        getattr(self.logger, self.LOG_METHOD_NAMES[level])(user_message)
         
-        # Log technical details at debug level
-        self.logger.debug(f"Error Category: {category.value}")
-        self.logger.debug(f"Error Type: {type(error).__name__}")
-        self.logger.debug(f"Error Details: {str(error)}")
-        self.logger.debug(f"Context: {context}")
+        # Log technical details at debug level, skipping the formatting
+        # (and the traceback walk) entirely when debug output is off
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+            
+        self.logger.debug("Error Category: %s", category.value)
+        self.logger.debug("Error Type: %s", type(error).__name__)
+        self.logger.debug("Error Details: %s", error)
+        self.logger.debug("Context: %s", context)
         
         # Log full traceback at debug level
-        if level in [ErrorLevel.ERROR, ErrorLevel.CRITICAL]:
-            self.logger.debug("Traceback:\n" + traceback.format_exc())
+        if level in (ErrorLevel.ERROR, ErrorLevel.CRITICAL):
+            self.logger.debug("Traceback:\n%s", traceback.format_exc())
             
     def _display_error(self, message: str, level: ErrorLevel):
         """Display error to user with appropriate formatting"""
-        # Color codes for terminal
-        colors = {
-            ErrorLevel.INFO: '\033[94m',      # Blue
-            ErrorLevel.WARNING: '\033[93m',   # Yellow
-            ErrorLevel.ERROR: '\033[91m',     # Red
-            ErrorLevel.CRITICAL: '\033[95m',  # Magenta
-        }
-        
-        reset_color = '\033[0m'
-        
-        # Icons for different levels
-        icons = {
-            ErrorLevel.INFO: 'ℹ️ ',
-            ErrorLevel.WARNING: '⚠️ ',
-            ErrorLevel.ERROR: '❌ ',
-            ErrorLevel.CRITICAL: '🚨 ',
-        }
-        
-        # Format and display
-        color = colors.get(level, '')
-        icon = icons.get(level, '')
-        
-        print(f"\n{color}{icon}{message}{reset_color}\n", file=sys.stderr)
+        prefix, suffix = self._display_affixes[level]
+        print(prefix + message + suffix, file=sys.stderr)
         
     def wrap_function(self, func: Callable, category: ErrorCategory, 
                      context_provider: Optional[Callable] = None):
@@ -329,6 +380,52 @@ class ErrorHandler:
         return wrapper
 
 
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a message template into (literal, field_name) pairs"""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(template)
+    )
+
+
+def _render_template(tokens: Tuple[Tuple[str, Optional[str]], ...],
+                     context: Dict[str, Any]) -> Optional[str]:
+    """Fill a compiled template from context, or None if a field is missing"""
+    parts = []
+    for literal, field_name in tokens:
+        parts.append(literal)
+        if field_name is not None:
+            if field_name not in context:
+                return None
+            parts.append(str(context[field_name]))
+    return ''.join(parts)
+
+
+# Message templates parsed once at import, keyed by (category, error_type)
+_COMPILED_MESSAGES: Dict[Tuple[ErrorCategory, str], Tuple[Tuple[str, Optional[str]], ...]] = {
+    (category, error_type): _compile_template(template)
+    for category, messages in ErrorHandler.ERROR_MESSAGES.items()
+    for error_type, template in messages.items()
+}
+
+
+def _compile_error_type_matcher(keywords) -> Tuple[Pattern[str], Dict[str, int]]:
+    """Build one alternation with a named group per error type"""
+    pattern = re.compile("|".join(
+        f"(?P<{error_type}>{'|'.join(re.escape(word) for word in words)})"
+        for error_type, words in keywords
+    ))
+    priority = {error_type: rank for rank, (error_type, _) in enumerate(keywords)}
+    return pattern, priority
+
+
+# Keyword matchers per category, keyed like ERROR_TYPE_KEYWORDS
+_ERROR_TYPE_MATCHERS: Dict[ErrorCategory, Tuple[Pattern[str], Dict[str, int]]] = {
+    category: _compile_error_type_matcher(keywords)
+    for category, keywords in ErrorHandler.ERROR_TYPE_KEYWORDS.items()
+}
+
+
 # Global error handler instance
 error_handler = ErrorHandler()
 
@@ -6,16 +6,22 @@ between agents using a publish/subscribe pattern.
 """
 
 import json
+import logging
 import threading
 import queue
 import time
 import uuid
-from typing import Dict, List, Callable, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Deque, Dict, Iterable, List, Callable, Any, Optional, Tuple
 from datetime import datetime
 
 # Import from interface
 from .event_bus_interface import IEventBus, Event, EventType
 
+_log = logging.getLogger("maf.eventbus")
+
 
 class InMemoryEventBus(IEventBus):
     """
@@ -23,15 +29,31 @@ class InMemoryEventBus(IEventBus):
     Implements publish/subscribe pattern with threading support.
     """
     
-    def __init__(self, persist_events: bool = True):
-        self._subscribers: Dict[EventType, List[Callable]] = {}
-        self._event_queue: queue.Queue = queue.Queue()
+    def __init__(self, persist_events: bool = True, max_workers: int = 16):
+        # Handler tuples are replaced, never mutated, so readers need no lock
+        self._subscribers: Dict[EventType, Tuple[Callable, ...]] = {}
+        # Unbounded FIFO without task tracking, which the bus never used
+        self._event_queue: queue.SimpleQueue = queue.SimpleQueue()
         self._running = False
         self._worker_thread: Optional[threading.Thread] = None
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._lock = threading.Lock()
+        self._history_lock = threading.Lock()
         self._persist_events = persist_events
-        self._event_history: List[Event] = []
         self._max_history_size = 1000
+        self._event_history: Deque[Event] = deque(maxlen=self._max_history_size)
+        # Per-type and per-source views of the same history window
+        self._history_by_type: Dict[EventType, Deque[Event]] = {}
+        self._history_by_source: Dict[str, Deque[Event]] = {}
+        # Queued events not yet in history; guarded by _history_lock
+        self._pending_history = 0
+        self._batch_size = 128
+        
+        # Handler failures reported per window before error events are dropped
+        self._handler_errors: Dict[Callable, Tuple[float, int]] = {}
+        self._max_handler_errors = 10
+        self._handler_error_window = 60.0
         
         # Event filters
         self._filters: List[Callable[[Event], bool]] = []
@@ -42,9 +64,11 @@ class InMemoryEventBus(IEventBus):
             return
             
         self._running = True
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                            thread_name_prefix='evbus')
         self._worker_thread = threading.Thread(target=self._process_events, daemon=True)
         self._worker_thread.start()
-        print("EventBus: Started event processing thread")
+        _log.info("EventBus: Started event processing thread")
         
     def stop(self):
         """Stop the event bus"""
@@ -59,8 +83,14 @@ class InMemoryEventBus(IEventBus):
         ))
         
         if self._worker_thread:
+            # Wake the worker even if the shutdown event was not queued
+            self._event_queue.put(None)
             self._worker_thread.join(timeout=5)
-        print("EventBus: Stopped event processing")
+        if self._executor:
+            # Handlers already submitted still run; new ones are refused
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        _log.info("EventBus: Stopped event processing")
         
     def subscribe(self, event_type: EventType, handler: Callable[[Event], None]):
         """
@@ -71,16 +101,16 @@ class InMemoryEventBus(IEventBus):
             handler: Function to call when event occurs
         """
         with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            self._subscribers[event_type].append(handler)
-            print(f"EventBus: Subscribed {handler.__name__} to {event_type.value}")
+            self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (handler,)
+            _log.debug("EventBus: Subscribed %s to %s", handler.__name__, event_type.value)
             
     def unsubscribe(self, event_type: EventType, handler: Callable[[Event], None]):
         """Unsubscribe from events"""
         with self._lock:
-            if event_type in self._subscribers:
-                self._subscribers[event_type].remove(handler)
+            handlers = self._subscribers.get(event_type)
+            if handlers is not None:
+                index = handlers.index(handler)
+                self._subscribers[event_type] = handlers[:index] + handlers[index + 1:]
                 
     def publish(self, event: Event):
         """
@@ -93,8 +123,21 @@ class InMemoryEventBus(IEventBus):
         for filter_func in self._filters:
             if not filter_func(event):
                 return  # Event filtered out
-                
-        self._event_queue.put(event)
+        
+        if not self._persist_events:
+            # Nobody is listening and nothing is recorded: drop the event here
+            if event.type in self._subscribers:
+                self._event_queue.put(event)
+            return
+        
+        with self._history_lock:
+            # Nobody is listening: record the event without a trip through the
+            # worker, unless earlier events still wait to be stored ahead of it
+            if event.type not in self._subscribers and not self._pending_history:
+                self._append_history((event,))
+                return
+            self._pending_history += 1
+            self._event_queue.put(event)
         
     def publish_task_event(self, event_type: EventType, task_id: str, 
                           source: str, data: Optional[Dict] = None):
@@ -119,45 +162,67 @@ class InMemoryEventBus(IEventBus):
         
     def _process_events(self):
         """Worker thread that processes events"""
+        executor = self._executor
         while self._running:
             try:
                 # Wait for event with timeout to allow checking _running flag
                 event = self._event_queue.get(timeout=1)
+                if event is None:
+                    continue  # Wake-up from stop()
+                batch = [event]
+                
+                # Drain whatever else is already queued, up to the batch size
+                while len(batch) < self._batch_size:
+                    try:
+                        event = self._event_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if event is None:
+                        break
+                    batch.append(event)
                 
                 # Store in history
                 if self._persist_events:
-                    self._store_event(event)
-                
-                # Get subscribers for this event type
-                with self._lock:
-                    handlers = self._subscribers.get(event.type, []).copy()
-                
-                if handlers:
-                    print(f"EventBus: Processing {event.type.value} event with {len(handlers)} handlers")
+                    with self._history_lock:
+                        self._append_history(batch)
+                        self._pending_history -= len(batch)
                 
-                # Call each handler in separate thread to prevent blocking
-                for handler in handlers:
-                    threading.Thread(
-                        target=self._safe_handler_call,
-                        args=(handler, event),
-                        daemon=True
-                    ).start()
+                # Look up subscribers once per event type in the batch,
+                # dispatching in publish order
+                debug = _log.isEnabledFor(logging.DEBUG)
+                handlers_by_type: Dict[EventType, Tuple[Callable, ...]] = {}
+                for event in batch:
+                    handlers = handlers_by_type.get(event.type)
+                    if handlers is None:
+                        handlers = self._subscribers.get(event.type, ())
+                        handlers_by_type[event.type] = handlers
+                    
+                    if handlers and debug:
+                        _log.debug("EventBus: Processing %s event with %d handlers",
+                                   event.type.value, len(handlers))
+                    
+                    # Run handlers on the pool so a slow one cannot block the worker
+                    for handler in handlers:
+                        executor.submit(self._safe_handler_call, handler, event)
                     
             except queue.Empty:
                 continue
             except Exception as e:
-                print(f"EventBus: Error processing event: {e}")
+                _log.error("EventBus: Error processing event: %s", e)
                 
     def _safe_handler_call(self, handler: Callable, event: Event):
         """Safely call event handler with error handling"""
         try:
-            # print(f"EventBus: Calling handler {handler.__name__} for {event.type.value}")
             handler(event)
         except Exception as e:
-            print(f"EventBus: Error in handler {handler.__name__}: {e}")
-            import traceback
-            traceback.print_exc()
-            # Publish error event
+            _log.exception("EventBus: Error in handler %s: %s", handler.__name__, e)
+            
+            # Never answer a failed error event with another one, and stop
+            # reporting a handler that keeps failing within the window
+            if event.type == EventType.AGENT_ERROR or not self._record_handler_error(handler):
+                return
+            
+            # Publish error event, identifying the original rather than copying it
             error_event = Event(
                 id=str(uuid.uuid4()),
                 type=EventType.AGENT_ERROR,
@@ -165,34 +230,86 @@ class InMemoryEventBus(IEventBus):
                 timestamp=time.time(),
                 data={
                     "handler": handler.__name__,
-                    "original_event": event.to_dict(),
+                    "original_event_id": event.id,
+                    "original_event_type": event.type.value,
                     "error": str(e)
                 }
             )
-            self._event_queue.put(error_event)
+            self.publish(error_event)
+            
+    def _record_handler_error(self, handler: Callable) -> bool:
+        """Count a handler failure; False once it exceeds the per-window limit"""
+        now = time.monotonic()
+        with self._lock:
+            window_start, count = self._handler_errors.get(handler, (now, 0))
+            if now - window_start > self._handler_error_window:
+                window_start, count = now, 0
+            count += 1
+            self._handler_errors[handler] = (window_start, count)
+        return count <= self._max_handler_errors
             
-    def _store_event(self, event: Event):
-        """Store event in history"""
-        self._event_history.append(event)
+    def _append_history(self, events: Iterable[Event]):
+        """
+        Append events to history and its indexes, evicting the oldest past
+        the cap; caller holds _history_lock
+        """
+        history = self._event_history
+        by_type = self._history_by_type
+        by_source = self._history_by_source
         
-        # Trim history if too large
-        if len(self._event_history) > self._max_history_size:
-            self._event_history = self._event_history[-self._max_history_size:]
+        for event in events:
+            if len(history) == self._max_history_size:
+                # The evicted event is also the oldest entry in its indexes
+                evicted = history[0]
+                self._evict_from_index(by_type, evicted.type)
+                self._evict_from_index(by_source, evicted.source)
+            history.append(event)
+            
+            type_history = by_type.get(event.type)
+            if type_history is None:
+                type_history = by_type[event.type] = deque()
+            type_history.append(event)
+            
+            source_history = by_source.get(event.source)
+            if source_history is None:
+                source_history = by_source[event.source] = deque()
+            source_history.append(event)
+            
+    @staticmethod
+    def _evict_from_index(index: Dict[Any, Deque[Event]], key: Any):
+        """Drop the oldest event under key, removing the key once empty"""
+        events = index[key]
+        events.popleft()
+        if not events:
+            del index[key]
             
     def get_event_history(self, event_type: Optional[EventType] = None,
                          source: Optional[str] = None,
                          since: Optional[float] = None) -> List[Event]:
         """Get filtered event history"""
-        history = self._event_history.copy()
+        # Start from the smallest indexed view, then filter the rest in one pass
+        if event_type and source:
+            type_history = self._history_by_type.get(event_type, ())
+            source_history = self._history_by_source.get(source, ())
+            if len(type_history) <= len(source_history):
+                history, event_type = type_history, None
+            else:
+                history, source = source_history, None
+        elif event_type:
+            history, event_type = self._history_by_type.get(event_type, ()), None
+        elif source:
+            history, source = self._history_by_source.get(source, ()), None
+        else:
+            history = self._event_history
         
-        if event_type:
-            history = [e for e in history if e.type == event_type]
-        if source:
-            history = [e for e in history if e.source == source]
-        if since:
-            history = [e for e in history if e.timestamp >= since]
-            
-        return history
+        if not (event_type or source or since):
+            return list(history)
+        return [
+            e for e in list(history)
+            if (not event_type or e.type == event_type)
+            and (not source or e.source == source)
+            and (not since or e.timestamp >= since)
+        ]
     
     def replay_events(self, events: List[Event]):
         """Replay a list of events (useful for recovery)"""
@@ -217,14 +334,16 @@ _event_bus = None
 _event_bus_lock = threading.Lock()
 
 
+@lru_cache(maxsize=None)
 def get_event_bus() -> InMemoryEventBus:
     """Get the global event bus instance"""
+    # lru_cache makes repeat calls a C-level cache hit; the lock only guards
+    # concurrent first calls, which the cache alone would let both run
     global _event_bus
     
-    if _event_bus is None:
-        with _event_bus_lock:
-            if _event_bus is None:
-                _event_bus = InMemoryEventBus()
-                _event_bus.start()
+    with _event_bus_lock:
+        if _event_bus is None:
+            _event_bus = InMemoryEventBus()
+            _event_bus.start()
     
-    return _event_bus
\ No newline at end of file
+    return _event_bus
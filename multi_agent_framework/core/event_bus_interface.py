@@ -39,6 +39,10 @@ class EventType(Enum):
     
     # Custom events
     CUSTOM = "custom"
+    
+    # Members are singletons compared by identity, so hash by identity too;
+    # Enum's default __hash__ is a Python-level call on every dict lookup
+    __hash__ = object.__hash__
 
 
 @dataclass
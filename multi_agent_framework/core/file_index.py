@@ -0,0 +1,177 @@
+"""
+File Index
+
+Keeps an index of (mtime, path) for files under a set of directories that
+match a predicate, so agents can find their most recently modified context
+files without walking the tree on every task.
+
+When the optional 'watchdog' package is installed the index is built once and
+then kept current from filesystem events. Without it, every snapshot falls
+back to a fresh os.scandir pass.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
+
+# predicate(file_name, directory) -> whether the file belongs in the index
+FilePredicate = Callable[[str, str], bool]
+
+
+def scan_files(roots: Iterable[str], predicate: FilePredicate) -> Dict[str, float]:
+    """
+    Walk roots with os.scandir and return {path: mtime} for matching files.
+    Symlinked directories are not followed, matching os.walk's default.
+    """
+    found = {}
+    pending_dirs = [root for root in roots if os.path.isdir(root)]
+    while pending_dirs:
+        directory = pending_dirs.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    elif predicate(entry.name, directory) and entry.is_file():
+                        found[entry.path] = entry.stat().st_mtime
+        except OSError as e:
+            print(f"ERROR: FileIndex - Could not scan {directory}: {e}")
+    return found
+
+
+class _IndexEventHandler(FileSystemEventHandler):
+    """Forwards watchdog events to the owning FileIndex."""
+
+    def __init__(self, index: 'FileIndex'):
+        super().__init__()
+        self.index = index
+
+    def on_created(self, event):
+        if event.is_directory:
+            self.index._add_tree(event.src_path)
+        else:
+            self.index._update(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.index._update(event.src_path)
+
+    def on_deleted(self, event):
+        self.index._remove(event.src_path)
+
+    def on_moved(self, event):
+        self.index._remove(event.src_path)
+        if event.is_directory:
+            self.index._add_tree(event.dest_path)
+        else:
+            self.index._update(event.dest_path)
+
+
+class FileIndex:
+    """
+    Index of matching files under a set of root directories.
+    """
+
+    def __init__(self, roots: Iterable[str], predicate: FilePredicate):
+        """
+        Initialize the index.
+
+        Args:
+            roots: Directories to index (they need not exist yet)
+            predicate: predicate(file_name, directory) selecting indexed files
+        """
+        self.roots = list(roots)
+        self.predicate = predicate
+        self._files: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._observer: Optional[Observer] = None
+        self._handler: Optional[_IndexEventHandler] = None
+        self._watched_roots: set = set()
+
+    @property
+    def is_watching(self) -> bool:
+        """Whether the index is being kept current by filesystem events."""
+        return self._observer is not None
+
+    def start(self) -> bool:
+        """
+        Build the index and, if watchdog is available, start watching the roots.
+        Returns True when events keep the index current.
+        """
+        with self._lock:
+            self._files = scan_files(self.roots, self.predicate)
+        if not WATCHDOG_AVAILABLE or self._observer is not None:
+            return self.is_watching
+
+        observer = Observer()
+        observer.daemon = True
+        handler = _IndexEventHandler(self)
+        for root in self.roots:
+            if os.path.isdir(root):
+                observer.schedule(handler, root, recursive=True)
+                self._watched_roots.add(root)
+        observer.start()
+        self._observer = observer
+        self._handler = handler
+        return True
+
+    def stop(self):
+        """Stop watching the roots."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+            self._watched_roots.clear()
+
+    def snapshot(self) -> List[Tuple[float, str]]:
+        """
+        Return (mtime, path) for every indexed file.
+        Falls back to a full rescan when events are not available.
+        """
+        if self._observer is None:
+            return [(mtime, path) for path, mtime in scan_files(self.roots, self.predicate).items()]
+
+        # Roots created after start() are not watched yet
+        for root in self.roots:
+            if root not in self._watched_roots and os.path.isdir(root):
+                self._observer.schedule(self._handler, root, recursive=True)
+                self._watched_roots.add(root)
+                self._add_tree(root)
+
+        with self._lock:
+            return [(mtime, path) for path, mtime in self._files.items()]
+
+    def _update(self, path: str):
+        directory, file_name = os.path.split(path)
+        if not self.predicate(file_name, directory):
+            return
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            self._remove(path)
+            return
+        with self._lock:
+            self._files[path] = mtime
+
+    def _add_tree(self, directory: str):
+        found = scan_files([directory], self.predicate)
+        with self._lock:
+            self._files.update(found)
+
+    def _remove(self, path: str):
+        prefix = path + os.sep
+        with self._lock:
+            self._files.pop(path, None)
+            # A removed directory takes its files with it
+            for indexed in [p for p in self._files if p.startswith(prefix)]:
+                del self._files[indexed]
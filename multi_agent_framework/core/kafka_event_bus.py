@@ -280,7 +280,8 @@ class KafkaEventBus(IEventBus):
                 timestamp=time.time(),
                 data={
                     "handler": handler.__name__,
-                    "original_event": event.to_dict(),
+                    "original_event_id": event.id,
+                    "original_event_type": event.type.value,
                     "error": str(e)
                 }
             )
@@ -0,0 +1,220 @@
+"""
+LLM Response Cache
+
+Exact-match, file-backed cache for LLM responses. Entries are keyed on a
+SHA-256 of everything that determines the response (provider, model and
+prompts), so retried or repeated tasks can skip the API call entirely.
+
+SemanticCache complements it for near-duplicate task descriptions by
+comparing term-frequency vectors with cosine similarity.
+
+Both caches are opt-in: set MAF_LLM_CACHE=1 or MAF_SEMANTIC_CACHE=1.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".maf", "llm_cache")
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60  # One week
+
+
+def is_llm_cache_enabled() -> bool:
+    """Whether LLM response caching is turned on via MAF_LLM_CACHE."""
+    return os.getenv('MAF_LLM_CACHE') == '1'
+
+
+def is_semantic_cache_enabled() -> bool:
+    """Whether near-duplicate task caching is turned on via MAF_SEMANTIC_CACHE."""
+    return os.getenv('MAF_SEMANTIC_CACHE') == '1'
+
+
+class LLMCache:
+    """
+    Stores one JSON file per response under cache_dir/<key[:2]>/<key>.json.
+    Tracks hit/miss counters for the lifetime of the instance.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, default_ttl: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (defaults to ~/.maf/llm_cache)
+            default_ttl: Seconds an entry stays valid unless set() overrides it
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a cache key from the values that determine a response."""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss or expiry."""
+        value = None
+        try:
+            with open(self._entry_path(key), 'r') as f:
+                entry = json.load(f)
+            if entry.get('expires_at', 0) > time.time():
+                value = entry.get('value')
+        except (IOError, OSError, json.JSONDecodeError):
+            pass
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        """Store a response under key for ttl seconds (default_ttl if omitted)."""
+        path = self._entry_path(key)
+        entry = {
+            'value': value,
+            'created_at': time.time(),
+            'expires_at': time.time() + (self.default_ttl if ttl is None else ttl)
+        }
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            # Readers never see a partially written entry
+            os.replace(tmp_path, path)
+        except (IOError, OSError) as e:
+            print(f"WARNING: LLMCache failed to store entry {key[:12]}: {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get hit/miss counters."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+
+class SemanticCache:
+    """
+    Returns a stored response when a new task description is close enough to
+    a previous one. Descriptions are compared as L2-normalised term-frequency
+    vectors (stop words dropped), so rewordings that share their key terms
+    match while different requests do not.
+
+    Each cache is scoped to a single file, so agents do not share entries.
+    """
+
+    DEFAULT_THRESHOLD = 0.92
+    MAX_ENTRIES = 256
+
+    _TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+    _STOP_WORDS = frozenset((
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+        "into", "is", "it", "of", "on", "or", "our", "please", "that", "the",
+        "this", "to", "with", "we", "new"
+    ))
+
+    def __init__(self, cache_file: str, threshold: float = DEFAULT_THRESHOLD):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_file: JSON file the entries are persisted to
+            threshold: Minimum cosine similarity for a hit
+        """
+        self.cache_file = cache_file
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: List[Dict[str, Any]] = self._load()
+
+    @classmethod
+    def _vectorize(cls, text: str) -> Dict[str, float]:
+        counts = Counter(token for token in cls._TOKEN_PATTERN.findall(text.lower())
+                         if token not in cls._STOP_WORDS)
+        norm = math.sqrt(sum(count * count for count in counts.values()))
+        return {token: count / norm for token, count in counts.items()} if norm else {}
+
+    @staticmethod
+    def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(weight * b.get(token, 0.0) for token, weight in a.items())
+
+    def _load(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, json.JSONDecodeError):
+            return []
+
+    def _save(self):
+        tmp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.cache_file)
+        except (IOError, OSError) as e:
+            print(f"WARNING: SemanticCache failed to save {self.cache_file}: {e}")
+
+    def get(self, text: str) -> Optional[str]:
+        """Return the response of the most similar stored text above the threshold."""
+        vector = self._vectorize(text)
+        with self._lock:
+            best_score, best_response = 0.0, None
+            if vector:
+                for entry in self._entries:
+                    score = self._cosine(vector, entry['vector'])
+                    if score > best_score:
+                        best_score, best_response = score, entry['response']
+
+            if best_score >= self.threshold:
+                self.hits += 1
+                return best_response
+            self.misses += 1
+            return None
+
+    def set(self, text: str, response: str):
+        """Store a response for text, evicting the oldest entry when full."""
+        vector = self._vectorize(text)
+        if not vector:
+            return
+        with self._lock:
+            self._entries.append({'text': text, 'vector': vector, 'response': response})
+            del self._entries[:-self.MAX_ENTRIES]
+            self._save()
+
+
+# Singleton instance
+_llm_cache: Optional[LLMCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache:
+    """Get or create the process-wide LLM cache instance"""
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMCache()
+    return _llm_cache
@@ -6,10 +6,26 @@ Updated message bus that accepts custom directories instead of hardcoded paths.
 
 import json
 import os
+import threading
 import time
 from typing import Optional, List, Dict
 
 
+# One condition per inbox file, shared by every MessageBus in the process so a
+# send from one agent thread wakes a blocked receive in another.
+_inbox_conditions: Dict[str, threading.Condition] = {}
+_inbox_conditions_lock = threading.Lock()
+
+
+def _get_inbox_condition(inbox_file: str) -> threading.Condition:
+    """Get (or create) the wakeup condition for an inbox file."""
+    with _inbox_conditions_lock:
+        condition = _inbox_conditions.get(inbox_file)
+        if condition is None:
+            condition = _inbox_conditions[inbox_file] = threading.Condition()
+        return condition
+
+
 class MessageBus:
     """
     Handles inter-agent communication using a simple file-based inbox/outbox system.
@@ -19,6 +35,10 @@ class MessageBus:
     INBOX_SUFFIX = "_inbox.json"
     OUTBOX_SUFFIX = "_outbox.json"  # Not currently used but kept for completeness
     
+    # Longest a blocked receive goes without looking at its inbox file, which
+    # is how it sees messages sent from other processes, such as 'maf trigger'
+    CROSS_PROCESS_POLL_INTERVAL = 1.0
+    
     def __init__(self, message_dir: Optional[str] = None):
         """
         Initialize message bus with configurable directory.
@@ -33,6 +53,16 @@ class MessageBus:
     
     def send_message(self, recipient_agent: str, message: dict):
         """Sends a message to a recipient agent's inbox."""
+        self.send_messages(recipient_agent, [message])
+    
+    def send_messages(self, recipient_agent: str, messages: List[Dict]):
+        """
+        Sends several messages to a recipient agent's inbox with a single
+        read-modify-write of the inbox file. Message order is preserved.
+        """
+        if not messages:
+            return
+        
         inbox_file = os.path.join(self.message_dir, f"{recipient_agent}{self.INBOX_SUFFIX}")
         
         # Ensure the inbox file exists and is a valid JSON array
@@ -40,36 +70,88 @@ class MessageBus:
             with open(inbox_file, 'w') as f:
                 json.dump([], f)  # Initialize with an empty list
         
+        condition = _get_inbox_condition(inbox_file)
         try:
-            with open(inbox_file, 'r+') as f:
-                # Try to load existing messages
-                f.seek(0)
-                try:
-                    messages = json.load(f)
-                except json.JSONDecodeError:
-                    # If the file is corrupted, start fresh
-                    messages = []
-                
-                # Add timestamp if not present
-                if 'timestamp' not in message:
-                    message['timestamp'] = time.time()
-                
-                # Append the new message
-                messages.append(message)
-                
-                # Write back to file
-                f.seek(0)
-                f.truncate()
-                json.dump(messages, f, indent=2)
+            with condition:
+                with open(inbox_file, 'r+') as f:
+                    # Try to load existing messages
+                    f.seek(0)
+                    try:
+                        inbox = json.load(f)
+                    except json.JSONDecodeError:
+                        # If the file is corrupted, start fresh
+                        inbox = []
+                    
+                    # Add timestamp if not present
+                    now = time.time()
+                    for message in messages:
+                        if 'timestamp' not in message:
+                            message['timestamp'] = now
+                    
+                    # Append the new messages
+                    inbox.extend(messages)
+                    
+                    # Write back to file
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(inbox, f, indent=2)
                 
-            print(f"Message sent to {recipient_agent}: Type='{message.get('type')}', TaskID='{message.get('task_id')}'")
+                # Wake any receiver blocked on this inbox
+                condition.notify_all()
+            
+            for message in messages:
+                print(f"Message sent to {recipient_agent}: Type='{message.get('type')}', TaskID='{message.get('task_id')}'")
             
         except (IOError, json.JSONDecodeError) as e:
             print(f"ERROR: MessageBus failed to send message to {recipient_agent} at {inbox_file}: {e}")
     
-    def receive_messages(self, agent_name: str) -> List[Dict]:
-        """Receives messages from the agent's inbox and clears it."""
+    def receive_messages(self, agent_name: str, block: bool = False,
+                         timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Receives messages from the agent's inbox and clears it.
+        
+        Args:
+            agent_name: Agent whose inbox to read
+            block: If the inbox is empty, wait until a message is sent or the
+                timeout expires. Sends from this process wake the receiver at
+                once; sends from other processes are noticed within
+                CROSS_PROCESS_POLL_INTERVAL seconds.
+            timeout: Maximum seconds to block (None waits indefinitely)
+        """
         inbox_file = os.path.join(self.message_dir, f"{agent_name}{self.INBOX_SUFFIX}")
+        if not block:
+            return self._read_inbox(agent_name, inbox_file)
+        
+        # Holding the condition across read and wait means a send cannot slip
+        # in between them unnoticed. Writers in other processes do not notify,
+        # so the wait is cut into short slices that check the inbox file.
+        condition = _get_inbox_condition(inbox_file)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with condition:
+            messages = self._read_inbox(agent_name, inbox_file)
+            while not messages:
+                wait = self.CROSS_PROCESS_POLL_INTERVAL
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    wait = min(wait, remaining)
+                condition.wait(wait)
+                if self._inbox_has_messages(inbox_file):
+                    messages = self._read_inbox(agent_name, inbox_file)
+        return messages
+    
+    @staticmethod
+    def _inbox_has_messages(inbox_file: str) -> bool:
+        """Cheap check for a non-empty inbox, without reading or rewriting it."""
+        try:
+            # An inbox holding any message is at least 3 bytes ("[1]")
+            return os.stat(inbox_file).st_size > 2
+        except OSError:
+            return False
+    
+    def _read_inbox(self, agent_name: str, inbox_file: str) -> List[Dict]:
+        """Read and clear an inbox file."""
         messages = []
         
         if os.path.exists(inbox_file):
@@ -102,12 +184,15 @@ class MessageBus:
         """
         for agent_name in agent_names:
             inbox_file = os.path.join(self.message_dir, f"{agent_name}{self.INBOX_SUFFIX}")
-            if not os.path.exists(inbox_file):
-                try:
-                    with open(inbox_file, 'w') as f:
-                        json.dump([], f)
-                except IOError as e:
-                    print(f"ERROR: Failed to initialize inbox for {agent_name}: {e}")
+            # Exclusive create: one open() that fails harmlessly when the inbox
+            # already exists, instead of an exists() check followed by a write
+            try:
+                with open(inbox_file, 'x') as f:
+                    f.write('[]')
+            except FileExistsError:
+                pass
+            except IOError as e:
+                print(f"ERROR: Failed to initialize inbox for {agent_name}: {e}")
     
     def clear_all_messages(self):
         """Clear all message queues (useful for testing or reset)."""
@@ -125,14 +210,23 @@ class MessageBus:
         """Get the status of all message queues."""
         status = {}
         
-        if os.path.exists(self.message_dir):
-            for filename in os.listdir(self.message_dir):
-                if filename.endswith(self.INBOX_SUFFIX):
-                    agent_name = filename[:-len(self.INBOX_SUFFIX)]
-                    filepath = os.path.join(self.message_dir, filename)
+        try:
+            entries = os.scandir(self.message_dir)
+        except FileNotFoundError:
+            return status
+        
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(self.INBOX_SUFFIX):
+                    agent_name = entry.name[:-len(self.INBOX_SUFFIX)]
                     
                     try:
-                        with open(filepath, 'r') as f:
+                        # An inbox holding any message is at least 3 bytes
+                        # ("[1]"), so idle inboxes are counted without parsing
+                        if entry.stat().st_size <= 2:
+                            status[agent_name] = 0
+                            continue
+                        with open(entry.path, 'r') as f:
                             messages = json.load(f)
                             status[agent_name] = len(messages)
                     except:
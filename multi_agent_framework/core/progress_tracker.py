@@ -5,11 +5,18 @@ Progress tracking system for the Multi-Agent Framework
 import time
 import json
 import os
+import threading
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 import click
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ProgressTracker:
     """Track and display progress of tasks and features"""
@@ -32,15 +39,22 @@ class ProgressTracker:
     def _load_state(self) -> Dict:
         """Load state from file"""
         try:
-            with open(self.state_file, 'r') as f:
-                return json.load(f)
+            data = self.state_file.read_bytes()
+            # 'trigger --wait' re-reads the state on every change, so use
+            # orjson's faster parser when it is installed
+            if ORJSON_AVAILABLE:
+                return orjson.loads(data)
+            return json.loads(data)
         except:
             return {'features': {}, 'tasks': {}, 'agents': {}}
             
     def _save_state(self, state: Dict):
         """Save state to file"""
-        with open(self.state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        if ORJSON_AVAILABLE:
+            self.state_file.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.state_file, 'w') as f:
+                json.dump(state, f, indent=2)
             
     def create_feature(self, feature_id: str, description: str) -> None:
         """Create a new feature to track"""
@@ -128,8 +142,10 @@ class ProgressTracker:
         
     def get_feature_progress(self, feature_id: str) -> Dict:
         """Get progress information for a feature"""
-        state = self._load_state()
+        return self._feature_progress(self._load_state(), feature_id)
         
+    def _feature_progress(self, state: Dict, feature_id: str) -> Dict:
+        """Progress information for a feature in an already loaded state"""
         if feature_id not in state['features']:
             return None
             
@@ -150,8 +166,8 @@ class ProgressTracker:
         state = self._load_state()
         features = []
         
-        for feature_id, feature in state['features'].items():
-            feature_data = self.get_feature_progress(feature_id)
+        for feature_id in state['features']:
+            feature_data = self._feature_progress(state, feature_id)
             if feature_data:
                 features.append(feature_data)
                 
@@ -159,6 +175,14 @@ class ProgressTracker:
         features.sort(key=lambda x: x['feature']['created_at'], reverse=True)
         return features
         
+    def get_latest_progress(self) -> Optional[int]:
+        """Progress of the most recently created feature, or None if there are none"""
+        features = self._load_state()['features'].values()
+        if not features:
+            return None
+        # Same feature get_all_features() would list first
+        return max(features, key=lambda f: f['created_at'])['progress']
+        
     def display_progress(self, detailed: bool = False) -> None:
         """Display progress using click with progress bars"""
         features = self.get_all_features()
@@ -261,12 +285,16 @@ class ProgressTracker:
         return active, total
 
 
-# Singleton instance
-_progress_tracker = None
+# One tracker per state file
+_progress_trackers: Dict[str, ProgressTracker] = {}
+_progress_trackers_lock = threading.Lock()
 
 def get_progress_tracker(state_file: str = ".maf/state.json") -> ProgressTracker:
-    """Get or create progress tracker instance"""
-    global _progress_tracker
-    if _progress_tracker is None:
-        _progress_tracker = ProgressTracker(state_file)
-    return _progress_tracker
\ No newline at end of file
+    """Get or create the progress tracker instance for a state file"""
+    key = os.path.abspath(state_file)
+    with _progress_trackers_lock:
+        tracker = _progress_trackers.get(key)
+        if tracker is None:
+            tracker = ProgressTracker(key)
+            _progress_trackers[key] = tracker
+        return tracker
\ No newline at end of file
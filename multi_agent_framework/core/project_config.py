@@ -66,13 +66,12 @@ class ProjectConfig:
         """Load configuration from file or create default."""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    config = self.DEFAULT_CONFIG.copy()
-                    config.update(loaded_config)
-                    config["project_root"] = self.project_root
-                    return config
+                loaded_config = json.loads(Path(self.config_path).read_text(encoding='utf-8'))
+                # Merge with defaults to ensure all keys exist
+                config = self.DEFAULT_CONFIG.copy()
+                config.update(loaded_config)
+                config["project_root"] = self.project_root
+                return config
             except Exception as e:
                 print(f"Warning: Failed to load config from {self.config_path}: {e}")
                 print("Using default configuration")
@@ -90,10 +89,9 @@ class ProjectConfig:
     def save_config(self):
         """Save current configuration to file."""
         try:
-            with open(self.config_path, 'w') as f:
-                # Don't save project_root as it should be dynamic
-                config_to_save = {k: v for k, v in self.config.items() if k != "project_root"}
-                json.dump(config_to_save, f, indent=2)
+            # Don't save project_root as it should be dynamic
+            config_to_save = {k: v for k, v in self.config.items() if k != "project_root"}
+            Path(self.config_path).write_text(json.dumps(config_to_save, indent=2), encoding='utf-8')
             print(f"Configuration saved to {self.config_path}")
         except Exception as e:
             print(f"Error saving configuration: {e}")
@@ -109,15 +107,15 @@ class ProjectConfig:
         # React detection
         if "package.json" in project_files:
             try:
-                with open(os.path.join(self.project_root, "package.json"), 'r') as f:
-                    package_json = json.load(f)
-                    deps = package_json.get("dependencies", {})
-                    if "react" in deps:
-                        return "react"
-                    if "vue" in deps:
-                        return "vue"
-                    if "angular" in deps:
-                        return "angular"
+                package_json = json.loads(
+                    Path(self.project_root, "package.json").read_text(encoding='utf-8'))
+                deps = package_json.get("dependencies", {})
+                if "react" in deps:
+                    return "react"
+                if "vue" in deps:
+                    return "vue"
+                if "angular" in deps:
+                    return "angular"
             except:
                 pass
         
@@ -125,7 +123,7 @@ class ProjectConfig:
         if "requirements.txt" in project_files or "setup.py" in project_files:
             if "manage.py" in project_files:
                 return "django"
-            if any(f.endswith(".py") and "flask" in open(os.path.join(self.project_root, f)).read().lower() 
+            if any("flask" in Path(self.project_root, f).read_text(encoding='utf-8', errors='ignore').lower()
                    for f in project_files if f.endswith(".py")):
                 return "flask"
             return "python"
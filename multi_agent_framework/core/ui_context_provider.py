@@ -0,0 +1,144 @@
+"""
+UI Context Provider
+
+Builds the "existing UI" context that UX/UI agents send to the LLM: the most
+recently modified UI-related files under a project's app/, components/ and
+public/ directories.
+
+There is one provider per project root per process, so any number of UX/UI
+agents working on the same project share a single file index and a single
+cached context string instead of each scanning the tree themselves.
+"""
+
+import heapq
+import os
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+from .file_index import FileIndex
+
+
+# Asset types described by name and size in the context instead of being read
+BINARY_EXTS = ('.png', '.jpg', '.svg', '.webp')
+
+# File types considered by is_ui_file
+_UI_FILE_EXTS = ('.tsx', '.jsx', '.ts', '.js', '.css', '.md', '.json', '.png', '.jpg', '.svg', '.webp')
+# A UI file by name alone: Next.js route files, actions.ts, global styles, or a
+# name mentioning a typical UI element (case-insensitive)
+_UI_FILE_NAME_RE = re.compile(
+    r"(?=.*\.(?:tsx|jsx|ts|js|css|md|json|png|jpg|svg|webp)\Z)"
+    r"(?:page\.|layout\.|loading\.|actions\.ts\Z"
+    r"|.*(?:globals\.css|tailwind\.config\.ts|(?i:component|form|hero|logo|avatar)))",
+    re.DOTALL
+)
+# Any file type above inside a 'ui' directory (e.g. components/ui)
+_UI_DIR_RE = re.compile(r"[\\/]ui(?:[\\/]|$)", re.IGNORECASE)
+
+
+def is_ui_file(file_name: str, root: str) -> bool:
+    """Whether a file is a common UI/UX file, component, style or relevant asset."""
+    return bool(_UI_FILE_NAME_RE.match(file_name) or
+                (file_name.endswith(_UI_FILE_EXTS) and _UI_DIR_RE.search(root)))
+
+
+class UIContextProvider:
+    """
+    Indexes the UI files of one project and builds the context string from the
+    most recently modified ones. Safe to share between threads.
+    """
+
+    def __init__(self, project_root: str):
+        """
+        Initialize the provider and start indexing.
+
+        Args:
+            project_root: Root directory of the project
+        """
+        self.project_root = project_root
+
+        # Roots for scanning existing UI/UX related code and assets
+        self.app_scan_root = os.path.abspath(os.path.join(project_root, "app"))
+        self.root_components_scan_root = os.path.abspath(os.path.join(project_root, "components"))
+        self.public_assets_scan_root = os.path.abspath(os.path.join(project_root, "public")) # For existing assets like logos, avatars
+
+        self._lock = threading.RLock()
+
+        # Index of UI-related files, kept current from filesystem events when
+        # watchdog is installed so tasks don't re-walk the scan roots
+        self._file_index = FileIndex(
+            [self.app_scan_root, self.root_components_scan_root, self.public_assets_scan_root],
+            is_ui_file
+        )
+        self._file_index.start()
+
+        # Memoized get_context result, keyed on the (mtime, path) of the files
+        # it was built from
+        self._context_cache_key = None
+        self._context_cache = None
+
+    def stop(self):
+        """Stop watching the project for changes."""
+        self._file_index.stop()
+
+    def get_context(self, max_files: int = 5) -> Tuple[str, Optional[str]]:
+        """
+        Reads and returns the content of the most recently modified UI-related files
+        from the 'app' directory, root 'components', and relevant 'public' assets.
+        Returns (context_string, most_recent_file_path).
+        """
+        with self._lock:
+            # Only the newest few files are used, so select them with a bounded
+            # heap instead of sorting the whole index. The index already holds
+            # each file's mtime, so nothing is stat'd here.
+            recent_files = heapq.nlargest(max(max_files, 1), self._file_index.snapshot(),
+                                          key=lambda item: item[0])
+            most_recent_file_path = recent_files[0][1] if recent_files else None
+
+            # Unchanged paths and mtimes mean the context would be rebuilt identically
+            cache_key = (max_files, tuple(recent_files))
+            if cache_key == self._context_cache_key:
+                return self._context_cache
+
+            context = []
+            for _, file_path in recent_files[:max_files]:
+                try:
+                    if file_path.endswith(BINARY_EXTS):
+                        # For images, just include path and size, never the binary content
+                        content = f"[Binary asset {os.path.basename(file_path)} — {os.path.getsize(file_path)} bytes]"
+                    else:
+                        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                            content = f.read()
+
+                    relative_path = os.path.relpath(file_path, self.project_root)
+                    lang_highlight = "text"
+                    if file_path.endswith(('.tsx', '.ts')): lang_highlight = "typescript"
+                    elif file_path.endswith(('.jsx', '.js')): lang_highlight = "javascript"
+                    elif file_path.endswith('.css'): lang_highlight = "css"
+                    elif file_path.endswith('.json'): lang_highlight = "json"
+                    elif file_path.endswith('.md'): lang_highlight = "markdown"
+
+                    file_context = f"--- Existing File: {relative_path} ---\n```{lang_highlight}\n{content}\n```\n"
+                    context.append(file_context)
+                except Exception as e:
+                    print(f"ERROR: UIContextProvider - Could not read existing UI/UX code from {file_path} for context: {e}")
+
+            self._context_cache_key = cache_key
+            self._context_cache = ("\n".join(context), most_recent_file_path)
+            return self._context_cache
+
+
+# One provider per project root
+_providers: Dict[str, UIContextProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_ui_context_provider(project_root: str) -> UIContextProvider:
+    """Get or create the process-wide UI context provider for a project"""
+    key = os.path.abspath(project_root)
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            provider = UIContextProvider(key)
+            _providers[key] = provider
+        return provider
@@ -201,9 +201,9 @@ def show_migration_status():
     print("\nAgent Implementation Status:")
     print("-" * 50)
     
-    for agent_type in AgentFactory.AGENT_MAPPINGS:
-        polling_module, _ = AgentFactory.AGENT_MAPPINGS[agent_type]['polling']
-        event_module, _ = AgentFactory.AGENT_MAPPINGS[agent_type].get('event_driven', ('', ''))
+    for agent_type, impl in AgentFactory.AGENT_MAPPINGS.items():
+        polling_module = impl.polling_mod
+        event_module = impl.event_mod
         
         # Check if files exist
         polling_exists = False
@@ -13,7 +13,9 @@ from multi_agent_framework.agents.specialized.db_agent import DbAgent
 from multi_agent_framework.agents.specialized.devops_agent import DevopsAgent
 from multi_agent_framework.agents.specialized.qa_agent import QaAgent
 from multi_agent_framework.agents.specialized.docs_agent import DocsAgent
-from multi_agent_framework.agents.specialized.security_agent import SecurityAgent
+from multi_agent_framework.agents.specialized.security_agent import (
+    SecurityAgent, TaskKind, _mentions_modification
+)
 from multi_agent_framework.agents.specialized.ux_ui_agent import UxUiAgent
 
 
@@ -531,6 +533,24 @@ def security_headers(response):
             self.assertIn('security', sent_msg['output'].lower())
 
 
+class TestSecurityTaskClassification(TestCase):
+    """Test SecurityAgent task classification"""
+    
+    def test_classify_task(self):
+        """Test RLS, modification and new security tasks are told apart"""
+        self.assertEqual(SecurityAgent._classify_task("Add RLS policies for photos"), TaskKind.RLS)
+        self.assertEqual(SecurityAgent._classify_task("Enable Row Level Security"), TaskKind.RLS)
+        self.assertEqual(SecurityAgent._classify_task("Update RLS on members"), TaskKind.RLS)
+        self.assertEqual(SecurityAgent._classify_task("Revise the auth report"), TaskKind.MODIFICATION)
+        self.assertEqual(SecurityAgent._classify_task("Audit the Stripe webhook"), TaskKind.NEW)
+
+    def test_mentions_modification(self):
+        """Test retries of RLS tasks that modify existing work still count as modifications"""
+        self.assertTrue(_mentions_modification("update rls on members"))
+        self.assertTrue(_mentions_modification("revise the auth report"))
+        self.assertFalse(_mentions_modification("add rls policies for photos"))
+
+
 class TestUxUiAgent(TestSpecializedAgentsBase):
     """Test UxUiAgent functionality"""
     
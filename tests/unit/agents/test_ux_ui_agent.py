@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Tests for the polling-mode UxUiAgent
+"""
+import os
+import json
+import tempfile
+import shutil
+from unittest import TestCase
+from unittest.mock import patch
+
+from multi_agent_framework.agents.specialized.ux_ui_agent import UxUiAgent, TaskClass
+from multi_agent_framework.core.project_config import ProjectConfig
+from multi_agent_framework.core.ui_context_provider import is_ui_file
+
+
+class TestUxUiAgent(TestCase):
+    """Test UxUiAgent prompt building and context gathering"""
+
+    def setUp(self):
+        """Create an agent pointed at a temp project"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_patcher = patch.dict(os.environ, {'GEMINI_API_KEY': 'test_key'})
+        self.env_patcher.start()
+        self.agent = UxUiAgent(ProjectConfig(self.temp_dir))
+        # Rescan on every call so files written by a test are seen immediately
+        self.agent._ui_context.stop()
+
+    def tearDown(self):
+        """Clean up temp directory"""
+        self.env_patcher.stop()
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _write(self, relative_path, content=""):
+        """Create a file inside the temp project"""
+        path = os.path.join(self.temp_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_prompt_split_keeps_system_prompt_static(self):
+        """Test the system prompt does not depend on the task or context"""
+        system_a, user_a = self.agent._build_ui_prompts("Create a hero section", "ctx A", False)
+        system_b, user_b = self.agent._build_ui_prompts("Create a pricing table", "", False)
+
+        self.assertEqual(system_a, system_b)
+        self.assertNotIn("hero", system_a)
+        self.assertIn("Create a hero section", user_a)
+        self.assertLess(user_a.index("ctx A"), user_a.index("Create a hero section"))
+        self.assertNotIn("Existing UI/UX Context", user_b)
+
+    def test_prompt_split_modification(self):
+        """Test modification tasks use the modification system prompt"""
+        system_prompt, _ = self.agent._build_ui_prompts("Redesign the hero", "ctx", True)
+
+        self.assertIn("modify an existing UI component", system_prompt)
+
+    def test_generate_ui_elements_passes_system_prompt(self):
+        """Test the static instructions are sent as the system prompt"""
+        with patch.object(self.agent, '_generate_response', return_value="```tsx\nconst A = 1;\n```") as mock_generate:
+            content, _ = self.agent._generate_ui_elements("Create a button")
+
+        self.assertEqual(content, "const A = 1;")
+        self.assertIn("system_prompt", mock_generate.call_args.kwargs)
+        self.assertIn("Create a button", mock_generate.call_args.args[0])
+
+    def test_existing_ui_context_collects_ui_files(self):
+        """Test only UI-related files are gathered, most recent first"""
+        self._write("app/page.tsx", "export default function Page() {}")
+        self._write("app/lib/db.ts", "export const db = null;")
+        hero = self._write("components/Hero.tsx", "export const Hero = () => null;")
+        os.utime(hero, (2000000000, 2000000000))
+
+        context, most_recent = self.agent._get_existing_ui_context()
+
+        self.assertEqual(most_recent, hero)
+        self.assertIn("app/page.tsx", context)
+        self.assertNotIn("db.ts", context)
+        self.assertLess(context.index("Hero.tsx"), context.index("page.tsx"))
+
+    def test_is_ui_file(self):
+        """Test the UI file predicate by file name and directory"""
+        app = os.path.join(self.temp_dir, "app")
+        ui_dir = os.path.join(self.temp_dir, "components", "ui")
+
+        for name in ("page.tsx", "layout.js", "actions.ts", "globals.css", "LoginForm.tsx", "HeroBanner.jsx", "logo.svg"):
+            self.assertTrue(is_ui_file(name, app), name)
+        for name in ("page.py", "db.ts", "actions.tsx.bak", "README.txt"):
+            self.assertFalse(is_ui_file(name, app), name)
+
+        self.assertTrue(is_ui_file("button.tsx", ui_dir))
+        self.assertFalse(is_ui_file("button.py", ui_dir))
+        self.assertFalse(is_ui_file("button.tsx", os.path.join(self.temp_dir, "build")))
+
+    def test_agents_share_ui_context_per_project(self):
+        """Test agents on the same project share one context provider"""
+        other = UxUiAgent(ProjectConfig(self.temp_dir))
+
+        self.assertIs(other._ui_context, self.agent._ui_context)
+
+        self._write("app/page.tsx", "shared")
+        context, _ = self.agent._get_existing_ui_context()
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            self.assertEqual(other._get_existing_ui_context()[0], context)
+
+    def test_existing_ui_context_is_memoized_until_files_change(self):
+        """Test unchanged files are not re-read, and edits invalidate the cache"""
+        page = self._write("app/page.tsx", "first")
+        first_context, _ = self.agent._get_existing_ui_context()
+
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            self.assertEqual(self.agent._get_existing_ui_context()[0], first_context)
+
+        with open(page, 'w') as f:
+            f.write("second")
+        os.utime(page, (2000000000, 2000000000))
+
+        self.assertIn("second", self.agent._get_existing_ui_context()[0])
+
+    def test_existing_ui_context_does_not_open_images(self):
+        """Test image assets are described by size without being read"""
+        logo = self._write("public/logo.png", "12345")
+        os.utime(logo, (2000000000, 2000000000))
+        page = self._write("app/page.tsx")
+        with open(page, 'wb') as f:
+            f.write(b"caf\xff")
+
+        real_open = open
+
+        def guarded_open(path, *args, **kwargs):
+            if path == logo:
+                raise AssertionError("image opened")
+            return real_open(path, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=guarded_open):
+            context, _ = self.agent._get_existing_ui_context()
+
+        self.assertIn("[Binary asset logo.png — 5 bytes]", context)
+        self.assertIn("caf\ufffd", context)
+
+    def test_existing_ui_context_is_truncated_oldest_first(self):
+        """Test an oversized context keeps the most recent file and drops older ones"""
+        self._write("app/page.tsx", "old " * 100)
+        hero = self._write("components/Hero.tsx", "new " * 100)
+        os.utime(hero, (2000000000, 2000000000))
+        self.agent.MAX_CONTEXT_CHARS = 300
+
+        context, _ = self.agent._get_existing_ui_context()
+
+        self.assertIn("new " * 100, context)
+        self.assertNotIn("page.tsx", context)
+        self.assertIn("1 older file(s) omitted", context)
+
+    def test_max_tokens_sized_by_task(self):
+        """Test the output token budget depends on the kind of artifact requested"""
+        small_target = self._write("components/Hero.tsx", "x" * 2400)
+        large_target = self._write("components/Pricing.tsx", "x" * 40000)
+
+        component = TaskClass(is_modification=False, is_markdown=False)
+        markdown = TaskClass(is_modification=False, is_markdown=True)
+        modification = TaskClass(is_modification=True, is_markdown=False)
+
+        self.assertEqual(self.agent._estimate_max_tokens(component), UxUiAgent.MAX_TOKENS_COMPONENT)
+        self.assertEqual(self.agent._estimate_max_tokens(markdown), UxUiAgent.MAX_TOKENS_MARKDOWN)
+        self.assertEqual(self.agent._estimate_max_tokens(modification), UxUiAgent.MAX_TOKENS_COMPONENT)
+        self.assertEqual(self.agent._estimate_max_tokens(modification, small_target), 900)
+        self.assertEqual(self.agent._estimate_max_tokens(modification, large_target), UxUiAgent.MAX_TOKENS_LIMIT)
+
+    def test_classify_task(self):
+        """Test a task description is classified once into modification and Markdown flags"""
+        self.assertEqual(UxUiAgent._classify_task("Redesign the checkout Flow"),
+                         TaskClass(is_modification=True, is_markdown=True))
+        self.assertEqual(UxUiAgent._classify_task("Create a pricing card"),
+                         TaskClass(is_modification=False, is_markdown=False))
+
+    def test_llm_cache_skips_repeated_calls(self):
+        """Test an identical request is served from the LLM cache when enabled"""
+        from multi_agent_framework.core.llm_cache import LLMCache
+
+        cache = LLMCache(os.path.join(self.temp_dir, 'llm_cache'))
+        with patch.dict(os.environ, {'MAF_LLM_CACHE': '1'}), \
+             patch('multi_agent_framework.agents.specialized.ux_ui_agent.get_llm_cache', return_value=cache), \
+             patch.object(self.agent, '_generate_response', return_value="<Button />") as mock_generate:
+            first, _ = self.agent._generate_ui_elements("Create a button")
+            second, _ = self.agent._generate_ui_elements("Create a button")
+
+        self.assertEqual(first, second)
+        mock_generate.assert_called_once()
+        self.assertEqual(cache.hits, 1)
+
+    def test_semantic_cache_reuses_similar_new_tasks(self):
+        """Test a reworded new task reuses the earlier response without an LLM call"""
+        from multi_agent_framework.core.llm_cache import SemanticCache
+
+        self.agent.semantic_cache = SemanticCache(os.path.join(self.temp_dir, 'semcache.json'))
+        with patch.object(self.agent, '_generate_response', return_value="<Hero />") as mock_generate:
+            first, _ = self.agent._generate_ui_elements("Create a hero section")
+            second, _ = self.agent._generate_ui_elements("Create the Hero section")
+            self.agent._generate_ui_elements("Create the hero section", TaskClass(is_modification=True, is_markdown=False))
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_generate.call_count, 2)
+
+    def test_new_tasks_are_batched_into_one_call(self):
+        """Test several pending new tasks share a single LLM call"""
+        messages = [
+            {"type": "new_task", "task_id": "task-aaaa-1", "content": "Create a pricing card"},
+            {"type": "new_task", "task_id": "task-bbbb-2", "content": "Create a footer"},
+            {"type": "new_task", "task_id": "task-cccc-3", "content": "Redesign the header"},
+        ]
+        batched_response = json.dumps([
+            {"task_id": "task-aaaa-1", "content": "<PricingCard />"},
+            {"task_id": "task-bbbb-2", "content": "<Footer />"},
+        ])
+        with patch.object(self.agent, 'state_manager'), \
+             patch.object(self.agent, 'send_message') as mock_send, \
+             patch.object(self.agent, '_generate_response', return_value=batched_response) as mock_generate, \
+             patch.object(self.agent, '_generate_response_stream', return_value=iter(["<Header />"])) as mock_stream:
+            self.agent._process_messages(messages)
+
+        # One call for the two new tasks, one for the modification task
+        mock_generate.assert_called_once()
+        mock_stream.assert_called_once()
+        completed = [call.args[1] for call in mock_send.call_args_list if call.args[3] == "task_completed"]
+        self.assertEqual(completed, ["task-aaaa-1", "task-bbbb-2", "task-cccc-3"])
+        with open(os.path.join(self.agent.output_ui_root, "UXUI_taskaaa.tsx")) as f:
+            self.assertEqual(f.read(), "<PricingCard />")
+
+    def test_unparseable_batch_falls_back_to_single_tasks(self):
+        """Test tasks are retried one by one when the batched response is not JSON"""
+        messages = [
+            {"type": "new_task", "task_id": "task-aaaa-1", "content": "Create a pricing card"},
+            {"type": "new_task", "task_id": "task-bbbb-2", "content": "Create a footer"},
+        ]
+        with patch.object(self.agent, 'state_manager'), \
+             patch.object(self.agent, 'send_message') as mock_send, \
+             patch.object(self.agent, '_generate_response', return_value="not json") as mock_generate, \
+             patch.object(self.agent, '_generate_response_stream', side_effect=[iter(["<A />"]), iter(["<B />"])]) as mock_stream:
+            self.agent._process_messages(messages)
+
+        mock_generate.assert_called_once()
+        self.assertEqual(mock_stream.call_count, 2)
+        self.assertEqual([call.args[3] for call in mock_send.call_args_list], ["task_completed", "task_completed"])
+
+    def test_retry_uses_shared_task_handling(self):
+        """Test a retry regenerates the stored task and saves a _retry artifact"""
+        with patch.object(self.agent, 'state_manager') as mock_state, \
+             patch.object(self.agent, 'send_message') as mock_send, \
+             patch.object(self.agent, '_generate_response', return_value="# Checkout flow"):
+            mock_state.get_task.return_value = {"description": "Describe the checkout flow"}
+            self.agent._process_message({"type": "review_and_retry", "task_id": "task-dddd-4", "content": "Bad output"})
+
+        output_path = os.path.join(self.agent.output_ui_root, "UXUI_taskddd_retry.md")
+        with open(output_path) as f:
+            self.assertEqual(f.read(), "# Checkout flow")
+        self.assertEqual(mock_send.call_args.args[2], f"Task retried and completed with new content: {output_path}")
+
+    def test_new_task_streams_output_to_file(self):
+        """Test a new task's response is written as it streams, without code fences"""
+        chunks = ["  ```tsx\n<Ca", "rd />\n``", "`\n"]
+        with patch.object(self.agent, 'state_manager'), \
+             patch.object(self.agent, 'send_message') as mock_send, \
+             patch.object(self.agent, '_generate_response') as mock_generate, \
+             patch.object(self.agent, '_generate_response_stream', return_value=iter(chunks)):
+            self.agent._process_message({"type": "new_task", "task_id": "task-eeee-5", "content": "Create a card"})
+
+        mock_generate.assert_not_called()
+        self.assertEqual(os.listdir(self.agent.output_ui_root), ["UXUI_taskeee.tsx"])
+        with open(os.path.join(self.agent.output_ui_root, "UXUI_taskeee.tsx")) as f:
+            self.assertEqual(f.read(), "<Card />")
+        self.assertEqual(mock_send.call_args.args[3], "task_completed")
+
+    def test_failed_stream_leaves_no_output_file(self):
+        """Test an LLM error mid-stream leaves no partial or temporary file and fails the task"""
+        def broken_stream(*args, **kwargs):
+            yield "<Card"
+            raise RuntimeError("connection reset")
+
+        with patch.object(self.agent, 'state_manager'), \
+             patch.object(self.agent, 'send_message') as mock_send, \
+             patch.object(self.agent, '_generate_response_stream', side_effect=broken_stream):
+            self.agent._process_message({"type": "new_task", "task_id": "task-ffff-6", "content": "Create a card"})
+
+        self.assertEqual(os.listdir(self.agent.output_ui_root), [])
+        self.assertEqual(mock_send.call_args.args[3], "task_failed")
@@ -97,6 +97,12 @@ class TestAgentFactory(TestCase):
         self.assertIn('security', agents)
         self.assertIn('ux_ui', agents)
     
+    def test_get_available_agents_both_modes(self):
+        """Test every agent type is available in both modes"""
+        expected = list(AgentFactory.AGENT_MAPPINGS)
+        self.assertEqual(AgentFactory.get_available_agents('polling'), expected)
+        self.assertEqual(AgentFactory.get_available_agents('event_driven'), expected)
+    
     def test_agent_factory_get_agent_class(self):
         """Test AgentFactory get_agent_class method"""
         # Test polling mode
@@ -106,7 +112,22 @@ class TestAgentFactory(TestCase):
         # Test event-driven mode
         agent_class = AgentFactory.get_agent_class('backend', 'event_driven')
         self.assertIsNotNone(agent_class)
-    
+
+    def test_get_agent_class_resolves_once(self):
+        """Test agent classes are imported on first use and then served from the cache"""
+        import importlib
+        from multi_agent_framework.agents.specialized.frontend_agent import FrontendAgent
+
+        with mock.patch.dict(AgentFactory._resolved_cache, clear=True), \
+                mock.patch('multi_agent_framework.core.agent_factory.importlib.import_module',
+                           wraps=importlib.import_module) as mock_import:
+            first = AgentFactory.get_agent_class('frontend_agent', 'polling')
+            second = AgentFactory.get_agent_class('Frontend', 'polling')
+
+        self.assertIs(first, FrontendAgent)
+        self.assertIs(second, FrontendAgent)
+        mock_import.assert_called_once_with('multi_agent_framework.agents.specialized.frontend_agent')
+
     def test_agent_factory_create_agent(self):
         """Test AgentFactory create_agent method"""
         agent = AgentFactory.create_agent(
@@ -142,6 +163,32 @@ class TestAgentFactory(TestCase):
                 agent = create_agent(agent_type, mode='event_driven', project_config=self.project_config)
                 self.assertIsNotNone(agent, f"Failed to create event-driven {agent_type} agent")
     
+    def test_warmup_resolves_classes(self):
+        """Test warmup fills the class cache and skips types it can't resolve"""
+        with mock.patch.dict(AgentFactory._resolved_cache, clear=True):
+            AgentFactory.warmup('polling', ['frontend', 'no_such'])
+            self.assertEqual(list(AgentFactory._resolved_cache), [('frontend', 'polling')])
+
+    def test_create_all_agents_concurrently(self):
+        """Test all agents are built at once and a failed one is skipped with a warning"""
+        import threading
+        barrier = threading.Barrier(len(AgentFactory.AGENT_MAPPINGS), timeout=5)
+
+        def fake_create_agent(agent_type, mode=None, project_config=None):
+            # Only passes if every agent is being built at the same time
+            barrier.wait()
+            if agent_type == 'qa':
+                raise RuntimeError("no QA today")
+            return agent_type
+
+        with mock.patch.object(AgentFactory, 'create_agent', side_effect=fake_create_agent), \
+                mock.patch('builtins.print') as mock_print:
+            agents = AgentFactory.create_all_agents(mode='polling', project_config=self.project_config)
+
+        expected = [t for t in AgentFactory.AGENT_MAPPINGS if t != 'qa']
+        self.assertEqual(list(agents), expected)
+        mock_print.assert_called_once_with("Warning: Failed to create qa agent: no QA today")
+
     def test_agent_model_configuration(self):
         """Test agent uses correct model configuration"""
         # Update project config with custom model
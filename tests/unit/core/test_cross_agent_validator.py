@@ -3,9 +3,10 @@
 Tests for CrossAgentValidator
 """
 import os
-from unittest import TestCase, mock
+from unittest import TestCase, mock, skipIf
 from unittest.mock import Mock, patch, MagicMock
 
+from multi_agent_framework.core import cross_agent_validator as validator_module
 from multi_agent_framework.core.cross_agent_validator import (
     CrossAgentValidator, ValidationResult, APIContract
 )
@@ -281,6 +282,16 @@ class TestCrossAgentValidator(TestCase):
         # No match
         similar = self.validator._find_similar_fields('phone', columns)
         self.assertIsNone(similar)
+
+        # A prebuilt lowercase index gives the same answers
+        columns_lower = {col.lower(): col for col in columns}
+        self.assertEqual(
+            self.validator._find_similar_fields('Email', columns, columns_lower), 'email_address')
+        
+        # Typos within the edit-distance bound
+        similar = self.validator._find_similar_fields('craeted_at', columns)
+        self.assertEqual(similar, 'created_at')
+        self.assertIsNone(self.validator._find_similar_fields('updated_on', columns))
     
     def test_check_circular_dependencies(self):
         """Test circular dependency detection"""
@@ -289,9 +300,25 @@ class TestCrossAgentValidator(TestCase):
             {'name': 'ComponentC', 'type': 'component', 'path': './ComponentC'}
         ]
         
-        # Currently returns None as not implemented
+        # Nothing recorded yet, so there is no cycle
         result = self.validator._check_circular_dependencies('ComponentA', dependencies)
         self.assertIsNone(result)
+
+    def test_validate_component_dependencies_detects_cycle(self):
+        """Test cycles across separately validated components are reported"""
+        with patch.object(self.validator, '_component_exists', return_value=True):
+            result = self.validator.validate_component_dependencies(
+                "import { Sidebar } from './components/Sidebar';", 'Layout')
+            self.assertTrue(result.is_valid)
+
+            result = self.validator.validate_component_dependencies(
+                "import { Layout } from './components/Layout';", 'Sidebar')
+            self.assertIn("Circular dependency detected: Sidebar -> Layout -> Sidebar", result.errors)
+
+            # Removing the import breaks the cycle again
+            result = self.validator.validate_component_dependencies(
+                "import { Button } from './components/Button';", 'Sidebar')
+            self.assertTrue(result.is_valid)
     
     def test_extract_functions(self):
         """Test function extraction from code"""
@@ -317,6 +344,20 @@ class TestCrossAgentValidator(TestCase):
         self.assertIn('calculateDiscount', functions)
         self.assertIn('formatPrice', functions)
     
+    @skipIf(not validator_module.TREE_SITTER_AVAILABLE, "tree-sitter-javascript not installed")
+    def test_extract_functions_with_tree_sitter(self):
+        """Test AST extraction finds methods and skips non-function bindings"""
+        code = '''
+        export default function* idGenerator() {}
+        class Cart { constructor() {} checkout() {} }
+        const api = { fetchItems() {}, save: async () => {} };
+        const total = sum(items);
+        '''
+
+        functions = self.validator._extract_functions(code)
+
+        self.assertEqual(functions, ['idGenerator', 'checkout', 'fetchItems', 'save'])
+
     def test_extract_tested_functions(self):
         """Test extraction of tested functions from test code"""
         test_code = '''
@@ -336,11 +377,13 @@ class TestCrossAgentValidator(TestCase):
         });
         '''
         
-        tested = self.validator._extract_tested_functions(test_code)
+        component_functions = ['getUserById', 'calculateDiscount', 'formatPrice',
+                               'format', 'deleteUser']
+        tested = self.validator._extract_tested_functions(test_code, component_functions)
         
-        # Function names are extracted from test descriptions
-        self.assertTrue(any('returns' in t for t in tested))  # from 'returns correct user'
-        self.assertTrue(any('applies' in t for t in tested))  # from 'applies percentage'
+        # Only whole identifiers count: 'format' in 'format price' does, 'deleteUser' doesn't appear
+        self.assertEqual(tested, {'getUserById', 'calculateDiscount', 'formatPrice', 'format'})
+        self.assertEqual(self.validator._extract_tested_functions(test_code, []), set())
     
     def test_component_exists(self):
         """Test checking if component exists"""
@@ -356,7 +399,30 @@ class TestCrossAgentValidator(TestCase):
         
         # Should not find non-existent component
         self.assertFalse(self.validator._component_exists('NonExistent'))
-    
+
+    def test_component_exists_skips_build_dirs(self):
+        """Test dependency and build output directories are not searched"""
+        for skipped in ('node_modules', '.next'):
+            skipped_dir = os.path.join(self.temp_dir, 'app', skipped, 'pkg')
+            os.makedirs(skipped_dir, exist_ok=True)
+            with open(os.path.join(skipped_dir, 'Modal.js'), 'w') as f:
+                f.write('export default Modal')
+
+        self.assertFalse(self.validator._component_exists('Modal'))
+
+    def test_component_exists_sees_new_files(self):
+        """Test the cached component index picks up files created later"""
+        nested_dir = os.path.join(self.temp_dir, 'components', 'forms')
+        os.makedirs(nested_dir, exist_ok=True)
+        self.assertFalse(self.validator._component_exists('LoginForm'))
+
+        with open(os.path.join(nested_dir, 'LoginForm.tsx'), 'w') as f:
+            f.write('export const LoginForm = () => {}')
+
+        self.assertTrue(self.validator._component_exists('LoginForm'))
+        # Substring matches against file names are still honoured
+        self.assertTrue(self.validator._component_exists('Login'))
+
     def test_load_database_schemas(self):
         """Test loading database schemas from migrations"""
         # Create migrations directory
@@ -378,6 +444,42 @@ class TestCrossAgentValidator(TestCase):
         self.assertIn('users', self.validator.database_schemas)
         self.assertIn('email', self.validator.database_schemas['users']['columns'])
         self.assertTrue(self.validator.database_schemas['users']['columns']['email']['required'])
+
+    def test_load_database_schemas_skips_unchanged_migrations(self):
+        """Test migrations are only re-parsed after the directory changes"""
+        migrations_dir = os.path.join(self.temp_dir, 'supabase', 'migrations')
+        os.makedirs(migrations_dir, exist_ok=True)
+        with open(os.path.join(migrations_dir, '001_users.sql'), 'w') as f:
+            f.write('CREATE TABLE users (id SERIAL PRIMARY KEY);')
+
+        with patch.object(self.validator, '_parse_sql_schema',
+                          wraps=self.validator._parse_sql_schema) as mock_parse:
+            self.validator._load_database_schemas()
+            self.validator._load_database_schemas()
+            self.assertEqual(mock_parse.call_count, 1)
+
+            with open(os.path.join(migrations_dir, '002_posts.sql'), 'w') as f:
+                f.write('CREATE TABLE posts (id SERIAL PRIMARY KEY);')
+            self.validator._load_database_schemas()
+            self.assertEqual(mock_parse.call_count, 3)
+
+        self.assertIn('users', self.validator.database_schemas)
+        self.assertIn('posts', self.validator.database_schemas)
+
+    def test_load_database_schemas_confines_unterminated_table(self):
+        """Test an unterminated CREATE TABLE doesn't run into the next migration"""
+        migrations_dir = os.path.join(self.temp_dir, 'supabase', 'migrations')
+        os.makedirs(migrations_dir, exist_ok=True)
+        with open(os.path.join(migrations_dir, '001_users.sql'), 'w') as f:
+            f.write('CREATE TABLE users (id SERIAL PRIMARY KEY)\n;')
+        with open(os.path.join(migrations_dir, '002_posts.sql'), 'w') as f:
+            f.write('CREATE TABLE posts (id SERIAL PRIMARY KEY, title TEXT NOT NULL);')
+
+        self.validator._load_database_schemas()
+
+        self.assertNotIn('users', self.validator.database_schemas)
+        self.assertEqual(set(self.validator.database_schemas['posts']['columns']),
+                         {'id', 'title'})
     
     def test_extract_database_queries(self):
         """Test extraction of database queries from code"""
@@ -390,6 +492,9 @@ class TestCrossAgentValidator(TestCase):
         
         // Insert data
         await supabase.from('posts').insert({ title: 'New Post' });
+        const { data } = await supabase
+            .from('comments')
+            .select('body');
         '''
         
         queries = self.validator._extract_database_queries(code)
@@ -398,6 +503,9 @@ class TestCrossAgentValidator(TestCase):
         self.assertEqual(queries[0]['table'], 'users')
         self.assertIn('email', queries[0]['fields'])
         self.assertEqual(queries[1]['table'], 'profiles')
+        # The insert has no select of its own; a later query's select isn't borrowed
+        self.assertEqual(queries[2]['table'], 'posts')
+        self.assertEqual(queries[2]['fields'], [])
     
     def test_parse_sql_schema(self):
         """Test SQL schema parsing"""
@@ -426,6 +534,25 @@ class TestCrossAgentValidator(TestCase):
         self.assertTrue(products_cols['name']['required'])
         self.assertIn('price', products_cols)
         self.assertFalse(products_cols['price']['required'])  # No NOT NULL
+
+    def test_parse_sql_schema_commas_inside_definitions(self):
+        """Test commas in type arguments, defaults and comments don't split columns"""
+        sql = """
+        CREATE TABLE invoices (
+            id UUID PRIMARY KEY, -- surrogate key, generated
+            total NUMERIC(10,2) NOT NULL,
+            status TEXT DEFAULT 'draft,open' NOT NULL,
+            PRIMARY KEY (id, total)
+        );
+        """
+
+        self.validator._parse_sql_schema(sql)
+
+        columns = self.validator.database_schemas['invoices']['columns']
+        self.assertEqual(list(columns), ['id', 'total', 'status'])
+        self.assertEqual(columns['total']['type'], 'NUMERIC')
+        self.assertTrue(columns['total']['required'])
+        self.assertTrue(columns['status']['required'])
     
     def test_validate_frontend_backend_contract_unused_endpoints(self):
         """Test detection of unused backend endpoints"""
@@ -440,6 +567,22 @@ class TestCrossAgentValidator(TestCase):
         self.assertTrue(result.is_valid)
         self.assertGreater(len(result.warnings), 0)
         self.assertTrue(any('products' in w for w in result.warnings))
+
+    def test_validate_frontend_backend_contract_path_parameters(self):
+        """Test calls match parameterized endpoints and mark every match used"""
+        frontend_code = 'axios.get("/api/users/42/")'
+        backend_code = """
+        router.get("/api/users/[id]", (req, res) => res.json({}));
+        router.get("/api/users/42", (req, res) => res.json({}));
+        router.delete("/api/users/[id]", (req, res) => res.json({}));
+        """
+
+        result = self.validator.validate_frontend_backend_contract(frontend_code, backend_code)
+
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.warnings, [
+            "Backend endpoint 'DELETE /api/users/[id]' is not used by frontend"
+        ])
     
     def test_validate_database_schema_missing_required_insert_fields(self):
         """Test validation with missing required fields in insert"""
@@ -479,7 +622,59 @@ class TestCrossAgentValidator(TestCase):
         self.assertFalse(result.is_valid)
         self.assertGreater(len(result.errors), 0)
         self.assertGreater(len(result.warnings), 0)
-    
+
+    def test_validate_security_compliance_overlapping_issues(self):
+        """Test issues inside another issue's match are still reported"""
+        code = 'db.query(`SELECT * FROM t WHERE id = ${id} AND eval(x)`);'
+
+        result = self.validator.validate_security_compliance(code, 'backend')
+
+        self.assertEqual(result.errors, [
+            "Potential SQL injection vulnerability",
+            "Avoid using eval() - it's a security risk",
+        ])
+
+    def test_repeated_validation_is_memoized(self):
+        """Test identical inputs reuse the cached result without sharing lists"""
+        code = 'const password = "hunter2"; eval(input);'
+
+        with patch.object(validator_module, '_SECURITY_RE',
+                          wraps=validator_module._SECURITY_RE) as mock_re:
+            first = self.validator.validate_security_compliance(code, 'frontend')
+            first.errors.append('mutated by caller')
+            second = self.validator.validate_security_compliance(code, 'frontend')
+            self.validator.validate_security_compliance(code, 'api')
+
+        self.assertEqual(mock_re.finditer.call_count, 2)
+        self.assertNotIn('mutated by caller', second.errors)
+        self.assertEqual(len(second.errors), 2)
+
+    def test_validate_batch(self):
+        """Test batch validation returns results in order across processes"""
+        migrations_dir = os.path.join(self.temp_dir, 'supabase', 'migrations')
+        os.makedirs(migrations_dir, exist_ok=True)
+        with open(os.path.join(migrations_dir, '001_users.sql'), 'w') as f:
+            f.write('CREATE TABLE users (id SERIAL PRIMARY KEY, email TEXT NOT NULL);')
+        self.addCleanup(self.validator.close)
+
+        results = self.validator.validate_batch([
+            ('validate_security_compliance', {'code': 'eval(x)', 'code_type': 'frontend'}),
+            ('validate_database_schema_usage', {
+                'code': "supabase.from('users').select('emal')", 'schema_type': 'query'}),
+            ('validate_component_dependencies', {'component_code': '', 'component_name': 'App'}),
+            ('validate_security_compliance', {'code': 'const x = 1;', 'code_type': 'frontend'}),
+        ])
+
+        self.assertEqual(len(results), 4)
+        self.assertTrue(any('eval' in e for e in results[0].errors))
+        self.assertEqual(results[1].suggestions, ["Did you mean 'email'?"])
+        self.assertTrue(results[2].is_valid)
+        self.assertTrue(results[3].is_valid)
+        self.assertIn('App', self.validator.component_dependencies)
+
+        with self.assertRaises(ValueError):
+            self.validator.validate_batch([('_load_database_schemas', {})])
+
     def test_hook_and_util_existence_checks(self):
         """Test hook and utility existence checks"""
         # Create hooks and utils directories
@@ -526,6 +721,11 @@ class TestCrossAgentValidator(TestCase):
         self.assertFalse(result.is_valid)
         self.assertTrue(any("describe" in error for error in result.errors))
         
+        # Functions defined twice are reported once
+        result = self.validator.validate_test_coverage(
+            component_code + '\nexport const add = (a, b) => b + a;', test_code)
+        self.assertEqual(result.suggestions, ["Add test case for 'add' function"])
+        
         # Missing test cases
         test_code_no_tests = 'describe("Math", () => { /* no tests */ });'
         result = self.validator.validate_test_coverage(component_code, test_code_no_tests)
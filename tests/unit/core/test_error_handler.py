@@ -69,6 +69,18 @@ class TestErrorHandlerSimple(TestCase):
             self.assertIn("🚨", output)
             self.assertIn("Critical failure", output)
     
+    def test_display_colors_only_on_tty(self):
+        """Test ANSI colors are emitted only when stderr is a terminal"""
+        with patch('sys.stderr', new=StringIO()) as fake_err:
+            ErrorHandler()._display_error("Plain", ErrorLevel.ERROR)
+            self.assertEqual(fake_err.getvalue(), "\n❌ Plain\n\n")
+        
+        tty_err = StringIO()
+        tty_err.isatty = lambda: True
+        with patch('sys.stderr', new=tty_err):
+            ErrorHandler()._display_error("Colored", ErrorLevel.ERROR)
+            self.assertEqual(tty_err.getvalue(), "\n\033[91m❌ Colored\033[0m\n\n")
+    
     def test_wrap_function_decorator(self):
         """Test function wrapping as decorator"""
         # Create a function that might fail
@@ -134,6 +146,47 @@ class TestErrorHandlerSimple(TestCase):
             # Verify logging was called
             mock_log.assert_called()
     
+    def test_log_level_selects_logger_method(self):
+        """Test each error level logs through the matching logger method"""
+        for level in ErrorLevel:
+            method_name = ErrorHandler.LOG_METHOD_NAMES[level]
+            with patch.object(self.handler.logger, method_name) as mock_method, \
+                 patch('sys.stderr', new=StringIO()):
+                message = self.handler.handle_error(
+                    ValueError("x"), ErrorCategory.SYSTEM, {}, level=level
+                )
+            mock_method.assert_any_call(message)
+    
+    def test_traceback_skipped_without_debug(self):
+        """Test the traceback is not formatted unless debug logging is on"""
+        with patch.object(self.handler.logger, 'isEnabledFor', return_value=False), \
+             patch('multi_agent_framework.core.error_handler.traceback.format_exc') as mock_format, \
+             patch.object(self.handler.logger, 'debug') as mock_debug, \
+             patch('sys.stderr', new=StringIO()):
+            self.handler.handle_error(ValueError("x"), ErrorCategory.SYSTEM, {})
+        
+        mock_format.assert_not_called()
+        mock_debug.assert_not_called()
+    
+    def test_error_stringified_once(self):
+        """Test handle_error converts the error to text a single time"""
+        calls = []
+        
+        class CountingError(Exception):
+            def __str__(self):
+                calls.append(1)
+                return "Connection refused"
+        
+        with patch.object(self.handler.logger, 'isEnabledFor', return_value=False), \
+             patch('sys.stderr', new=StringIO()):
+            message = self.handler.handle_error(
+                CountingError(), ErrorCategory.NETWORK, {"service": "API"}
+            )
+        
+        self.assertEqual(len(calls), 1)
+        self.assertIn("Unable to connect to API", message)
+        self.assertIn("Check your internet connection", message)
+    
     def test_get_error_message_basic(self):
         """Test error message retrieval"""
         # This returns the string representation of the error
@@ -162,6 +215,63 @@ class TestErrorHandlerSimple(TestCase):
         )
         self.assertEqual(error_type, "rate_limit")
     
+    def test_identify_error_type_precedence(self):
+        """Test earlier-listed error types win regardless of position"""
+        error_type = self.handler._identify_error_type(
+            Exception("Timeout while opening connection"),
+            ErrorCategory.NETWORK,
+            {}
+        )
+        self.assertEqual(error_type, "connection")
+        
+        # Task errors default to "failed" when nothing matches
+        error_type = self.handler._identify_error_type(
+            RuntimeError("boom"),
+            ErrorCategory.TASK_EXECUTION,
+            {}
+        )
+        self.assertEqual(error_type, "failed")
+        
+        # Categories without keywords are always "unknown"
+        error_type = self.handler._identify_error_type(
+            Exception("connection refused"),
+            ErrorCategory.SYSTEM,
+            {}
+        )
+        self.assertEqual(error_type, "unknown")
+    
+    def test_compiled_messages_match_format(self):
+        """Test precompiled templates render like str.format"""
+        context = {"service": "OpenAI", "wait_time": 30}
+        with patch('sys.stderr', new=StringIO()):
+            message = self.handler.handle_error(
+                Exception("Rate limit exceeded"),
+                ErrorCategory.NETWORK,
+                context
+            )
+        template = ErrorHandler.ERROR_MESSAGES[ErrorCategory.NETWORK]["rate_limit"]
+        self.assertTrue(message.startswith(template.format(**context)))
+    
+    def test_missing_context_falls_back(self):
+        """Test missing template fields use the category fallback"""
+        with patch('sys.stderr', new=StringIO()):
+            message = self.handler.handle_error(
+                Exception("Rate limit exceeded"),
+                ErrorCategory.NETWORK,
+                {}
+            )
+        self.assertTrue(message.startswith("network error: Rate limit exceeded"))
+    
+    def test_unmatched_error_text_is_not_formatted(self):
+        """Test braces in an unmatched error message are kept verbatim"""
+        with patch('sys.stderr', new=StringIO()):
+            message = self.handler.handle_error(
+                ValueError("bad value {"),
+                ErrorCategory.VALIDATION,
+                {}
+            )
+        self.assertEqual(message, "bad value {")
+    
     def test_suggestions_exist(self):
         """Test that suggestion methods exist and return strings"""
         # API key suggestion
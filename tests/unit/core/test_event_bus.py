@@ -6,8 +6,9 @@ import time
 import threading
 from unittest import TestCase
 
-from multi_agent_framework.core.event_bus import InMemoryEventBus
-from multi_agent_framework.core.event_bus_interface import EventType
+from multi_agent_framework.core import event_bus as event_bus_module
+from multi_agent_framework.core.event_bus import InMemoryEventBus, get_event_bus
+from multi_agent_framework.core.event_bus_interface import Event, EventType
 
 
 class TestEventBus(TestCase):
@@ -254,6 +255,272 @@ class TestEventBus(TestCase):
             self.assertIn(event_type, received_events)
 
 
+class TestInMemoryEventBusDispatch(TestCase):
+    """Test dispatch of real Event objects through a running bus"""
+    
+    def setUp(self):
+        """Create and start event bus for tests"""
+        self.event_bus = InMemoryEventBus()
+        self.event_bus.start()
+        
+    def tearDown(self):
+        """Stop event bus"""
+        self.event_bus.stop()
+    
+    def _event(self, event_type=EventType.TASK_CREATED, source="test", **data):
+        return Event(id=str(time.time()), type=event_type, source=source,
+                     timestamp=time.time(), data=data)
+    
+    def _wait_for(self, predicate, timeout=2.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return predicate()
+    
+    def test_event_type_keys_use_identity_hash(self):
+        """Test EventType hashes by identity while keeping its string values"""
+        self.assertIs(type(EventType.TASK_CREATED).__hash__, object.__hash__)
+        self.assertEqual(EventType("task.created"), EventType.TASK_CREATED)
+        self.assertEqual({EventType.TASK_CREATED: 1}[EventType("task.created")], 1)
+        self.assertNotIn("__hash__", EventType.__members__)
+    
+    def test_subscribe_does_not_mutate_snapshot(self):
+        """Test subscribe replaces the handler tuple instead of mutating it"""
+        def first(event):
+            pass
+        
+        def second(event):
+            pass
+        
+        self.event_bus.subscribe(EventType.TASK_CREATED, first)
+        snapshot = self.event_bus._subscribers[EventType.TASK_CREATED]
+        self.event_bus.subscribe(EventType.TASK_CREATED, second)
+        
+        self.assertEqual(snapshot, (first,))
+        self.assertEqual(self.event_bus._subscribers[EventType.TASK_CREATED], (first, second))
+        
+        self.event_bus.unsubscribe(EventType.TASK_CREATED, first)
+        self.assertEqual(self.event_bus._subscribers[EventType.TASK_CREATED], (second,))
+        with self.assertRaises(ValueError):
+            self.event_bus.unsubscribe(EventType.TASK_CREATED, first)
+    
+    def test_publish_delivers_event(self):
+        """Test a published Event reaches its subscriber"""
+        received = []
+        self.event_bus.subscribe(EventType.TASK_CREATED, received.append)
+        
+        self.event_bus.publish(self._event(task_id="t-1"))
+        
+        self.assertTrue(self._wait_for(lambda: len(received) == 1))
+        self.assertEqual(received[0].data["task_id"], "t-1")
+    
+    def test_handlers_run_on_pool(self):
+        """Test handlers run on the bus thread pool, not ad-hoc threads"""
+        thread_names = []
+        self.event_bus.subscribe(
+            EventType.TASK_CREATED,
+            lambda event: thread_names.append(threading.current_thread().name)
+        )
+        
+        for _ in range(5):
+            self.event_bus.publish(self._event())
+        
+        self.assertTrue(self._wait_for(lambda: len(thread_names) == 5))
+        self.assertTrue(all(name.startswith('evbus') for name in thread_names))
+    
+    def test_handler_error_is_logged(self):
+        """Test handler failures go to the event bus logger"""
+        def failing_handler(event):
+            raise RuntimeError("boom")
+        
+        self.event_bus.subscribe(EventType.TASK_FAILED, failing_handler)
+        with self.assertLogs("maf.eventbus", level="ERROR") as logs:
+            self.event_bus.publish(self._event(EventType.TASK_FAILED))
+            self._wait_for(lambda: logs.output)
+        
+        self.assertIn("failing_handler", logs.output[0])
+    
+    def test_handler_error_event_identifies_original(self):
+        """Test error events reference the failed event instead of copying it"""
+        errors = []
+        self.event_bus.subscribe(EventType.AGENT_ERROR, errors.append)
+        
+        def failing_handler(event):
+            raise RuntimeError("boom")
+        
+        self.event_bus.subscribe(EventType.TASK_FAILED, failing_handler)
+        failed = self._event(EventType.TASK_FAILED, payload="x" * 1000)
+        with self.assertLogs("maf.eventbus", level="ERROR"):
+            self.event_bus.publish(failed)
+            self.assertTrue(self._wait_for(lambda: len(errors) == 1))
+        
+        self.assertEqual(errors[0].data, {
+            "handler": "failing_handler",
+            "original_event_id": failed.id,
+            "original_event_type": "task.failed",
+            "error": "boom",
+        })
+    
+    def test_failing_error_handler_does_not_loop(self):
+        """Test a failing AGENT_ERROR handler does not trigger more error events"""
+        calls = []
+        
+        def failing_error_handler(event):
+            calls.append(event)
+            raise RuntimeError("still broken")
+        
+        self.event_bus.subscribe(EventType.AGENT_ERROR, failing_error_handler)
+        with self.assertLogs("maf.eventbus", level="ERROR"):
+            self.event_bus.publish(self._event(EventType.AGENT_ERROR))
+            self._wait_for(lambda: calls)
+            time.sleep(0.05)
+        
+        self.assertEqual(len(calls), 1)
+    
+    def test_repeated_handler_failures_are_throttled(self):
+        """Test error events stop after too many failures in one window"""
+        bus = InMemoryEventBus()
+        bus._max_handler_errors = 2
+        
+        def failing_handler(event):
+            raise RuntimeError("boom")
+        
+        with self.assertLogs("maf.eventbus", level="ERROR"):
+            for _ in range(4):
+                bus._safe_handler_call(failing_handler, self._event())
+        
+        errors = bus.get_event_history(event_type=EventType.AGENT_ERROR)
+        self.assertEqual(len(errors), 2)
+    
+    def test_queued_burst_is_drained_in_order(self):
+        """Test a backlog larger than one batch is stored and delivered in order"""
+        bus = InMemoryEventBus()
+        received = []
+        bus.subscribe(EventType.TASK_CREATED, received.append)
+        bus.subscribe(EventType.TASK_STARTED, received.append)
+        
+        published = [
+            self._event(EventType.TASK_CREATED if i % 2 else EventType.TASK_STARTED, seq=i)
+            for i in range(300)
+        ]
+        for event in published:
+            bus.publish(event)
+        
+        bus.start()
+        try:
+            self.assertTrue(self._wait_for(lambda: len(received) == 300))
+        finally:
+            bus.stop()
+        
+        history = bus.get_event_history()
+        self.assertEqual([e.data.get("seq") for e in history[:300]], list(range(300)))
+    
+    def test_publish_without_subscribers_skips_queue(self):
+        """Test events nobody listens to are recorded but never queued"""
+        bus = InMemoryEventBus()
+        bus.publish(self._event(EventType.CUSTOM, seq=1))
+        
+        self.assertEqual(bus._event_queue.qsize(), 0)
+        self.assertEqual([e.data["seq"] for e in bus.get_event_history()], [1])
+        
+        bus = InMemoryEventBus(persist_events=False)
+        bus.publish(self._event(EventType.CUSTOM, seq=1))
+        self.assertEqual(bus._event_queue.qsize(), 0)
+        self.assertEqual(bus.get_event_history(), [])
+    
+    def test_history_stays_in_publish_order(self):
+        """Test unsubscribed events are not recorded ahead of queued ones"""
+        bus = InMemoryEventBus()
+        received = []
+        bus.subscribe(EventType.TASK_CREATED, received.append)
+        
+        bus.publish(self._event(EventType.TASK_CREATED, seq="A"))
+        bus.publish(self._event(EventType.CUSTOM, seq="B"))
+        
+        bus.start()
+        try:
+            self.assertTrue(self._wait_for(lambda: len(bus.get_event_history()) == 2))
+            # Once the queue is drained the direct path is taken again
+            bus.publish(self._event(EventType.CUSTOM, seq="C"))
+            self.assertEqual(bus._event_queue.qsize(), 0)
+        finally:
+            bus.stop()
+        
+        history = bus.get_event_history()
+        self.assertEqual([e.data["seq"] for e in history[:3]], ["A", "B", "C"])
+    
+    def test_history_keeps_most_recent_events(self):
+        """Test history evicts the oldest events past its cap"""
+        bus = InMemoryEventBus()
+        for i in range(1500):
+            bus.publish(self._event(seq=i))
+        
+        history = bus.get_event_history()
+        self.assertEqual(len(history), 1000)
+        self.assertEqual(history[0].data["seq"], 500)
+        self.assertEqual(history[-1].data["seq"], 1499)
+    
+    def test_history_filters_use_indexes(self):
+        """Test filtered history matches a full scan, including after eviction"""
+        bus = InMemoryEventBus()
+        types = [EventType.TASK_CREATED, EventType.TASK_STARTED, EventType.TASK_FAILED]
+        events = [
+            self._event(types[i % 3], source=f"agent-{i % 4}", seq=i)
+            for i in range(1200)
+        ]
+        for i, event in enumerate(events):
+            event.timestamp = float(i)
+        for event in events:
+            bus.publish(event)
+        window = events[-1000:]
+        
+        for event_type in (None, EventType.TASK_STARTED, EventType.AGENT_ERROR):
+            for source in (None, "agent-1", "missing"):
+                for since in (None, 1100.0):
+                    expected = [
+                        e for e in window
+                        if (event_type is None or e.type == event_type)
+                        and (source is None or e.source == source)
+                        and (since is None or e.timestamp >= since)
+                    ]
+                    self.assertEqual(
+                        bus.get_event_history(event_type=event_type, source=source, since=since),
+                        expected
+                    )
+        
+        # Index entries never outlive the main history window
+        self.assertEqual(sum(len(d) for d in bus._history_by_type.values()), 1000)
+        self.assertEqual(sum(len(d) for d in bus._history_by_source.values()), 1000)
+
+
+
+class TestGetEventBus(TestCase):
+    """Test the module-level event bus singleton"""
+    
+    def tearDown(self):
+        """Stop and forget the global bus"""
+        if event_bus_module._event_bus is not None:
+            event_bus_module._event_bus.stop()
+        event_bus_module._event_bus = None
+        get_event_bus.cache_clear()
+    
+    def test_concurrent_first_calls_share_one_bus(self):
+        """Test racing first calls create a single started bus"""
+        buses = []
+        threads = [threading.Thread(target=lambda: buses.append(get_event_bus()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len({id(bus) for bus in buses}), 1)
+        self.assertIs(get_event_bus(), buses[0])
+        self.assertTrue(buses[0]._running)
+
+
 if __name__ == '__main__':
     import unittest
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for FileIndex class
+"""
+import os
+import time
+import tempfile
+import shutil
+from unittest import TestCase, skipUnless
+
+from multi_agent_framework.core.file_index import FileIndex, scan_files, WATCHDOG_AVAILABLE
+
+
+def is_tsx(file_name, directory):
+    return file_name.endswith('.tsx')
+
+
+class TestFileIndex(TestCase):
+    """Test file index scanning and event updates"""
+    
+    def setUp(self):
+        """Create temp directory tree"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.temp_dir, 'components')
+        
+    def tearDown(self):
+        """Clean up temp directory"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def _write(self, relative_path, content=""):
+        path = os.path.join(self.root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+    
+    def _wait_for(self, index, condition, timeout=5):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            paths = {path for _, path in index.snapshot()}
+            if condition(paths):
+                return paths
+            time.sleep(0.05)
+        self.fail(f"Index did not converge: {paths}")
+    
+    def test_scan_files_applies_predicate(self):
+        """Test only matching files are returned, with their mtimes"""
+        button = self._write('ui/Button.tsx')
+        self._write('ui/readme.md')
+        
+        found = scan_files([self.root, os.path.join(self.temp_dir, 'missing')], is_tsx)
+        
+        self.assertEqual(list(found), [button])
+        self.assertEqual(found[button], os.path.getmtime(button))
+    
+    def test_snapshot_without_watching_rescans(self):
+        """Test a stopped index still reflects the filesystem"""
+        index = FileIndex([self.root], is_tsx)
+        self._write('Card.tsx')
+        
+        self.assertEqual([path for _, path in index.snapshot()], [os.path.join(self.root, 'Card.tsx')])
+    
+    @skipUnless(WATCHDOG_AVAILABLE, "watchdog not installed")
+    def test_events_keep_index_current(self):
+        """Test created, deleted and late-created roots are tracked from events"""
+        card = self._write('Card.tsx')
+        late_root = os.path.join(self.temp_dir, 'app')
+        index = FileIndex([self.root, late_root], is_tsx)
+        self.assertTrue(index.start())
+        try:
+            self.assertEqual({path for _, path in index.snapshot()}, {card})
+            
+            hero = self._write('marketing/Hero.tsx')
+            self._wait_for(index, lambda paths: hero in paths)
+            
+            os.remove(card)
+            self._wait_for(index, lambda paths: card not in paths)
+            
+            os.makedirs(late_root)
+            page = os.path.join(late_root, 'Page.tsx')
+            with open(page, 'w') as f:
+                f.write('')
+            self._wait_for(index, lambda paths: page in paths)
+        finally:
+            index.stop()
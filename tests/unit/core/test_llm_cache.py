@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for LLMCache class
+"""
+import os
+import tempfile
+import shutil
+from unittest import TestCase
+from unittest.mock import patch
+
+from multi_agent_framework.core.llm_cache import LLMCache, SemanticCache, is_llm_cache_enabled
+
+
+class TestLLMCache(TestCase):
+    """Test exact-match LLM response caching"""
+    
+    def setUp(self):
+        """Create temp directory for cache entries"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = LLMCache(self.temp_dir)
+        
+    def tearDown(self):
+        """Clean up temp directory"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def test_make_key_is_deterministic(self):
+        """Test keys depend only on their parts"""
+        key = LLMCache.make_key("gemini", "gemini-2.0-flash", "prompt")
+        
+        self.assertEqual(key, LLMCache.make_key("gemini", "gemini-2.0-flash", "prompt"))
+        self.assertNotEqual(key, LLMCache.make_key("claude", "gemini-2.0-flash", "prompt"))
+        self.assertEqual(len(key), 64)
+    
+    def test_set_and_get(self):
+        """Test a stored response is returned and counted as a hit"""
+        key = LLMCache.make_key("prompt")
+        self.assertIsNone(self.cache.get(key))
+        
+        self.cache.set(key, "response")
+        
+        self.assertEqual(self.cache.get(key), "response")
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, key[:2], f"{key}.json")))
+        self.assertEqual(self.cache.get_statistics(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+    
+    def test_expired_entry_is_a_miss(self):
+        """Test entries past their TTL are ignored"""
+        key = LLMCache.make_key("prompt")
+        self.cache.set(key, "response", ttl=-1)
+        
+        self.assertIsNone(self.cache.get(key))
+    
+    def test_persists_across_instances(self):
+        """Test entries are shared through the cache directory"""
+        key = LLMCache.make_key("prompt")
+        self.cache.set(key, "response")
+        
+        self.assertEqual(LLMCache(self.temp_dir).get(key), "response")
+    
+    def test_enabled_by_environment(self):
+        """Test MAF_LLM_CACHE toggles caching"""
+        with patch.dict(os.environ, {'MAF_LLM_CACHE': '1'}):
+            self.assertTrue(is_llm_cache_enabled())
+        with patch.dict(os.environ, {'MAF_LLM_CACHE': '0'}):
+            self.assertFalse(is_llm_cache_enabled())
+
+
+class TestSemanticCache(TestCase):
+    """Test near-duplicate task caching"""
+    
+    def setUp(self):
+        """Create temp directory for the cache file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, 'semcache', 'ux_ui_agent.json')
+        self.cache = SemanticCache(self.cache_file)
+        
+    def tearDown(self):
+        """Clean up temp directory"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def test_rewording_hits(self):
+        """Test descriptions differing only in stop words and case match"""
+        self.cache.set("Create a hero section for the landing page", "<Hero />")
+        
+        self.assertEqual(self.cache.get("create the Hero Section on our landing page"), "<Hero />")
+        self.assertEqual(self.cache.hits, 1)
+    
+    def test_different_task_misses(self):
+        """Test unrelated descriptions do not match"""
+        self.cache.set("Create a hero section for the landing page", "<Hero />")
+        
+        self.assertIsNone(self.cache.get("Create a pricing table for the landing page"))
+        self.assertEqual(self.cache.misses, 1)
+    
+    def test_persists_to_file(self):
+        """Test entries survive a new instance"""
+        self.cache.set("Design the login form", "<LoginForm />")
+        
+        self.assertEqual(SemanticCache(self.cache_file).get("design login form"), "<LoginForm />")
+    
+    def test_oldest_entries_evicted(self):
+        """Test the cache is bounded"""
+        with patch.object(SemanticCache, 'MAX_ENTRIES', 2):
+            for name in ("alpha", "beta", "gamma"):
+                self.cache.set(f"Create {name} widget", name)
+            
+            self.assertIsNone(self.cache.get("Create alpha widget"))
+            self.assertEqual(self.cache.get("Create gamma widget"), "gamma")
@@ -7,11 +7,17 @@ import json
 import time
 import tempfile
 import shutil
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from multi_agent_framework.core.message_bus_configurable import MessageBus
 
 
+def _send_after(message_dir, delay):
+    """Send one message to ux_ui_agent after a delay; runs in another process"""
+    time.sleep(delay)
+    MessageBus(message_dir).send_message("ux_ui_agent", {"type": "new_task", "content": "Wake up"})
+
+
 class TestMessageBus(TestCase):
     """Test message bus functionality"""
     
@@ -65,6 +71,58 @@ class TestMessageBus(TestCase):
         for i, msg in enumerate(messages):
             self.assertEqual(msg["content"], f"Message {i}")
     
+    def test_send_messages_batch(self):
+        """Test sending a batch of messages in one inbox write"""
+        self.message_bus.send_message("orchestrator", {"type": "test", "content": "First"})
+        self.message_bus.send_messages("orchestrator", [
+            {"type": "test", "content": f"Batched {i}"} for i in range(3)
+        ])
+
+        messages = self.message_bus.receive_messages("orchestrator")
+
+        self.assertEqual([msg["content"] for msg in messages],
+                         ["First", "Batched 0", "Batched 1", "Batched 2"])
+        self.assertTrue(all("timestamp" in msg for msg in messages))
+
+    def test_blocking_receive_wakes_on_send(self):
+        """Test a blocking receive returns as soon as a message is sent"""
+        import threading
+
+        sender_bus = MessageBus(self.temp_dir)
+        timer = threading.Timer(0.1, sender_bus.send_message,
+                                args=("ux_ui_agent", {"type": "new_task", "content": "Wake up"}))
+        timer.start()
+
+        start = time.time()
+        messages = self.message_bus.receive_messages("ux_ui_agent", block=True, timeout=10)
+        timer.join()
+
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0]["content"], "Wake up")
+        self.assertLess(time.time() - start, 5)
+
+    def test_blocking_receive_sees_send_from_other_process(self):
+        """Test a blocking receive notices a send from another process promptly"""
+        import multiprocessing
+
+        sender = multiprocessing.Process(target=_send_after, args=(self.temp_dir, 0.2))
+        sender.start()
+        try:
+            start = time.monotonic()
+            messages = self.message_bus.receive_messages("ux_ui_agent", block=True, timeout=30)
+            elapsed = time.monotonic() - start
+        finally:
+            sender.join(timeout=10)
+
+        self.assertEqual([msg["content"] for msg in messages], ["Wake up"])
+        self.assertLess(elapsed, 0.2 + MessageBus.CROSS_PROCESS_POLL_INTERVAL + 1)
+
+    def test_blocking_receive_timeout(self):
+        """Test a blocking receive on an empty inbox gives up after the timeout"""
+        messages = self.message_bus.receive_messages("ux_ui_agent", block=True, timeout=0.1)
+
+        self.assertEqual(messages, [])
+
     def test_message_persistence(self):
         """Test that messages persist in queue files"""
         # Send a message
@@ -151,7 +209,23 @@ class TestMessageBus(TestCase):
         self.assertEqual(status.get("orchestrator", 0), 2)
         self.assertEqual(status.get("frontend_agent", 0), 1)
         self.assertEqual(status.get("backend_agent", 0), 0)
-    
+
+    def test_get_queue_status_empty_and_drained_inboxes(self):
+        """Test queue status counts empty, drained and truncated inboxes as 0"""
+        self.message_bus.initialize_agent_inboxes(["qa_agent"])
+        self.message_bus.send_message("db_agent", {"content": "msg"})
+        self.message_bus.receive_messages("db_agent")
+        open(os.path.join(self.temp_dir, "docs_agent_inbox.json"), 'w').close()
+
+        with mock.patch('json.load') as mock_load:
+            status = self.message_bus.get_queue_status()
+            mock_load.assert_not_called()
+
+        self.assertEqual(status, {"qa_agent": 0, "db_agent": 0, "docs_agent": 0})
+
+        shutil.rmtree(self.temp_dir)
+        self.assertEqual(self.message_bus.get_queue_status(), {})
+
     def test_initialize_agent_inboxes(self):
         """Test initializing agent inboxes"""
         agents = ["orchestrator", "frontend_agent", "backend_agent", "db_agent"]
@@ -168,6 +242,15 @@ class TestMessageBus(TestCase):
                 content = json.load(f)
                 self.assertEqual(content, [])
     
+    def test_initialize_agent_inboxes_keeps_pending_messages(self):
+        """Test initializing inboxes leaves existing inboxes untouched"""
+        self.message_bus.send_message("orchestrator", {"content": "pending"})
+        
+        self.message_bus.initialize_agent_inboxes(["orchestrator", "qa_agent"])
+        
+        self.assertEqual(self.message_bus.get_queue_status().get("orchestrator", 0), 1)
+        self.assertEqual(self.message_bus.get_queue_status().get("qa_agent", 0), 0)
+    
     def test_receive_with_clear(self):
         """Test receiving messages clears the queue"""
         # Send messages
@@ -76,6 +76,18 @@ class TestProjectConfig(TestCase):
         config = ProjectConfig(self.temp_dir)
         self.assertEqual(config.config['project_type'], 'django')
     
+    def test_flask_project_detection(self):
+        """Test Flask detection reads Python sources whatever their encoding"""
+        with open(os.path.join(self.temp_dir, 'requirements.txt'), 'w') as f:
+            f.write('flask==3.0.0')
+        with open(os.path.join(self.temp_dir, 'legacy.py'), 'wb') as f:
+            f.write(b'# caf\xe9 in latin-1\n')
+        with open(os.path.join(self.temp_dir, 'app.py'), 'w') as f:
+            f.write('from flask import Flask')
+        
+        config = ProjectConfig(self.temp_dir)
+        self.assertEqual(config.config['project_type'], 'flask')
+    
     def test_save_and_load_config(self):
         """Test saving and loading configuration"""
         config = ProjectConfig(self.temp_dir)
@@ -94,6 +106,10 @@ class TestProjectConfig(TestCase):
         self.assertEqual(config2.config['project_name'], 'TestProject')
         self.assertEqual(config2.config['project_type'], 'nextjs')
         self.assertEqual(config2.get_default_mode(), 'event')
+        
+        # Non-ASCII values survive the round trip as UTF-8
+        config.update_config({'project_name': 'Café'})
+        self.assertEqual(ProjectConfig(self.temp_dir).config['project_name'], 'Café')
     
     def test_path_methods(self):
         """Test path getter methods"""
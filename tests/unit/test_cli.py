@@ -7,7 +7,9 @@ import sys
 import json
 import tempfile
 import shutil
-from unittest import TestCase, mock
+import threading
+from importlib.util import find_spec
+from unittest import TestCase, mock, skipUnless
 from click.testing import CliRunner
 from pathlib import Path
 
@@ -17,6 +19,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 from multi_agent_framework.cli import cli, _get_recommended_agents
 from multi_agent_framework.core.project_config import ProjectConfig
 
+WATCHDOG_AVAILABLE = find_spec('watchdog') is not None
+
 
 class TestCLI(TestCase):
     """Test CLI commands"""
@@ -43,7 +47,98 @@ class TestCLI(TestCase):
         self.assertEqual(result.exit_code, 0)
         self.assertIn('Multi-Agent Framework', result.output)
         self.assertIn('Commands:', result.output)
-        
+
+    def test_cli_help_does_not_load_commands(self):
+        """Test --help lists commands without importing them or the agents they create"""
+        import subprocess
+        script = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from multi_agent_framework.cli import cli\n"
+            "result = CliRunner().invoke(cli, ['--help'])\n"
+            "assert 'trigger' in result.output, result.output\n"
+            "print(sorted(m for m in sys.modules if m.startswith('multi_agent_framework.')))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        output = subprocess.run([sys.executable, '-c', script], cwd=root,
+                                capture_output=True, text=True, check=True).stdout
+
+        self.assertNotIn('cli_cmds.launch', output)
+        self.assertNotIn('core.agent_factory', output)
+        self.assertNotIn('core.project_config', output)
+
+    def test_cli_completion_does_not_load_commands(self):
+        """Test shell completion of subcommand names doesn't import them"""
+        import subprocess
+        script = (
+            "import sys\n"
+            "from multi_agent_framework.cli import cli\n"
+            "from click.shell_completion import ShellComplete\n"
+            "items = ShellComplete(cli, {}, 'maf', '_MAF_COMPLETE').get_completions([], 'st')\n"
+            "print([(item.value, item.help) for item in items])\n"
+            "print(sorted(m for m in sys.modules if m.startswith('multi_agent_framework.')))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        output = subprocess.run([sys.executable, '-c', script], cwd=root,
+                                capture_output=True, text=True, check=True).stdout
+
+        self.assertIn("('status', 'Check the status of the multi-agent framework.')", output)
+        self.assertNotIn("'trigger'", output)
+        self.assertNotIn('cli_cmds.status', output)
+
+    def test_main_version_does_not_import_click(self):
+        """Test 'maf --version' prints click's version line without importing click"""
+        import subprocess
+        script = (
+            "import sys\n"
+            "sys.argv = ['maf', '--version']\n"
+            "from multi_agent_framework.cli import main\n"
+            "main()\n"
+            "print('click' in sys.modules)\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        output = subprocess.run([sys.executable, '-c', script], cwd=root,
+                                capture_output=True, text=True, check=True).stdout
+
+        self.assertEqual(output, self.runner.invoke(cli, ['--version']).output + 'False\n')
+
+    def test_cli_help_under_optimize(self):
+        """Test help text survives python -OO, which strips docstrings"""
+        import subprocess
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        for args in ([], ['launch']):
+            output = subprocess.run(
+                [sys.executable, '-OO', '-m', 'multi_agent_framework.cli'] + args + ['--help'],
+                cwd=root, capture_output=True, text=True, check=True).stdout
+            self.assertIn('Launch the multi-agent framework.', output)
+        self.assertIn('Run the agents in the background', output)
+
+    def test_main_only_resolves_requested_command(self):
+        """Test main() restricts the group to the sniffed subcommand for one run"""
+        from multi_agent_framework import cli as cli_module
+
+        seen = {}
+
+        def fake_cli():
+            seen.update(cli_module.cli._lazy)
+
+        with mock.patch('sys.argv', ['maf', 'modes']), mock.patch.object(cli_module.cli, 'main', side_effect=fake_cli):
+            cli_module.main()
+
+        self.assertEqual(list(seen), ['modes'])
+        self.assertEqual(cli_module.cli._lazy, cli_module._LAZY_COMMANDS)
+        self.assertEqual(cli_module._sniff_subcommand(['maf', '--help']), None)
+        self.assertEqual(cli_module._sniff_subcommand(['maf', 'status', '-p', 'path']), 'status')
+        # A subcommand after a group option leaves every command loadable
+        self.assertIsNone(cli_module._sniff_subcommand(['maf', '--help', 'launch']))
+        self.assertIsNone(cli_module._sniff_subcommand(['maf', '-p', 'path', 'status']))
+
+        with mock.patch('sys.argv', ['maf', '--help', 'modes']), \
+             mock.patch.object(cli_module.cli, 'main', side_effect=fake_cli):
+            seen.clear()
+            cli_module.main()
+        self.assertEqual(seen, cli_module._LAZY_COMMANDS)
+
     def test_init_command(self):
         """Test init command"""
         with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
@@ -82,17 +177,13 @@ class TestCLI(TestCase):
         self.assertNotEqual(result.exit_code, 0)
         self.assertIn('Error:', result.output)
         
-    @mock.patch('multi_agent_framework.cli.create_agent')
-    @mock.patch('threading.Thread')
-    def test_launch_command(self, mock_thread, mock_create_agent):
+    @mock.patch('multi_agent_framework.core.agent_factory.create_agent')
+    @mock.patch('multi_agent_framework.cli_cmds.launch.threading')
+    def test_launch_command(self, mock_threading, mock_create_agent):
         """Test launch command"""
-        # Mock thread to prevent actual thread creation
-        mock_thread_instance = mock.Mock()
-        mock_thread.return_value = mock_thread_instance
-        
-        # Mock agent creation
-        mock_agent = mock.Mock()
-        mock_create_agent.return_value = mock_agent
+        # Mock only the agent threads, so the pool that builds the agents runs
+        mock_thread = mock_threading.Thread
+        mock_thread.return_value = mock.Mock()
         
         with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
             # Initialize first
@@ -103,19 +194,122 @@ class TestCLI(TestCase):
                 f.write('GEMINI_API_KEY=test_key\n')
             
             # Test basic launch with immediate exit
-            with mock.patch('time.sleep', side_effect=KeyboardInterrupt):
-                result = self.runner.invoke(cli, ['launch'])
+            with mock.patch('multi_agent_framework.cli_cmds.launch._wait_for_shutdown'):
+                result = self.runner.invoke(cli, ['launch', '--agents', 'orchestrator'])
             
             # Should have attempted to launch
             self.assertIn('Launching', result.output)
-            # Thread should have been created but not actually started
-            mock_thread.assert_called()
+            # Polling agents share this process's state manager, so they are
+            # built here and run on threads
+            mock_create_agent.assert_called_once_with(
+                'orchestrator', mode='polling', project_config=mock.ANY)
+            mock_thread.assert_called_once_with(
+                target=mock_create_agent.return_value.run, daemon=True)
+            mock_thread.return_value.start.assert_called_once()
+            # and, having no stop(), are left to end with the process
+            mock_create_agent.return_value.stop.assert_not_called()
+            
+    @mock.patch('subprocess.Popen')
+    def test_launch_detach(self, mock_popen):
+        """Test launch --detach starts a background launch and records its PID"""
+        mock_popen.return_value.pid = os.getpid()
+        
+        with self.runner.isolated_filesystem(temp_dir=self.temp_dir), \
+             mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('MAF_LAUNCH_CHILD', None)
+            self.runner.invoke(cli, ['init'])
+            with open('.env', 'w') as f:
+                f.write('GEMINI_API_KEY=test_key\n')
+            
+            result = self.runner.invoke(cli, ['launch', '--detach', '--agents', 'orchestrator'])
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn(f'PID {os.getpid()}', result.output)
+            
+            command = mock_popen.call_args[0][0]
+            self.assertEqual(command[-2:], ['--agents', 'orchestrator'])
+            _, kwargs = mock_popen.call_args
+            self.assertTrue(kwargs['start_new_session'])
+            self.assertEqual(kwargs['env']['MAF_LAUNCH_CHILD'], '1')
+            with open(os.path.join('.maf', 'maf.pid')) as f:
+                self.assertEqual(f.read(), str(os.getpid()))
             
-    @mock.patch('multi_agent_framework.cli.create_agent')
-    @mock.patch('threading.Thread')
-    def test_launch_with_mode(self, mock_thread, mock_create_agent):
+            # status finds the background launch through the PID file
+            result = self.runner.invoke(cli, ['status'])
+            self.assertIn(f'running in the background (PID {os.getpid()})', result.output)
+    
+    @mock.patch('subprocess.Popen')
+    @mock.patch('multi_agent_framework.core.agent_factory.create_agent')
+    def test_launch_detach_in_child_runs_agents(self, mock_create_agent, mock_popen):
+        """Test the detached launch runs the agents itself and removes its PID file"""
+        
+        with self.runner.isolated_filesystem(temp_dir=self.temp_dir), \
+             mock.patch.dict(os.environ, {'MAF_LAUNCH_CHILD': '1'}):
+            self.runner.invoke(cli, ['init'])
+            with open('.env', 'w') as f:
+                f.write('GEMINI_API_KEY=test_key\n')
+            os.makedirs('.maf', exist_ok=True)
+            with open(os.path.join('.maf', 'maf.pid'), 'w') as f:
+                f.write(str(os.getpid()))
+            
+            with mock.patch('multi_agent_framework.cli_cmds.launch._wait_for_shutdown'):
+                result = self.runner.invoke(cli, ['launch', '--detach', '--agents', 'orchestrator'])
+            
+            self.assertEqual(result.exit_code, 0)
+            mock_popen.assert_not_called()
+            mock_create_agent.return_value.run.assert_called()
+            self.assertFalse(os.path.exists(os.path.join('.maf', 'maf.pid')))
+    
+    @mock.patch('subprocess.Popen')
+    @mock.patch('multi_agent_framework.core.agent_factory.create_agent')
+    def test_launch_detach_without_orchestrator(self, mock_create_agent, mock_popen):
+        """Test a declined orchestrator prompt is not asked again in the detached launch"""
+        mock_popen.return_value.pid = os.getpid()
+        
+        with self.runner.isolated_filesystem(temp_dir=self.temp_dir), \
+             mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('MAF_LAUNCH_CHILD', None)
+            self.runner.invoke(cli, ['init'])
+            with open('.env', 'w') as f:
+                f.write('GEMINI_API_KEY=test_key\n')
+            
+            result = self.runner.invoke(cli, ['launch', '--detach', '--agents', 'frontend'],
+                                        input='n\n')
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('Add orchestrator', result.output)
+            command = mock_popen.call_args[0][0]
+            self.assertNotIn('orchestrator', command)
+            
+            # The background launch reads stdin from /dev/null and must not prompt
+            os.environ['MAF_LAUNCH_CHILD'] = '1'
+            with mock.patch('multi_agent_framework.cli_cmds.launch._wait_for_shutdown'):
+                result = self.runner.invoke(cli, command[command.index('launch'):])
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertNotIn('Add orchestrator', result.output)
+            self.assertNotIn('Aborted', result.output)
+            mock_create_agent.assert_called_once_with(
+                'frontend', mode='polling', project_config=mock.ANY)
+    
+    def test_wait_for_shutdown_returns_on_sigint(self):
+        """Test launch blocks until SIGINT and then restores the previous handler"""
+        import signal
+        import threading
+        from multi_agent_framework.cli_cmds.launch import _wait_for_shutdown
+        
+        previous_handler = signal.getsignal(signal.SIGINT)
+        timer = threading.Timer(0.1, os.kill, args=(os.getpid(), signal.SIGINT))
+        timer.start()
+        _wait_for_shutdown()
+        timer.join()
+        
+        self.assertIs(signal.getsignal(signal.SIGINT), previous_handler)
+            
+    @mock.patch('multi_agent_framework.core.agent_factory.create_agent')
+    @mock.patch('multi_agent_framework.cli_cmds.launch.threading')
+    def test_launch_with_mode(self, mock_threading, mock_create_agent):
         """Test launch with mode option"""
-        # Mock to prevent actual execution
+        # Mock to prevent actual execution; only the agent threads, so the
+        # pool that builds the agents still runs
+        mock_thread = mock_threading.Thread
         mock_thread.return_value = mock.Mock()
         mock_create_agent.return_value = mock.Mock()
         
@@ -127,22 +321,25 @@ class TestCLI(TestCase):
                 f.write('GEMINI_API_KEY=test_key\n')
             
             # Test polling mode
-            with mock.patch('time.sleep', side_effect=KeyboardInterrupt):
+            with mock.patch('multi_agent_framework.cli_cmds.launch._wait_for_shutdown'):
                 result = self.runner.invoke(cli, ['launch', '--mode', 'polling'])
             self.assertIn('mode: polling', result.output.lower())
+            mock_thread.assert_called()
+            self.assertEqual({c.kwargs['mode'] for c in mock_create_agent.call_args_list}, {'polling'})
+            mock_create_agent.reset_mock()
             
             # Test event mode (note: corrected from 'event-driven')
-            with mock.patch('time.sleep', side_effect=KeyboardInterrupt):
+            with mock.patch('multi_agent_framework.cli_cmds.launch._wait_for_shutdown'):
                 result = self.runner.invoke(cli, ['launch', '--mode', 'event'])
             self.assertIn('mode: event', result.output.lower())
+            self.assertEqual({c.kwargs['mode'] for c in mock_create_agent.call_args_list}, {'event_driven'})
+            # and are asked to stop cooperatively on shutdown
+            mock_create_agent.return_value.stop.assert_called()
+            mock_thread.return_value.join.assert_called()
             
-    @mock.patch('multi_agent_framework.cli.create_agent')
-    @mock.patch('threading.Thread')
-    def test_launch_with_agents(self, mock_thread, mock_create_agent):
+    @mock.patch('multi_agent_framework.core.agent_factory.create_agent')
+    def test_launch_with_agents(self, mock_create_agent):
         """Test launch with specific agents"""
-        # Mock to prevent actual execution
-        mock_thread.return_value = mock.Mock()
-        mock_create_agent.return_value = mock.Mock()
         
         with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
             self.runner.invoke(cli, ['init'])
@@ -151,7 +348,7 @@ class TestCLI(TestCase):
             with open('.env', 'w') as f:
                 f.write('GEMINI_API_KEY=test_key\n')
             
-            with mock.patch('time.sleep', side_effect=KeyboardInterrupt):
+            with mock.patch('multi_agent_framework.cli_cmds.launch._wait_for_shutdown'):
                 result = self.runner.invoke(cli, ['launch', '--agents', 'orchestrator', '--agents', 'frontend_agent'])
             
             self.assertIn('orchestrator', result.output)
@@ -164,7 +361,15 @@ class TestCLI(TestCase):
             # Should fail because no .env file
             self.assertNotEqual(result.exit_code, 0)
             self.assertIn('file not found', result.output.lower())
-            
+
+    @mock.patch('multi_agent_framework.cli_cmds.launch.get_project_config')
+    def test_launch_without_env_skips_config(self, mock_get_config):
+        """Test launch exits on a missing .env before loading the project config"""
+        with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
+            result = self.runner.invoke(cli, ['launch'])
+            self.assertNotEqual(result.exit_code, 0)
+            mock_get_config.assert_not_called()
+
     def test_trigger_command(self):
         """Test trigger command"""
         with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
@@ -174,12 +379,85 @@ class TestCLI(TestCase):
             result = self.runner.invoke(cli, ['trigger', 'Create a login form'])
             # Should succeed but message about configuration
             self.assertIn('Feature request', result.output)
-            
+
+            with open('.maf/message_queues/orchestrator_inbox.json') as f:
+                message = json.load(f)[-1]
+            self.assertEqual(message['content'], 'Create a login form')
+            self.assertEqual((message['sender'], message['recipient'], message['type']),
+                             ('cli', 'orchestrator', 'new_feature'))
+            self.assertIn('timestamp', message)
+
     def test_trigger_without_description(self):
         """Test trigger without description"""
         result = self.runner.invoke(cli, ['trigger'])
         self.assertNotEqual(result.exit_code, 0)
         
+    @mock.patch('multi_agent_framework.core.progress_tracker.get_progress_tracker')
+    def test_trigger_wait_until_complete(self, mock_get_tracker):
+        """Test trigger --wait stops once the feature reaches 100%"""
+        mock_get_tracker.return_value.get_latest_progress.side_effect = [40, 100]
+        with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
+            self.runner.invoke(cli, ['init'])
+
+            with mock.patch('multi_agent_framework.cli_cmds.trigger._StateFileWatcher.wait',
+                            return_value=True) as mock_wait:
+                result = self.runner.invoke(cli, ['trigger', 'Add login', '--wait'])
+
+            self.assertEqual(result.exit_code, 0)
+            self.assertEqual(mock_wait.call_count, 1)
+            self.assertNotIn('No progress detected', result.output)
+
+    @mock.patch('multi_agent_framework.core.progress_tracker.get_progress_tracker')
+    def test_trigger_wait_times_out_without_progress(self, mock_get_tracker):
+        """Test trigger --wait gives up once an existing feature stops progressing"""
+        import itertools
+        # No feature for two idle waits, then one that never moves past 30%
+        mock_get_tracker.return_value.get_latest_progress.side_effect = itertools.chain(
+            [None, None], itertools.repeat(30))
+        with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
+            self.runner.invoke(cli, ['init'])
+
+            with mock.patch('multi_agent_framework.cli_cmds.trigger._StateFileWatcher.wait',
+                            return_value=False) as mock_wait:
+                result = self.runner.invoke(cli, ['trigger', 'Add login', '--wait'])
+
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('No progress detected', result.output)
+            # Waiting for the feature to appear didn't count towards the timeout
+            self.assertEqual(mock_wait.call_count, 3)
+
+    def _assert_state_file_watcher_wakes_on_write(self, watcher):
+        """Check the watcher times out while idle and wakes on a write"""
+        try:
+            self.assertFalse(watcher.wait(0.1))
+            with open(watcher.state_file, 'w') as f:
+                f.write('{}')
+            self.assertTrue(watcher.wait(5))
+        finally:
+            watcher.stop()
+
+    def test_state_file_watcher_polls_mtime_without_watchdog(self):
+        """Test the state file watcher falls back to mtime polling"""
+        from multi_agent_framework.cli_cmds.trigger import _StateFileWatcher
+
+        os.makedirs(os.path.join(self.temp_dir, '.maf'))
+        watcher = _StateFileWatcher(os.path.join(self.temp_dir, '.maf', 'state.json'))
+        with mock.patch.dict(sys.modules, {'watchdog.events': None, 'watchdog.observers': None}):
+            watcher.start()
+        self.assertIsNone(watcher._observer)
+        self._assert_state_file_watcher_wakes_on_write(watcher)
+
+    @skipUnless(WATCHDOG_AVAILABLE, "watchdog not installed")
+    def test_state_file_watcher_wakes_on_write(self):
+        """Test the state file watcher reports writes from watchdog events"""
+        from multi_agent_framework.cli_cmds.trigger import _StateFileWatcher
+
+        os.makedirs(os.path.join(self.temp_dir, '.maf'))
+        watcher = _StateFileWatcher(os.path.join(self.temp_dir, '.maf', 'state.json'))
+        watcher.start()
+        self.assertIsNotNone(watcher._observer)
+        self._assert_state_file_watcher_wakes_on_write(watcher)
+
     def test_status_command(self):
         """Test status command"""
         with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
@@ -200,7 +478,22 @@ class TestCLI(TestCase):
             # # Verify it's valid JSON
             # if result.output.strip():
             #     json.loads(result.output)
-            
+
+    def test_project_config_is_reused_until_changed(self):
+        """Test that commands share one ProjectConfig until the config file changes"""
+        from multi_agent_framework.cli_cmds.common import get_project_config
+
+        ProjectConfig.initialize_project(self.temp_dir)
+        config = get_project_config(self.temp_dir)
+        self.assertIs(get_project_config(os.path.join(self.temp_dir, '.')), config)
+
+        config.config['project_name'] = 'Renamed'
+        config.save_config()
+        os.utime(config.config_path, ns=(0, 0))
+        reloaded = get_project_config(self.temp_dir)
+        self.assertIsNot(reloaded, config)
+        self.assertEqual(reloaded.config['project_name'], 'Renamed')
+
     def test_reset_command(self):
         """Test reset command"""
         with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
@@ -215,7 +508,42 @@ class TestCLI(TestCase):
             result = self.runner.invoke(cli, ['reset', '--yes'])
             self.assertEqual(result.exit_code, 0)
             self.assertIn('reset successfully', result.output.lower())
-            
+
+    def test_reset_clears_logs(self):
+        """Test reset renames the logs aside and has deleted them before it returns"""
+        with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
+            self.runner.invoke(cli, ['init'])
+            os.makedirs('.maf/logs/archive', exist_ok=True)
+            for i in range(20):
+                with open(f'.maf/logs/archive/agent.log.{i}', 'w') as f:
+                    f.write('log line\n')
+
+            # Trash left behind by an earlier reset that exited mid-delete
+            os.makedirs('.maf/.logs.trash.old/logs')
+
+            with mock.patch('os.rename', wraps=os.rename) as mock_rename:
+                result = self.runner.invoke(cli, ['reset', '--yes'])
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn('Cleared logs', result.output)
+            self.assertEqual(os.listdir('.maf/logs'), [])
+            # Renamed within .maf, so it never crosses a filesystem boundary
+            trash_dir = mock_rename.call_args[0][1]
+            self.assertEqual(os.path.dirname(os.path.dirname(trash_dir)),
+                             os.path.abspath('.maf'))
+
+            # The old logs and earlier trash are gone by the time reset returns
+            self.assertEqual(sorted(os.listdir('.maf')), ['logs', 'message_queues'])
+            self.assertFalse(any(thread.name.startswith('maf-reset-cleanup')
+                                 for thread in threading.enumerate()))
+
+            # Rename refused: logs are deleted in place
+            with open('.maf/logs/agent.log', 'w') as f:
+                f.write('log line\n')
+            with mock.patch('os.rename', side_effect=OSError(18, 'Invalid cross-device link')):
+                result = self.runner.invoke(cli, ['reset', '--yes'])
+            self.assertEqual(result.exit_code, 0)
+            self.assertEqual(os.listdir('.maf/logs'), [])
+
     def test_reset_without_confirmation(self):
         """Test reset without confirmation"""
         with self.runner.isolated_filesystem(temp_dir=self.temp_dir):
@@ -264,7 +592,32 @@ class TestCLI(TestCase):
                 with open('.maf-config.json') as f:
                     config = json.load(f)
                     self.assertEqual(config['agent_config']['enabled_agents'], ["orchestrator", "frontend_agent"])
-                
+
+    def test_config_save_and_load(self):
+        """Test config --save/--load round trip with and without orjson"""
+        from multi_agent_framework.cli_cmds import config as config_module
+
+        for use_orjson in {False, config_module.ORJSON_AVAILABLE}:
+            with self.subTest(orjson=use_orjson), \
+                 mock.patch.object(config_module, 'ORJSON_AVAILABLE', use_orjson), \
+                 self.runner.isolated_filesystem(temp_dir=self.temp_dir):
+                self.runner.invoke(cli, ['init', '--name', 'Café'])
+
+                result = self.runner.invoke(cli, ['config', '--save', 'saved.json'])
+                self.assertEqual(result.exit_code, 0)
+                with open('saved.json', encoding='utf-8') as f:
+                    saved = json.load(f)
+                self.assertEqual(saved['project_name'], 'Café')
+
+                saved['project_type'] = 'flask'
+                with open('saved.json', 'w', encoding='utf-8') as f:
+                    json.dump(saved, f)
+                result = self.runner.invoke(cli, ['config', '--load', 'saved.json'])
+                self.assertEqual(result.exit_code, 0)
+
+                result = self.runner.invoke(cli, ['config'])
+                self.assertIn('"project_type": "flask"', result.output)
+
     def test_command_help(self):
         """Test help for each command"""
         commands = ['init', 'launch', 'trigger', 'status', 'reset', 'config']
@@ -7,12 +7,12 @@ import sys
 import time
 import tempfile
 import shutil
-from unittest import TestCase
+from unittest import TestCase, mock
 from click.testing import CliRunner
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from multi_agent_framework.core.progress_tracker import ProgressTracker
+from multi_agent_framework.core.progress_tracker import ProgressTracker, get_progress_tracker
 
 
 class TestProgressTracker(TestCase):
@@ -152,6 +152,45 @@ class TestProgressTracker(TestCase):
         self.assertEqual(active, 2)  # pending + in_progress
         self.assertEqual(total, 3)
         
+    def test_get_all_features_reads_state_once(self):
+        """Test listing features parses the state file once, not once per feature"""
+        self.tracker.create_feature("feat-1", "Feature 1")
+        self.tracker.create_feature("feat-2", "Feature 2")
+        self.tracker.create_task("task-1", "feat-2", "Task 1", "backend_agent")
+        
+        with mock.patch.object(self.tracker, '_load_state', wraps=self.tracker._load_state) as mock_load:
+            features = self.tracker.get_all_features()
+        
+        mock_load.assert_called_once_with()
+        tasks = {f['feature']['id']: [t['id'] for t in f['tasks']] for f in features}
+        self.assertEqual(tasks, {"feat-1": [], "feat-2": ["task-1"]})
+        
+    def test_get_latest_progress(self):
+        """Test latest progress follows the most recently created feature"""
+        self.assertIsNone(self.tracker.get_latest_progress())
+        
+        self.tracker.create_feature("feat-1", "Feature 1")
+        self.tracker.create_feature("feat-2", "Feature 2")
+        self.tracker.create_task("task-1", "feat-2", "Task 1", "backend_agent")
+        self.tracker.update_task_status("task-1", "in_progress", 40)
+        
+        latest = self.tracker.get_all_features()[0]['feature']['progress']
+        self.assertEqual(self.tracker.get_latest_progress(), latest)
+        
+    def test_state_round_trip_with_and_without_orjson(self):
+        """Test the state file written with either JSON backend reads back with both"""
+        from multi_agent_framework.core import progress_tracker as tracker_module
+        
+        backends = sorted({False, tracker_module.ORJSON_AVAILABLE})
+        for writer in backends:
+            with mock.patch.object(tracker_module, 'ORJSON_AVAILABLE', writer):
+                self.tracker.create_feature(f"feat-{writer}", "Ünïcode feature")
+            for reader in backends:
+                with self.subTest(writer=writer, reader=reader), \
+                     mock.patch.object(tracker_module, 'ORJSON_AVAILABLE', reader):
+                    feature = self.tracker.get_feature_progress(f"feat-{writer}")
+                    self.assertEqual(feature['feature']['description'], "Ünïcode feature")
+        
     def test_display_progress_cli(self):
         """Test progress display output"""
         # Setup some features and tasks
@@ -175,6 +214,15 @@ class TestProgressTracker(TestCase):
             # This should work without errors
             tracker.display_progress(detailed=True)
 
+    def test_get_progress_tracker_per_state_file(self):
+        """Test the shared tracker is reused per state file, not across them"""
+        tracker = get_progress_tracker(self.state_file)
+        self.assertIs(get_progress_tracker(os.path.join(self.temp_dir, ".", "test_state.json")), tracker)
+        
+        other = get_progress_tracker(os.path.join(self.temp_dir, "other_state.json"))
+        self.assertIsNot(other, tracker)
+        self.assertEqual(str(other.state_file), os.path.join(self.temp_dir, "other_state.json"))
+
 
 if __name__ == '__main__':
     import unittest